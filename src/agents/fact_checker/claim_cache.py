@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+"""
+ClaimCache - Reuse verifications of claims repeated across articles
+
+Syndicated articles repeat the same claims almost word for word. Claims are
+normalized (case, quotes, punctuation, number formatting) and a verified
+claim is reused for a new one that is identical after normalization, or
+that differs only in filler words, within the freshness window.
+
+Similar wording is not enough when the facts differ: "42% of voters" and
+"24% of voters", "rose by 3%" and "fell by 3%", "effective" and
+"ineffective" are all nearly identical texts. Numbers (with their sign,
+currency, unit or scale word) and negations are therefore anchors that must
+match exactly, and claims are only compared with claims of the same anchors,
+preset and knowledge base. A MinHash candidate is then only reused if its
+content words are the same words in the same order, ignoring a small set of
+stopwords and synonyms.
+"""
+
+import hashlib
+import re
+import time
+from typing import Any, Optional
+
+from src.agents.news_aggregator.minhash import normalize_text
+from src.agents.trend_analyzer.novelty_index import NoveltyIndex
+from src.core.logging import get_logger
+
+from .fact_check_store import FactCheckStore
+
+_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+
+_CURRENCY = "$€£¥"
+
+_NUMBER = re.compile(
+    rf"[{_CURRENCY}]?-?\d+(?:\.\d+)?%?(?: (?:hundred|thousand|million|billion|trillion))?"
+)
+_NEGATION = re.compile(r"\b(?:not|no|never|none|nor|neither|without)\b|n't\b")
+
+# Words that may differ between two claims reused for each other
+_STOPWORDS = frozenset(
+    "a an the this that these those is are was were be been being has have had will would "
+    "of in on at to for by from with as and also its their his her it they he she "
+    "said says reported according".split()
+)
+_SYNONYMS = {
+    "pct": "%",
+    "usa": "us",
+    "approximately": "about",
+    "approx": "about",
+    "around": "about",
+    "roughly": "about",
+    "nearly": "almost",
+}
+
+
+def normalize_claim(text: Optional[str]) -> str:
+    """
+    Normalize a claim for matching
+
+    Args:
+        text: Claim text
+
+    Returns:
+        Lowercased text with unified quotes, thousands separators removed,
+        "percent" written as %, and punctuation dropped except a minus sign
+        or currency symbol in front of a number (currency symbol first)
+    """
+    text = normalize_text((text or "").translate(_QUOTES))
+    text = re.sub(r"(?<=\d),(?=\d{3}\b)", "", text)
+    text = re.sub(r"\s*\b(?:per ?cent|percent)\b", "%", text)
+    text = re.sub(rf"(?<!\w)[−–](?=[{_CURRENCY}]?\d)", "-", text)
+    text = re.sub(rf"([{_CURRENCY}])\s+(?=-?\d)", r"\1", text)
+    # "-$5" and "$-5" are the same amount
+    text = re.sub(rf"(?<!\w)-([{_CURRENCY}])(?=\d)", r"\1-", text)
+    text = re.sub(rf"[^\w%.'\s{_CURRENCY}-]", " ", text)
+    # A minus sign survives only directly in front of a number ("-3%", not "covid-19")
+    text = re.sub(r"(?<=\w)-|-(?!\d)", " ", text)
+    text = re.sub(rf"[{_CURRENCY}](?!-?\d)", " ", text)
+    text = re.sub(r"(?<!\d)\.|\.(?!\d)", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def content_words(normalized: str) -> list[str]:
+    """
+    Get the words of a normalized claim that carry its meaning
+
+    Args:
+        normalized: Claim from normalize_claim()
+
+    Returns:
+        Words in order, stopwords dropped and synonyms unified
+    """
+    return [_SYNONYMS.get(word, word) for word in normalized.split() if word not in _STOPWORDS]
+
+
+def claim_anchors(normalized: str) -> str:
+    """
+    Get the parts of a normalized claim that must match exactly
+
+    Args:
+        normalized: Claim from normalize_claim()
+
+    Returns:
+        Sorted numbers, plus "not" if the claim has an odd number of negations
+    """
+    anchors = sorted(set(_NUMBER.findall(normalized)))
+    if len(_NEGATION.findall(normalized)) % 2:
+        anchors.append("not")
+    return "|".join(anchors)
+
+
+def claim_hash(normalized: str) -> str:
+    """
+    Hash a normalized claim
+
+    Args:
+        normalized: Claim from normalize_claim()
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:32]
+
+
+class ClaimCache:
+    """Verified claims of the freshness window, matched exactly or by MinHash similarity"""
+
+    def __init__(self, store: FactCheckStore, config: Optional[dict[str, Any]] = None):
+        """
+        Initialize claim cache
+
+        Args:
+            store: Store holding the claim verifications
+            config: fact_check.claim_cache config (freshness_hours,
+                similarity_threshold, num_perm, bands, shingle_size)
+        """
+        config = config or {}
+        self.store = store
+        self.freshness_seconds = config.get("freshness_hours", 72) * 3600
+        self.similarity_threshold = config.get("similarity_threshold", 0.95)
+        self.logger = get_logger(name="fact_check_pipeline")
+
+        # One LSH group per (preset, knowledge base, anchors), built from the store on first use
+        self.index = NoveltyIndex.from_config(config, lookback_days=self.freshness_seconds / 86400)
+        self._loaded = False
+
+    @staticmethod
+    def _group(preset: str, kb_name: Optional[str], anchors: str) -> str:
+        """LSH group of a claim: only claims of the same group are compared"""
+        return "\x1f".join((preset, kb_name or "", anchors))
+
+    def _load(self) -> None:
+        """Index the claims verified within the freshness window"""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        rows = self.store.claim_signatures_since(time.time() - self.freshness_seconds)
+        for verification_id, normalized, anchors, preset, kb_name, verified_ts in rows:
+            self.index.add(
+                str(verification_id), self._group(preset, kb_name, anchors), verified_ts,
+                self.index.signature(normalized)
+            )
+
+        self.logger.info(f"Claim cache loaded {len(self.index)} verified claims")
+
+    def lookup(self, claim_text: str, preset: str, kb_name: Optional[str]) -> Optional[dict[str, Any]]:
+        """
+        Find a fresh verification of the same or a near-duplicate claim
+
+        Args:
+            claim_text: Claim to verify
+            preset: Fact-check preset
+            kb_name: Knowledge base used for RAG search
+
+        Returns:
+            Stored verification (see FactCheckStore.get_claim_verification())
+            with match ("exact" or "similar") and similarity, or None
+        """
+        normalized = normalize_claim(claim_text)
+        if not normalized:
+            return None
+
+        now = time.time()
+
+        exact = self.store.find_claim_verification(
+            claim_hash(normalized), preset, kb_name, now - self.freshness_seconds
+        )
+        if exact is not None:
+            return {**exact, "match": "exact", "similarity": 1.0}
+
+        self._load()
+
+        candidates = self.index.similar(
+            self._group(preset, kb_name, claim_anchors(normalized)),
+            now,
+            self.index.signature(normalized),
+            min_similarity=self.similarity_threshold
+        )
+        words = content_words(normalized)
+
+        for similarity, key in candidates:
+            stored = self.store.get_claim_verification(int(key))
+
+            # Shingle similarity cannot tell "rose" from "fell": any other content word rejects the match
+            if stored is None or content_words(stored["normalized"]) != words:
+                continue
+
+            return {**stored, "match": "similar", "similarity": round(similarity, 2)}
+
+        return None
+
+    def add(
+        self,
+        claim_text: str,
+        preset: str,
+        kb_name: Optional[str],
+        verification: dict[str, Any],
+        evidence: list[dict[str, Any]],
+        credibility_score: float,
+        verify_seconds: float
+    ) -> None:
+        """
+        Store a claim verification for reuse
+
+        Args:
+            claim_text: Verified claim
+            preset: Fact-check preset
+            kb_name: Knowledge base used for RAG search
+            verification: Verification result
+            evidence: Evidence the verdict is based on
+            credibility_score: Credibility score of the verification
+            verify_seconds: Time spent gathering evidence and verifying
+        """
+        normalized = normalize_claim(claim_text)
+        if not normalized:
+            return
+
+        anchors = claim_anchors(normalized)
+        verification_id, verified_ts = self.store.save_claim_verification(
+            claim_hash(normalized), normalized, anchors, preset, kb_name, claim_text,
+            verification, evidence, credibility_score, verify_seconds
+        )
+
+        if self._loaded:
+            self.index.add(
+                str(verification_id), self._group(preset, kb_name, anchors), verified_ts,
+                self.index.signature(normalized)
+            )
@@ -7,6 +7,7 @@ Uses RAG, web search, and paper search to find supporting/contradicting evidence
 
 from pathlib import Path
 from typing import Any
+import asyncio
 import sys
 
 # Add project root to path for core imports
@@ -15,6 +16,7 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 from src.core.logging import get_logger
+from src.agents.fact_checker.fact_check_scheduler import Deadline, FactCheckScheduler
 from src.tools.rag_tool import RAGTool
 from src.tools.web_search import WebSearchTool
 from src.tools.paper_search_tool import PaperSearchTool
@@ -62,15 +64,23 @@ class EvidenceGatherAgent:
         self,
         claim: dict[str, Any],
         preset: str = "quick",
-        kb_name: str | None = None
+        kb_name: str | None = None,
+        scheduler: FactCheckScheduler | None = None,
+        deadline: Deadline | None = None
     ) -> dict[str, Any]:
         """
         Gather evidence for a claim using multiple sources
 
+        All enabled sources are searched concurrently. With a scheduler, each
+        search runs under its provider's concurrency limit and a source still
+        searching at the deadline is dropped and listed in timed_out_sources.
+
         Args:
             claim: Claim dictionary with 'claim' text
             preset: Verification preset (quick, thorough, deep)
             kb_name: Knowledge base name for RAG search
+            scheduler: Concurrency limits shared with other fact-check calls
+            deadline: Deadline of the fact-check
 
         Returns:
             Evidence dictionary with sources
@@ -89,24 +99,35 @@ class EvidenceGatherAgent:
 
         self.logger.info(f"Gathering evidence for claim: '{claim_text[:50]}...' (preset={preset})")
 
-        evidence_list = []
+        searches = {}
 
         # 1. RAG search (if enabled and tool available)
         if enable_rag and self.rag_tool and kb_name:
-            rag_evidence = await self._search_rag(claim_text, kb_name, max_sources)
-            evidence_list.extend(rag_evidence)
+            searches["rag"] = self._search_rag(claim_text, kb_name, max_sources)
 
         # 2. Web search (if enabled and tool available)
         if enable_web and self.web_search_tool:
-            web_evidence = await self._search_web(claim_text, max_sources)
-            evidence_list.extend(web_evidence)
+            searches["web"] = self._search_web(claim_text, max_sources)
 
         # 3. Paper search (if enabled and tool available)
         if enable_paper and self.paper_search_tool:
             claim_type = claim.get("type", "")
             if claim_type in ["scientific", "statistical"]:  # Only search papers for scientific claims
-                paper_evidence = await self._search_papers(claim_text, max_sources)
-                evidence_list.extend(paper_evidence)
+                searches["paper"] = self._search_papers(claim_text, max_sources)
+
+        found = await asyncio.gather(*[
+            self._run_search(source, search, scheduler, deadline)
+            for source, search in searches.items()
+        ])
+
+        evidence_list = []
+        timed_out_sources = []
+
+        for source, source_evidence in zip(searches, found):
+            if source_evidence is None:
+                timed_out_sources.append(source)
+            else:
+                evidence_list.extend(source_evidence)
 
         # Sort by relevance and limit
         evidence_list.sort(key=lambda x: x.get("relevance", 0), reverse=True)
@@ -118,9 +139,37 @@ class EvidenceGatherAgent:
             "claim": claim_text,
             "evidence": evidence_list,
             "total_sources": len(evidence_list),
+            "timed_out_sources": timed_out_sources,
             "preset": preset
         }
 
+    async def _run_search(
+        self,
+        source: str,
+        search,
+        scheduler: FactCheckScheduler | None,
+        deadline: Deadline | None
+    ) -> list[dict[str, Any]] | None:
+        """
+        Await one source search, through the scheduler if there is one
+
+        Args:
+            source: Provider name (rag, web, paper)
+            search: Search coroutine
+            scheduler: Concurrency limits, None to run directly
+            deadline: Deadline of the fact-check
+
+        Returns:
+            Evidence items, or None if the deadline cut the search off
+        """
+        if scheduler is None:
+            return await search
+
+        try:
+            return await scheduler.call(source, search, deadline)
+        except asyncio.TimeoutError:
+            return None
+
     async def _search_rag(self, claim: str, kb_name: str, max_results: int) -> list[dict[str, Any]]:
         """
         Search knowledge base using RAG
@@ -246,24 +295,27 @@ class EvidenceGatherAgent:
         self,
         claims: list[dict[str, Any]],
         preset: str = "quick",
-        kb_name: str | None = None
+        kb_name: str | None = None,
+        scheduler: FactCheckScheduler | None = None,
+        deadline: Deadline | None = None
     ) -> list[dict[str, Any]]:
         """
-        Gather evidence for multiple claims
+        Gather evidence for multiple claims concurrently
 
         Args:
             claims: List of claim dictionaries
             preset: Verification preset
             kb_name: Knowledge base name
+            scheduler: Concurrency limits shared with other fact-check calls
+            deadline: Deadline of the fact-check
 
         Returns:
-            List of evidence results
+            List of evidence results, in claim order
         """
-        results = []
-
-        for claim in claims:
-            evidence = await self.gather_evidence(claim, preset, kb_name)
-            results.append(evidence)
+        results = await asyncio.gather(*[
+            self.gather_evidence(claim, preset, kb_name, scheduler=scheduler, deadline=deadline)
+            for claim in claims
+        ])
 
         self.logger.info(f"Gathered evidence for {len(results)} claims")
         return results
@@ -2,12 +2,20 @@
 """
 FactCheckPipeline - Orchestrates the complete fact-checking workflow
 
-Coordinates claim extraction, evidence gathering, verification, and bias detection
+Coordinates claim extraction, evidence gathering, verification, and bias detection.
+Claims, evidence sources and batch articles are checked concurrently under the
+limits of a FactCheckScheduler, and the preset's timeout_seconds is a deadline:
+whatever is unfinished when it passes is reported as timed out. Results are
+kept in a FactCheckStore and reused while the article is unchanged, and each
+claim is verified once and reused for its repeats through a ClaimCache.
 """
 
 from typing import Any
 from pathlib import Path
+import asyncio
+import json
 import sys
+import time
 
 _project_root = Path(__file__).parent.parent.parent.parent
 if str(_project_root) not in sys.path:
@@ -21,11 +29,20 @@ from src.agents.fact_checker import (
     CredibilityScoreAgent,
     BiasDetectorAgent
 )
+from src.agents.fact_checker.fact_check_scheduler import Deadline, FactCheckScheduler
+from src.agents.fact_checker.fact_check_store import FactCheckStore, article_hash
+from src.agents.fact_checker.claim_cache import ClaimCache, claim_hash, normalize_claim
 
 
 class FactCheckPipeline:
     """Complete fact-checking pipeline"""
 
+    # Result stores and claim caches shared by all pipelines, keyed by database path
+    _stores: dict[str, FactCheckStore] = {}
+    _claim_caches: dict[str, ClaimCache] = {}
+    # Schedulers shared by all pipelines, keyed by concurrency config
+    _schedulers: dict[str, FactCheckScheduler] = {}
+
     def __init__(self, config: dict[str, Any], api_key: str, base_url: str):
         """
         Initialize fact-checking pipeline
@@ -45,29 +62,142 @@ class FactCheckPipeline:
         self.credibility_scorer = CredibilityScoreAgent(config)
         self.bias_detector = BiasDetectorAgent(config)
 
+        # Shared by every pipeline of the process, so the limits hold across requests
+        self.scheduler = self.get_scheduler(config)
+
+        results_config = config.get("fact_check", {}).get("results", {})
+        self.result_ttl = results_config.get("ttl_hours", 24) * 3600
+        self.keep_seconds = results_config.get("keep_days", 90) * 86400
+        self.store = self.get_store(config)
+
+        claim_cache_config = config.get("fact_check", {}).get("claim_cache", {})
+        self.claim_cache = None
+        if self.store is not None and claim_cache_config.get("enabled", True):
+            db_path = str(self.store.db_path)
+            if db_path not in FactCheckPipeline._claim_caches:
+                FactCheckPipeline._claim_caches[db_path] = ClaimCache(self.store, claim_cache_config)
+            self.claim_cache = FactCheckPipeline._claim_caches[db_path]
+
+        # Claims being verified right now, so identical claims wait instead of repeating the work
+        self._in_flight: dict[tuple[str, str, str], asyncio.Future] = {}
+
         self.logger.info("FactCheckPipeline initialized")
 
+    @classmethod
+    def get_store(cls, config: dict[str, Any]) -> FactCheckStore | None:
+        """
+        Get the result store configured by fact_check.results (opened once per process)
+
+        Args:
+            config: Complete configuration dictionary
+
+        Returns:
+            FactCheckStore, or None if result storage is disabled
+        """
+        results_config = config.get("fact_check", {}).get("results", {})
+        if not results_config.get("enabled", True):
+            return None
+
+        base_dir = config.get("news", {}).get("storage", {}).get("base_dir", "./data/news")
+        db_path = str(Path(results_config.get("database", Path(base_dir) / "fact_checks.db")))
+
+        if db_path not in cls._stores:
+            cls._stores[db_path] = FactCheckStore(Path(db_path))
+        return cls._stores[db_path]
+
+    @classmethod
+    def get_scheduler(cls, config: dict[str, Any]) -> FactCheckScheduler:
+        """
+        Get the scheduler configured by fact_check.concurrency (created once per process)
+
+        The scheduler rebinds its semaphores to whichever event loop uses it.
+
+        Args:
+            config: Complete configuration dictionary
+
+        Returns:
+            FactCheckScheduler
+        """
+        concurrency_config = config.get("fact_check", {}).get("concurrency") or {}
+        key = json.dumps(concurrency_config, sort_keys=True, default=str)
+
+        if key not in cls._schedulers:
+            cls._schedulers[key] = FactCheckScheduler(concurrency_config)
+        return cls._schedulers[key]
+
     async def fact_check_article(
         self,
         article: dict[str, Any],
         preset: str = "quick",
         max_claims: int = 5,
-        kb_name: str | None = None
+        kb_name: str | None = None,
+        use_cache: bool = True
     ) -> dict[str, Any]:
         """
         Perform complete fact-check on an article
 
+        A stored complete result for the same article text, preset, knowledge
+        base and claim limit is returned instead while it is younger than
+        fact_check.results.ttl_hours.
+
         Args:
             article: Article dictionary
             preset: Fact-check preset (quick/thorough/deep)
             max_claims: Maximum claims to extract and verify
             kb_name: Knowledge base for RAG search
+            use_cache: Reuse a stored result (False forces a new check)
+
+        Returns:
+            Complete fact-check results; "partial" is True if the preset's
+            time budget ran out before every step finished, "cached" is True
+            for a reused result
+        """
+        if self.store is None:
+            return await self._check_article(article, preset, max_claims, kb_name)
+
+        content_hash = article_hash(article)
+
+        if use_cache:
+            cached = self.store.get_result(
+                article.get("id"), content_hash, preset, kb_name, max_claims, self.result_ttl
+            )
+            if cached is not None:
+                self.logger.info(
+                    f"Reusing fact-check {cached['check_id']} from {cached['checked_at']} "
+                    f"for article: {article.get('title', '')[:50]}..."
+                )
+                return {**cached, "cached": True}
+
+        result = await self._check_article(article, preset, max_claims, kb_name)
+
+        result["check_id"] = self.store.save_result(result, content_hash, kb_name, max_claims)
+        self.store.delete_before(time.time() - self.keep_seconds)
+
+        return result
+
+    async def _check_article(
+        self,
+        article: dict[str, Any],
+        preset: str,
+        max_claims: int,
+        kb_name: str | None
+    ) -> dict[str, Any]:
+        """
+        Run the fact-check steps on an article
+
+        Args:
+            article: Article dictionary
+            preset: Fact-check preset
+            max_claims: Maximum claims to extract and verify
+            kb_name: Knowledge base for RAG search
 
         Returns:
-            Complete fact-check results
+            Fact-check results
         """
         article_id = article.get("id")
         article_title = article.get("title", "")
+        timeout = self.config.get("fact_check", {}).get("presets", {}).get(preset, {}).get("timeout_seconds")
+        deadline = Deadline(timeout)
 
         self.logger.info(f"Starting fact-check for article: {article_title[:50]}... (preset={preset})")
 
@@ -78,11 +208,26 @@ class FactCheckPipeline:
             "claims": [],
             "bias_analysis": {},
             "overall_credibility": 0.0,
-            "summary": {}
+            "summary": {},
+            "partial": False,
+            "cached": False,
+            "time_budget_seconds": deadline.seconds
         }
 
         # Step 1: Extract claims
-        claims = await self.claim_extractor.extract_claims(article, max_claims)
+        try:
+            claims = await self.scheduler.call(
+                "llm", self.claim_extractor.extract_claims(article, max_claims), deadline
+            )
+        except asyncio.TimeoutError:
+            result["partial"] = True
+            result["summary"] = {
+                "message": "Time budget ran out before claims were extracted",
+                "claims_checked": 0
+            }
+            result["elapsed_seconds"] = round(deadline.elapsed, 2)
+            return result
+
         self.logger.info(f"Extracted {len(claims)} claims")
 
         if not claims:
@@ -90,41 +235,18 @@ class FactCheckPipeline:
                 "message": "No verifiable claims found in article",
                 "claims_checked": 0
             }
+            result["elapsed_seconds"] = round(deadline.elapsed, 2)
             return result
 
-        # Step 2: Gather evidence and verify each claim
-        verified_claims = []
-
-        for claim in claims:
-            # Gather evidence
-            evidence_result = await self.evidence_gatherer.gather_evidence(
-                claim=claim,
-                preset=preset,
-                kb_name=kb_name
-            )
-
-            evidence = evidence_result.get("evidence", [])
-
-            # Verify claim
-            verification = await self.verifier.verify_claim(claim, evidence)
-
-            # Score credibility
-            credibility = self.credibility_scorer.score_claim_verification(
-                verification_result=verification,
-                evidence=evidence
-            )
-
-            # Combine results
-            verified_claim = {
-                **claim,
-                "verification": verification,
-                "evidence": evidence,
-                "credibility_score": credibility
-            }
-
-            verified_claims.append(verified_claim)
+        # Step 2: Gather evidence and verify all claims concurrently
+        verified_claims = await asyncio.gather(*[
+            self._check_claim(claim, preset, kb_name, deadline)
+            for claim in claims
+        ])
 
         result["claims"] = verified_claims
+        result["partial"] = any(c["timed_out"] for c in verified_claims)
+        result["claim_cache"] = self._claim_cache_stats(verified_claims)
 
         # Step 3: Detect bias
         bias_analysis = await self.bias_detector.detect_bias(article)
@@ -137,10 +259,196 @@ class FactCheckPipeline:
 
         # Step 5: Generate summary
         result["summary"] = self._generate_summary(verified_claims, bias_analysis)
+        result["elapsed_seconds"] = round(deadline.elapsed, 2)
 
-        self.logger.info(f"Fact-check complete: {len(verified_claims)} claims verified")
+        self.logger.info(
+            f"Fact-check complete: {len(verified_claims)} claims verified in {result['elapsed_seconds']}s"
+            + (" (partial, time budget exhausted)" if result["partial"] else "")
+        )
         return result
 
+    async def _check_claim(
+        self,
+        claim: dict[str, Any],
+        preset: str,
+        kb_name: str | None,
+        deadline: Deadline
+    ) -> dict[str, Any]:
+        """
+        Verify one claim, reusing the verification of a repeated claim
+
+        A fresh verification of the same or a near-duplicate claim comes from
+        the claim cache, and an identical claim being verified concurrently
+        (e.g. in another article of the batch) is awaited instead of verified
+        a second time, at most until this check's deadline.
+
+        Args:
+            claim: Claim dictionary
+            preset: Fact-check preset
+            kb_name: Knowledge base for RAG search
+            deadline: Deadline of the fact-check
+
+        Returns:
+            Claim with verification, evidence, credibility_score, timed_out
+            and claim_cache (whether and how the verification was reused)
+        """
+        claim_text = claim.get("claim", "")
+
+        if self.claim_cache is not None:
+            reused = self.claim_cache.lookup(claim_text, preset, kb_name)
+            if reused is not None:
+                return {
+                    **claim,
+                    "verification": reused["verification"],
+                    "evidence": reused["evidence"],
+                    "credibility_score": reused["credibility_score"],
+                    "timed_out": False,
+                    "claim_cache": {
+                        "hit": True,
+                        "match": reused["match"],
+                        "similarity": reused["similarity"],
+                        "matched_claim": reused["claim"],
+                        "verified_at": reused["verified_at"],
+                        "saved_seconds": round(reused["verify_seconds"] or 0.0, 2)
+                    }
+                }
+
+        key = (claim_hash(normalize_claim(claim_text)), preset, kb_name or "")
+        pending = self._in_flight.get(key)
+
+        if pending is not None:
+            try:
+                verified = await asyncio.wait_for(asyncio.shield(pending), timeout=deadline.remaining())
+            except asyncio.TimeoutError:
+                # Out of time before the identical claim was verified: judge it without evidence
+                verification = self.verifier.verify_without_llm(claim, [])
+                return {
+                    **claim,
+                    "verification": verification,
+                    "evidence": [],
+                    "credibility_score": self.credibility_scorer.score_claim_verification(
+                        verification_result=verification,
+                        evidence=[]
+                    ),
+                    "timed_out": True,
+                    "claim_cache": {"hit": False}
+                }
+
+            return {
+                **claim,
+                **{field: value for field, value in verified.items() if field != "verify_seconds"},
+                "claim_cache": {
+                    "hit": True,
+                    "match": "in_flight",
+                    "similarity": 1.0,
+                    "saved_seconds": round(verified["verify_seconds"], 2)
+                }
+            }
+
+        pending = self._in_flight[key] = asyncio.ensure_future(
+            self._verify_claim(claim, preset, kb_name, deadline)
+        )
+        pending.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        verified = await asyncio.shield(pending)
+        return {
+            **claim,
+            **{field: value for field, value in verified.items() if field != "verify_seconds"},
+            "claim_cache": {"hit": False}
+        }
+
+    async def _verify_claim(
+        self,
+        claim: dict[str, Any],
+        preset: str,
+        kb_name: str | None,
+        deadline: Deadline
+    ) -> dict[str, Any]:
+        """
+        Gather evidence for one claim, verify it and score its credibility
+
+        Complete verifications backed by evidence are added to the claim cache.
+
+        Args:
+            claim: Claim dictionary
+            preset: Fact-check preset
+            kb_name: Knowledge base for RAG search
+            deadline: Deadline of the fact-check
+
+        Returns:
+            Dictionary with verification, evidence, credibility_score,
+            timed_out and verify_seconds
+        """
+        started = asyncio.get_running_loop().time()
+
+        # Searches stop early enough to leave the rest of the budget for the verdict
+        evidence_result = await self.evidence_gatherer.gather_evidence(
+            claim=claim,
+            preset=preset,
+            kb_name=kb_name,
+            scheduler=self.scheduler,
+            deadline=deadline.share(self.scheduler.evidence_budget)
+        )
+
+        evidence = evidence_result.get("evidence", [])
+        timed_out = bool(evidence_result.get("timed_out_sources"))
+
+        # Verify claim; without time left for the LLM, judge the evidence found so far
+        try:
+            verification = await self.scheduler.call("llm", self.verifier.verify_claim(claim, evidence), deadline)
+        except asyncio.TimeoutError:
+            verification = self.verifier.verify_without_llm(claim, evidence)
+            timed_out = True
+
+        # Score credibility
+        credibility = self.credibility_scorer.score_claim_verification(
+            verification_result=verification,
+            evidence=evidence
+        )
+
+        verify_seconds = asyncio.get_running_loop().time() - started
+
+        # Cut-short, failed or evidence-less verdicts may come out differently next time
+        if (
+            self.claim_cache is not None
+            and not timed_out
+            and evidence
+            and verification.get("verdict") != "error"
+        ):
+            self.claim_cache.add(
+                claim.get("claim", ""), preset, kb_name, verification, evidence, credibility, verify_seconds
+            )
+
+        return {
+            "verification": verification,
+            "evidence": evidence,
+            "credibility_score": credibility,
+            "timed_out": timed_out,
+            "verify_seconds": verify_seconds
+        }
+
+    def _claim_cache_stats(self, verified_claims: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Summarize how many claims reused an earlier verification
+
+        Args:
+            verified_claims: Claims returned by _check_claim()
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, and the LLM verifications
+            and seconds of evidence search and verification saved
+        """
+        reused = [c["claim_cache"] for c in verified_claims if c.get("claim_cache", {}).get("hit")]
+        total = len(verified_claims)
+
+        return {
+            "hits": len(reused),
+            "misses": total - len(reused),
+            "hit_rate": round(len(reused) / total, 2) if total else 0.0,
+            "llm_verifications_saved": len(reused),
+            "seconds_saved": round(sum((c.get("saved_seconds", 0.0) for c in reused), 0.0), 2)
+        }
+
     def _generate_summary(
         self,
         verified_claims: list[dict[str, Any]],
@@ -166,6 +474,7 @@ class FactCheckPipeline:
 
         return {
             "claims_checked": total_claims,
+            "claims_timed_out": sum(1 for claim in verified_claims if claim.get("timed_out")),
             "verdicts": verdicts,
             "verdict_percentages": verdict_percentages,
             "bias_score": bias_analysis.get("overall_bias_score", 0.0),
@@ -177,30 +486,41 @@ class FactCheckPipeline:
         articles: list[dict[str, Any]],
         preset: str = "quick",
         max_claims_per_article: int = 3,
-        kb_name: str | None = None
+        kb_name: str | None = None,
+        use_cache: bool = True
     ) -> list[dict[str, Any]]:
         """
-        Fact-check multiple articles
+        Fact-check multiple articles concurrently
+
+        At most fact_check.concurrency.max_concurrent_articles articles are
+        checked at once; each gets the preset's full time budget from the
+        moment its check starts.
 
         Args:
             articles: List of articles
             preset: Fact-check preset
             max_claims_per_article: Max claims per article
             kb_name: Knowledge base name
+            use_cache: Reuse stored results
 
         Returns:
-            List of fact-check results
+            List of fact-check results, in article order
         """
-        results = []
-
-        for article in articles:
-            result = await self.fact_check_article(
-                article=article,
-                preset=preset,
-                max_claims=max_claims_per_article,
-                kb_name=kb_name
-            )
-            results.append(result)
-
-        self.logger.info(f"Batch fact-check complete: {len(results)} articles processed")
+        async def check(article: dict[str, Any]) -> dict[str, Any]:
+            async with self.scheduler.article_slots:
+                return await self.fact_check_article(
+                    article=article,
+                    preset=preset,
+                    max_claims=max_claims_per_article,
+                    kb_name=kb_name,
+                    use_cache=use_cache
+                )
+
+        results = await asyncio.gather(*[check(article) for article in articles])
+
+        partial = sum(1 for result in results if result.get("partial"))
+        cached = sum(1 for result in results if result.get("cached"))
+        self.logger.info(
+            f"Batch fact-check complete: {len(results)} articles processed ({cached} cached, {partial} partial)"
+        )
         return results
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+FactCheckScheduler - Concurrency limits and deadlines for fact-checking
+
+Every call to an external provider (LLM, RAG, web search, paper search) goes
+through one scheduler, which bounds it by a global concurrency limit and a
+per-provider limit. Calls share the deadline of the fact-check they belong
+to: waiting for a slot counts against the budget, and a call still running
+when the deadline passes is cancelled with asyncio.TimeoutError so the caller
+can return what it has so far.
+"""
+
+import asyncio
+from typing import Any, Coroutine, Optional
+
+from src.core.logging import get_logger
+
+# Default per-provider limits when fact_check.concurrency.providers omits one
+_DEFAULT_PROVIDER_LIMITS = {"llm": 4, "rag": 2, "web": 3, "paper": 2}
+
+
+class Deadline:
+    """Point in time (event loop clock) by which a fact-check must finish"""
+
+    def __init__(self, seconds: Optional[float], started: Optional[float] = None):
+        """
+        Initialize deadline
+
+        Args:
+            seconds: Budget, None or <= 0 for no deadline
+            started: Loop time the budget starts at (default: now)
+        """
+        self.started = started if started is not None else asyncio.get_running_loop().time()
+        self.seconds = seconds if seconds and seconds > 0 else None
+        self.at = self.started + self.seconds if self.seconds else None
+
+    def share(self, fraction: float) -> "Deadline":
+        """
+        Earlier deadline covering the first part of this budget
+
+        Args:
+            fraction: Part of the budget (0 to 1)
+
+        Returns:
+            Deadline with the same start and fraction of the seconds
+        """
+        if self.seconds is None:
+            return self
+        return Deadline(self.seconds * fraction, started=self.started)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), None without a deadline"""
+        if self.at is None:
+            return None
+        return max(0.0, self.at - asyncio.get_running_loop().time())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is used up"""
+        return self.at is not None and asyncio.get_running_loop().time() >= self.at
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the deadline was set"""
+        return asyncio.get_running_loop().time() - self.started
+
+
+class FactCheckScheduler:
+    """Global and per-provider concurrency limits for fact-check calls"""
+
+    def __init__(self, config: Optional[dict[str, Any]] = None):
+        """
+        Initialize scheduler
+
+        Args:
+            config: fact_check.concurrency config (max_concurrency,
+                max_concurrent_articles, evidence_budget, providers)
+        """
+        config = config or {}
+        self.max_concurrency = config.get("max_concurrency", 8)
+        self.max_concurrent_articles = config.get("max_concurrent_articles", 4)
+        self.evidence_budget = config.get("evidence_budget", 0.7)
+        self.provider_limits = {**_DEFAULT_PROVIDER_LIMITS, **(config.get("providers") or {})}
+        self.logger = get_logger(name="fact_check_pipeline")
+
+        self._loop = None
+        self._global = asyncio.Semaphore(self.max_concurrency)
+        self._articles = asyncio.Semaphore(self.max_concurrent_articles)
+        self._providers: dict[str, asyncio.Semaphore] = {}
+
+    def _bind_loop(self) -> None:
+        """Start from fresh semaphores when used from a new event loop"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._global = asyncio.Semaphore(self.max_concurrency)
+            self._articles = asyncio.Semaphore(self.max_concurrent_articles)
+            self._providers = {}
+
+    def _provider(self, provider: str) -> asyncio.Semaphore:
+        """Get (or create) the semaphore of a provider"""
+        semaphore = self._providers.get(provider)
+        if semaphore is None:
+            semaphore = self._providers[provider] = asyncio.Semaphore(
+                self.provider_limits.get(provider, self.max_concurrency)
+            )
+        return semaphore
+
+    @property
+    def article_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding the articles of a batch checked at once"""
+        self._bind_loop()
+        return self._articles
+
+    async def call(self, provider: str, coro: Coroutine[Any, Any, Any], deadline: Optional[Deadline] = None) -> Any:
+        """
+        Run a provider call under the concurrency limits and a deadline
+
+        Args:
+            provider: Provider name (llm, rag, web, paper)
+            coro: Coroutine performing the call
+            deadline: Deadline of the fact-check, None for no limit
+
+        Returns:
+            Result of the coroutine
+
+        Raises:
+            asyncio.TimeoutError: If the deadline passes before the call ends
+        """
+        self._bind_loop()
+
+        async def run():
+            try:
+                # Always provider first, then global, so waits never form a cycle
+                async with self._provider(provider):
+                    async with self._global:
+                        return await coro
+            finally:
+                # Cancelled while waiting for a slot: the call never started
+                coro.close()
+
+        if deadline is None or deadline.at is None:
+            return await run()
+
+        if deadline.expired:
+            coro.close()
+            raise asyncio.TimeoutError(f"{provider} call skipped, fact-check deadline passed")
+
+        try:
+            return await asyncio.wait_for(run(), timeout=deadline.remaining())
+        except asyncio.TimeoutError:
+            self.logger.warning(f"{provider} call cancelled at fact-check deadline ({deadline.seconds}s)")
+            raise
@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+"""
+FactCheckStore - Persistent fact-check results
+
+Every completed fact-check is stored with the article ID, a hash of the
+checked text, the preset and the other inputs that shape the result. A later
+check of the same unchanged article with the same inputs reuses the stored
+result while it is younger than the TTL, and every stored check is served as
+history. Results carry RESULT_VERSION, so results of an older pipeline are
+kept as history but never reused.
+
+Verified claims are also stored one by one (claim_verifications), so a claim
+repeated in other articles can reuse the verdict (see ClaimCache).
+"""
+
+from datetime import datetime
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import time
+from typing import Any, Optional
+
+# Bump when the pipeline's results change meaningfully, so stored ones are recomputed
+RESULT_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fact_checks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    article_id TEXT,
+    content_hash TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    kb_name TEXT NOT NULL DEFAULT '',
+    max_claims INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    partial INTEGER NOT NULL DEFAULT 0,
+    article_title TEXT,
+    overall_credibility REAL,
+    claims_checked INTEGER,
+    checked_at TEXT NOT NULL,
+    checked_ts REAL NOT NULL,
+    result TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_fact_checks_key
+    ON fact_checks (content_hash, preset, article_id, checked_ts);
+CREATE INDEX IF NOT EXISTS idx_fact_checks_article ON fact_checks (article_id, checked_ts);
+CREATE INDEX IF NOT EXISTS idx_fact_checks_time ON fact_checks (checked_ts);
+
+CREATE TABLE IF NOT EXISTS claim_verifications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    claim_hash TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    anchors TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    kb_name TEXT NOT NULL DEFAULT '',
+    version INTEGER NOT NULL,
+    claim TEXT,
+    verification TEXT NOT NULL,
+    evidence TEXT NOT NULL,
+    credibility_score REAL,
+    verify_seconds REAL,
+    verified_at TEXT NOT NULL,
+    verified_ts REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_claim_verifications_hash
+    ON claim_verifications (claim_hash, preset, kb_name, verified_ts);
+CREATE INDEX IF NOT EXISTS idx_claim_verifications_time ON claim_verifications (verified_ts);
+"""
+
+
+def article_hash(article: dict[str, Any]) -> str:
+    """
+    Hash the text a fact-check reads from an article
+
+    Args:
+        article: Article dictionary
+
+    Returns:
+        Hex digest of title and content
+    """
+    text = f"{article.get('title') or ''}\n{article.get('content') or ''}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+class FactCheckStore:
+    """SQLite-backed store of fact-check results"""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize fact-check store
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self.conn.close()
+
+    def get_result(
+        self,
+        article_id: Optional[str],
+        content_hash: str,
+        preset: str,
+        kb_name: Optional[str],
+        max_claims: int,
+        max_age_seconds: float
+    ) -> Optional[dict[str, Any]]:
+        """
+        Get the newest reusable result of a fact-check
+
+        Partial results (cut off by the time budget) and results of other
+        result versions are never reused.
+
+        Args:
+            article_id: Article ID
+            content_hash: Hash of the checked text (see article_hash())
+            preset: Fact-check preset
+            kb_name: Knowledge base used for RAG search
+            max_claims: Maximum claims checked
+            max_age_seconds: TTL; older results are ignored
+
+        Returns:
+            Stored result with check_id and checked_at, or None
+        """
+        row = self.conn.execute(
+            """
+            SELECT id, checked_at, result FROM fact_checks
+            WHERE content_hash = ? AND preset = ? AND article_id IS ? AND kb_name = ?
+              AND max_claims = ? AND version = ? AND partial = 0 AND checked_ts >= ?
+            ORDER BY checked_ts DESC
+            LIMIT 1
+            """,
+            (
+                content_hash, preset, article_id, kb_name or "", max_claims,
+                RESULT_VERSION, time.time() - max_age_seconds
+            )
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return {**json.loads(row["result"]), "check_id": row["id"], "checked_at": row["checked_at"]}
+
+    def save_result(
+        self,
+        result: dict[str, Any],
+        content_hash: str,
+        kb_name: Optional[str],
+        max_claims: int
+    ) -> int:
+        """
+        Store a fact-check result
+
+        Args:
+            result: Result of FactCheckPipeline.fact_check_article()
+            content_hash: Hash of the checked text
+            kb_name: Knowledge base used for RAG search
+            max_claims: Maximum claims checked
+
+        Returns:
+            ID of the stored check
+        """
+        now = datetime.now()
+
+        with self.conn:
+            cursor = self.conn.execute(
+                """
+                INSERT INTO fact_checks (
+                    article_id, content_hash, preset, kb_name, max_claims, version, partial,
+                    article_title, overall_credibility, claims_checked, checked_at, checked_ts, result
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    result.get("article_id"),
+                    content_hash,
+                    result.get("preset", ""),
+                    kb_name or "",
+                    max_claims,
+                    RESULT_VERSION,
+                    int(bool(result.get("partial"))),
+                    result.get("article_title"),
+                    result.get("overall_credibility"),
+                    result.get("summary", {}).get("claims_checked", 0),
+                    now.isoformat(),
+                    now.timestamp(),
+                    json.dumps(result, ensure_ascii=False, default=str)
+                )
+            )
+
+        return cursor.lastrowid
+
+    def history(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        article_id: Optional[str] = None,
+        preset: Optional[str] = None
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """
+        Get stored fact-checks, newest first
+
+        Args:
+            limit: Maximum results
+            offset: Results to skip
+            article_id: Only checks of this article
+            preset: Only checks with this preset
+
+        Returns:
+            Tuple of (total matching checks, results of the requested page)
+        """
+        conditions, params = [], []
+
+        if article_id:
+            conditions.append("article_id = ?")
+            params.append(article_id)
+        if preset:
+            conditions.append("preset = ?")
+            params.append(preset)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        total = self.conn.execute(f"SELECT COUNT(*) FROM fact_checks {where}", params).fetchone()[0]
+        rows = self.conn.execute(
+            f"""
+            SELECT id, checked_at, result FROM fact_checks {where}
+            ORDER BY checked_ts DESC, id DESC
+            LIMIT ? OFFSET ?
+            """,
+            params + [limit, offset]
+        ).fetchall()
+
+        return total, [
+            {**json.loads(row["result"]), "check_id": row["id"], "checked_at": row["checked_at"]}
+            for row in rows
+        ]
+
+    def delete_before(self, before_ts: float) -> int:
+        """
+        Delete checks and claim verifications made before a time
+
+        Args:
+            before_ts: Cutoff timestamp
+
+        Returns:
+            Number of checks deleted
+        """
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM fact_checks WHERE checked_ts < ?", (before_ts,))
+            self.conn.execute("DELETE FROM claim_verifications WHERE verified_ts < ?", (before_ts,))
+        return cursor.rowcount
+
+    def save_claim_verification(
+        self,
+        claim_hash: str,
+        normalized: str,
+        anchors: str,
+        preset: str,
+        kb_name: Optional[str],
+        claim: str,
+        verification: dict[str, Any],
+        evidence: list[dict[str, Any]],
+        credibility_score: float,
+        verify_seconds: float
+    ) -> tuple[int, float]:
+        """
+        Store the verification of one claim
+
+        Args:
+            claim_hash: Hash of the normalized claim
+            normalized: Normalized claim text
+            anchors: Numbers and negation of the claim (see claim_anchors())
+            preset: Fact-check preset
+            kb_name: Knowledge base used for RAG search
+            claim: Claim text as extracted
+            verification: Verification result
+            evidence: Evidence the verdict is based on
+            credibility_score: Credibility score of the verification
+            verify_seconds: Time spent gathering evidence and verifying
+
+        Returns:
+            Tuple of (ID of the stored verification, verification timestamp)
+        """
+        now = datetime.now()
+
+        with self.conn:
+            cursor = self.conn.execute(
+                """
+                INSERT INTO claim_verifications (
+                    claim_hash, normalized, anchors, preset, kb_name, version, claim, verification,
+                    evidence, credibility_score, verify_seconds, verified_at, verified_ts
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    claim_hash, normalized, anchors, preset, kb_name or "", RESULT_VERSION, claim,
+                    json.dumps(verification, ensure_ascii=False, default=str),
+                    json.dumps(evidence, ensure_ascii=False, default=str),
+                    credibility_score, verify_seconds, now.isoformat(), now.timestamp()
+                )
+            )
+
+        return cursor.lastrowid, now.timestamp()
+
+    def find_claim_verification(
+        self,
+        claim_hash: str,
+        preset: str,
+        kb_name: Optional[str],
+        since_ts: float
+    ) -> Optional[dict[str, Any]]:
+        """
+        Get the newest verification of an identical normalized claim
+
+        Args:
+            claim_hash: Hash of the normalized claim
+            preset: Fact-check preset
+            kb_name: Knowledge base used for RAG search
+            since_ts: Ignore verifications made before this time
+
+        Returns:
+            Verification dictionary (see get_claim_verification()), or None
+        """
+        row = self.conn.execute(
+            """
+            SELECT * FROM claim_verifications
+            WHERE claim_hash = ? AND preset = ? AND kb_name = ? AND version = ? AND verified_ts >= ?
+            ORDER BY verified_ts DESC
+            LIMIT 1
+            """,
+            (claim_hash, preset, kb_name or "", RESULT_VERSION, since_ts)
+        ).fetchone()
+
+        return self._claim_verification(row) if row is not None else None
+
+    def get_claim_verification(self, verification_id: int) -> Optional[dict[str, Any]]:
+        """
+        Get a stored claim verification
+
+        Args:
+            verification_id: ID from save_claim_verification()
+
+        Returns:
+            Dictionary with id, claim, normalized, verification, evidence,
+            credibility_score, verify_seconds and verified_at, or None
+        """
+        row = self.conn.execute(
+            "SELECT * FROM claim_verifications WHERE id = ?", (verification_id,)
+        ).fetchone()
+
+        return self._claim_verification(row) if row is not None else None
+
+    def claim_signatures_since(self, since_ts: float) -> list[tuple[int, str, str, str, str, float]]:
+        """
+        Get the claims verified since a time, to rebuild a claim index
+
+        Args:
+            since_ts: Cutoff timestamp
+
+        Returns:
+            List of (id, normalized, anchors, preset, kb_name, verified_ts), oldest first
+        """
+        rows = self.conn.execute(
+            """
+            SELECT id, normalized, anchors, preset, kb_name, verified_ts FROM claim_verifications
+            WHERE version = ? AND verified_ts >= ?
+            ORDER BY verified_ts
+            """,
+            (RESULT_VERSION, since_ts)
+        ).fetchall()
+
+        return [tuple(row) for row in rows]
+
+    @staticmethod
+    def _claim_verification(row: sqlite3.Row) -> dict[str, Any]:
+        """Decode a claim_verifications row"""
+        return {
+            "id": row["id"],
+            "claim": row["claim"],
+            "normalized": row["normalized"],
+            "verification": json.loads(row["verification"]),
+            "evidence": json.loads(row["evidence"]),
+            "credibility_score": row["credibility_score"],
+            "verify_seconds": row["verify_seconds"],
+            "verified_at": row["verified_at"]
+        }
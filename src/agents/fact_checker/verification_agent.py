@@ -71,6 +71,28 @@ class VerificationAgent:
                 "evidence_count": len(evidence)
             }
 
+    def verify_without_llm(
+        self,
+        claim: dict[str, Any],
+        evidence: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Verify a claim with the keyword heuristic only
+
+        Used when there is no time left for an LLM verdict.
+
+        Args:
+            claim: Claim dictionary
+            evidence: List of evidence items
+
+        Returns:
+            Verification result with verdict and confidence
+        """
+        result = self._verify_heuristic(claim, evidence)
+        result["reasoning"] = f"Time budget exhausted before LLM verification. {result['reasoning']}"
+        result["evidence_count"] = len(evidence)
+        return result
+
     async def _verify_with_llm(
         self,
         claim: dict[str, Any],
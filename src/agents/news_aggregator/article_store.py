@@ -0,0 +1,1339 @@
+#!/usr/bin/env python
+"""
+ArticleStore - Embedded SQLite index behind NewsStorage
+
+Keeps one row per article with the fields used for filtering and ordering
+pulled out into indexed columns, so filters, ordering and pagination are
+answered by the database instead of by parsing every batch file.
+
+Processed articles are also indexed in an FTS5 full-text table (title,
+description, content and keywords), kept in step with the articles table by
+triggers and ranked with BM25, so text search joins straight back to the
+indexed filter columns. Their keywords feed per-topic hourly and daily
+mention counters maintained the same way (see TOPIC_SCHEMA).
+
+The database runs in WAL mode: writes are appended to the write-ahead log
+and folded back into the main file by checkpoints, which compact() forces
+after bulk deletions.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import json
+from pathlib import Path
+import re
+import sqlite3
+from typing import Any, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT NOT NULL,
+    processed INTEGER NOT NULL,
+    category TEXT,
+    source TEXT,
+    source_name TEXT,
+    language TEXT,
+    published_at TEXT,
+    published_ts REAL,
+    batch_file TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (id, processed)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (processed, category, published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (processed, source, published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_language ON articles (processed, language, published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (processed, published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_batch_file ON articles (batch_file);
+
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS article_stats (
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, value)
+);
+
+CREATE TABLE IF NOT EXISTS dedup_signatures (
+    article_id TEXT PRIMARY KEY,
+    url_hash TEXT,
+    title TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_dedup_signatures_url ON dedup_signatures (url_hash);
+
+CREATE TABLE IF NOT EXISTS dedup_bands (
+    band_key TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    PRIMARY KEY (band_key, article_id)
+);
+CREATE INDEX IF NOT EXISTS idx_dedup_bands_article ON dedup_bands (article_id);
+
+CREATE TABLE IF NOT EXISTS sentiment_cache (
+    content_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    scores TEXT NOT NULL,
+    cached_ts REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (content_hash, model)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_dedup_signatures_delete AFTER DELETE ON articles
+WHEN OLD.processed = 1
+BEGIN
+    DELETE FROM dedup_bands WHERE article_id = OLD.id;
+    DELETE FROM dedup_signatures WHERE article_id = OLD.id;
+END;
+"""
+
+# Rolling counts of processed articles per category/source/language, kept in
+# step with the articles table so /stats never has to scan the corpus.
+STATS_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS trg_article_stats_insert AFTER INSERT ON articles
+WHEN NEW.processed = 1
+BEGIN
+    INSERT INTO article_stats (dimension, value, count)
+    VALUES ('category', COALESCE(NEW.category, 'general'), 1)
+    ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1;
+    INSERT INTO article_stats (dimension, value, count)
+    VALUES ('source', COALESCE(NEW.source_name, 'Unknown'), 1)
+    ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1;
+    INSERT INTO article_stats (dimension, value, count)
+    VALUES ('language', COALESCE(NEW.language, 'en'), 1)
+    ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_article_stats_delete AFTER DELETE ON articles
+WHEN OLD.processed = 1
+BEGIN
+    UPDATE article_stats SET count = count - 1
+    WHERE dimension = 'category' AND value = COALESCE(OLD.category, 'general');
+    UPDATE article_stats SET count = count - 1
+    WHERE dimension = 'source' AND value = COALESCE(OLD.source_name, 'Unknown');
+    UPDATE article_stats SET count = count - 1
+    WHERE dimension = 'language' AND value = COALESCE(OLD.language, 'en');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_article_stats_update AFTER UPDATE OF category, source_name, language ON articles
+WHEN NEW.processed = 1
+BEGIN
+    UPDATE article_stats SET count = count - 1
+    WHERE dimension = 'category' AND value = COALESCE(OLD.category, 'general');
+    UPDATE article_stats SET count = count - 1
+    WHERE dimension = 'source' AND value = COALESCE(OLD.source_name, 'Unknown');
+    UPDATE article_stats SET count = count - 1
+    WHERE dimension = 'language' AND value = COALESCE(OLD.language, 'en');
+    INSERT INTO article_stats (dimension, value, count)
+    VALUES ('category', COALESCE(NEW.category, 'general'), 1)
+    ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1;
+    INSERT INTO article_stats (dimension, value, count)
+    VALUES ('source', COALESCE(NEW.source_name, 'Unknown'), 1)
+    ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1;
+    INSERT INTO article_stats (dimension, value, count)
+    VALUES ('language', COALESCE(NEW.language, 'en'), 1)
+    ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1;
+END;
+"""
+
+# Full-text index over processed articles. Rows share the rowid of their
+# articles row; the text columns are extracted from the JSON document.
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS article_search USING fts5(
+    title,
+    description,
+    content,
+    keywords,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_article_search_insert AFTER INSERT ON articles
+WHEN NEW.processed = 1
+BEGIN
+    INSERT INTO article_search (rowid, title, description, content, keywords)
+    VALUES (
+        NEW.rowid,
+        COALESCE(json_extract(NEW.data, '$.title'), ''),
+        COALESCE(json_extract(NEW.data, '$.description'), ''),
+        COALESCE(json_extract(NEW.data, '$.content'), ''),
+        COALESCE((SELECT group_concat(value, ' ') FROM json_each(NEW.data, '$.keywords')), '')
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_article_search_delete AFTER DELETE ON articles
+WHEN OLD.processed = 1
+BEGIN
+    DELETE FROM article_search WHERE rowid = OLD.rowid;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_article_search_update AFTER UPDATE OF data ON articles
+WHEN NEW.processed = 1
+BEGIN
+    DELETE FROM article_search WHERE rowid = OLD.rowid;
+    INSERT INTO article_search (rowid, title, description, content, keywords)
+    VALUES (
+        NEW.rowid,
+        COALESCE(json_extract(NEW.data, '$.title'), ''),
+        COALESCE(json_extract(NEW.data, '$.description'), ''),
+        COALESCE(json_extract(NEW.data, '$.content'), ''),
+        COALESCE((SELECT group_concat(value, ' ') FROM json_each(NEW.data, '$.keywords')), '')
+    );
+END;
+"""
+
+# Topic mention counters. Each processed article contributes its keywords
+# as topics (interned as integer IDs in topics) to article_topics; triggers
+# on that table keep per-topic hourly and daily mention buckets (per
+# category), so trend queries never read article bodies.
+TOPIC_SCHEMA = """
+CREATE TABLE IF NOT EXISTS topics (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS article_topics (
+    article_rowid INTEGER NOT NULL,
+    topic_id INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    source TEXT NOT NULL,
+    published_ts REAL,
+    PRIMARY KEY (article_rowid, topic_id)
+);
+CREATE INDEX IF NOT EXISTS idx_article_topics_topic ON article_topics (topic_id, published_ts);
+
+CREATE TABLE IF NOT EXISTS topic_counts (
+    granularity TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    topic_id INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (granularity, bucket, category, topic_id)
+);
+CREATE INDEX IF NOT EXISTS idx_topic_counts_topic ON topic_counts (topic_id, granularity, bucket);
+
+-- Trigger statements inherit the conflict handling of the upsert that fires
+-- them, so they avoid conflicts (DISTINCT, NOT EXISTS) instead of ignoring them
+CREATE TRIGGER IF NOT EXISTS trg_article_topics_insert AFTER INSERT ON articles
+WHEN NEW.processed = 1
+BEGIN
+    INSERT INTO topics (topic)
+    SELECT DISTINCT lower(trim(value)) FROM json_each(NEW.data, '$.keywords')
+    WHERE type = 'text' AND length(trim(value)) >= 3
+    AND NOT EXISTS (SELECT 1 FROM topics WHERE topic = lower(trim(value)));
+    INSERT INTO article_topics (article_rowid, topic_id, category, source, published_ts)
+    SELECT DISTINCT NEW.rowid, topics.id, COALESCE(NEW.category, 'general'), COALESCE(NEW.source_name, 'Unknown'), NEW.published_ts
+    FROM json_each(NEW.data, '$.keywords') AS keyword JOIN topics ON topics.topic = lower(trim(keyword.value))
+    WHERE keyword.type = 'text';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_article_topics_delete AFTER DELETE ON articles
+WHEN OLD.processed = 1
+BEGIN
+    DELETE FROM article_topics WHERE article_rowid = OLD.rowid;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_article_topics_update AFTER UPDATE OF data ON articles
+WHEN NEW.processed = 1
+BEGIN
+    DELETE FROM article_topics WHERE article_rowid = OLD.rowid;
+    INSERT INTO topics (topic)
+    SELECT DISTINCT lower(trim(value)) FROM json_each(NEW.data, '$.keywords')
+    WHERE type = 'text' AND length(trim(value)) >= 3
+    AND NOT EXISTS (SELECT 1 FROM topics WHERE topic = lower(trim(value)));
+    INSERT INTO article_topics (article_rowid, topic_id, category, source, published_ts)
+    SELECT DISTINCT NEW.rowid, topics.id, COALESCE(NEW.category, 'general'), COALESCE(NEW.source_name, 'Unknown'), NEW.published_ts
+    FROM json_each(NEW.data, '$.keywords') AS keyword JOIN topics ON topics.topic = lower(trim(keyword.value))
+    WHERE keyword.type = 'text';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_topic_counts_insert AFTER INSERT ON article_topics
+WHEN NEW.published_ts IS NOT NULL
+BEGIN
+    INSERT INTO topic_counts (granularity, bucket, category, topic_id, count)
+    VALUES ('h', CAST(NEW.published_ts / 3600 AS INTEGER), NEW.category, NEW.topic_id, 1)
+    ON CONFLICT (granularity, bucket, category, topic_id) DO UPDATE SET count = count + 1;
+    INSERT INTO topic_counts (granularity, bucket, category, topic_id, count)
+    VALUES ('d', CAST(NEW.published_ts / 86400 AS INTEGER), NEW.category, NEW.topic_id, 1)
+    ON CONFLICT (granularity, bucket, category, topic_id) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_topic_counts_delete AFTER DELETE ON article_topics
+WHEN OLD.published_ts IS NOT NULL
+BEGIN
+    UPDATE topic_counts SET count = count - 1
+    WHERE granularity = 'h' AND bucket = CAST(OLD.published_ts / 3600 AS INTEGER)
+    AND category = OLD.category AND topic_id = OLD.topic_id;
+    UPDATE topic_counts SET count = count - 1
+    WHERE granularity = 'd' AND bucket = CAST(OLD.published_ts / 86400 AS INTEGER)
+    AND category = OLD.category AND topic_id = OLD.topic_id;
+    DELETE FROM topic_counts
+    WHERE granularity IN ('h', 'd')
+    AND bucket IN (CAST(OLD.published_ts / 3600 AS INTEGER), CAST(OLD.published_ts / 86400 AS INTEGER))
+    AND category = OLD.category AND topic_id = OLD.topic_id AND count <= 0;
+END;
+"""
+
+# Seconds per topic counter bucket
+BUCKET_SECONDS = {"h": 3600, "d": 86400}
+
+# BM25 weights of the title, description, content and keywords columns
+SEARCH_WEIGHTS = (10.0, 4.0, 1.0, 6.0)
+
+
+def match_expression(text: str, phrase: bool = False) -> Optional[str]:
+    """
+    Turn free text into a safe FTS5 MATCH expression
+
+    Every word is quoted, so user input can never be parsed as query syntax.
+
+    Args:
+        text: Search text
+        phrase: Match the words as one phrase instead of all words anywhere
+
+    Returns:
+        MATCH expression, or None if the text contains no words
+    """
+    words = re.findall(r"\w+", text or "")
+    if not words:
+        return None
+
+    if phrase:
+        return '"' + " ".join(words) + '"'
+
+    return " AND ".join(f'"{word}"' for word in words)
+
+
+class ArticleStore:
+    """SQLite-backed article table with secondary indexes"""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize article store
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._add_missing_columns()
+        self.conn.executescript(STATS_TRIGGERS)
+        self.conn.executescript(SEARCH_SCHEMA)
+        self.conn.executescript(TOPIC_SCHEMA)
+        self.conn.commit()
+
+        if not self.get_meta("stats_initialized"):
+            self.recompute_stats()
+
+        if not self.get_meta("search_initialized"):
+            self.rebuild_search_index()
+
+        if not self.get_meta("topics_initialized"):
+            self.rebuild_topic_counts()
+
+        if not self.get_meta("rfc822_dates_backfilled"):
+            self.backfill_published_ts()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self.conn.close()
+
+    def _add_missing_columns(self) -> None:
+        """Add columns introduced after a table was first created"""
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(sentiment_cache)")}
+        if "cached_ts" not in columns:
+            # Entries cached before have no time: the next prune removes them
+            self.conn.execute("ALTER TABLE sentiment_cache ADD COLUMN cached_ts REAL NOT NULL DEFAULT 0")
+
+    def upsert(
+        self,
+        articles: list[dict[str, Any]],
+        processed: bool,
+        batch_file: Optional[str] = None
+    ) -> int:
+        """
+        Insert or replace articles
+
+        Args:
+            articles: List of article dictionaries
+            processed: Whether these are processed articles
+            batch_file: Batch file the articles were written to
+
+        Returns:
+            Number of rows written
+        """
+        rows = [
+            self._to_row(article, processed, batch_file)
+            for article in articles
+            if article.get("id")
+        ]
+
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO articles (
+                    id, processed, category, source, source_name, language,
+                    published_at, published_ts, batch_file, data
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id, processed) DO UPDATE SET
+                    category = excluded.category,
+                    source = excluded.source,
+                    source_name = excluded.source_name,
+                    language = excluded.language,
+                    published_at = excluded.published_at,
+                    published_ts = excluded.published_ts,
+                    batch_file = excluded.batch_file,
+                    data = excluded.data
+                """,
+                rows
+            )
+
+        return len(rows)
+
+    def get(self, article_id: str, processed: bool = True) -> Optional[dict[str, Any]]:
+        """
+        Look up a single article by primary key
+
+        Args:
+            article_id: Article ID
+            processed: Look up processed (True) or raw (False) article
+
+        Returns:
+            Article dictionary or None if not found
+        """
+        row = self.conn.execute(
+            "SELECT data FROM articles WHERE id = ? AND processed = ?",
+            (article_id, int(processed))
+        ).fetchone()
+
+        return json.loads(row["data"]) if row else None
+
+    def get_many(self, article_ids: list[str], processed: bool = True) -> dict[str, dict[str, Any]]:
+        """
+        Look up several articles by primary key
+
+        Args:
+            article_ids: Article IDs
+            processed: Look up processed (True) or raw (False) articles
+
+        Returns:
+            Dictionary mapping found article IDs to articles
+        """
+        found = {}
+        unique_ids = list(dict.fromkeys(article_ids))
+
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(unique_ids), 500):
+            chunk = unique_ids[i:i + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT id, data FROM articles WHERE processed = ? AND id IN ({placeholders})",
+                [int(processed), *chunk]
+            )
+            for row in rows:
+                found[row["id"]] = json.loads(row["data"])
+
+        return found
+
+    def query(
+        self,
+        processed: bool = True,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> list[dict[str, Any]]:
+        """
+        Query articles, newest first
+
+        Args:
+            processed: Query processed (True) or raw (False) articles
+            category: Filter by category
+            source: Filter by source
+            language: Filter by language
+            after_date: Only return articles published after this date
+            limit: Maximum number of articles to return
+            offset: Number of matching articles to skip
+
+        Returns:
+            List of articles
+        """
+        where, params = self._build_filters(processed, category, source, language, after_date)
+
+        sql = (
+            f"SELECT data FROM articles WHERE {where} "
+            "ORDER BY published_ts IS NULL, published_ts DESC, id DESC"
+        )
+
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit if limit is not None else -1, max(0, offset)])
+
+        return [json.loads(row["data"]) for row in self.conn.execute(sql, params)]
+
+    def scan(
+        self,
+        processed: bool = True,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        after_key: Optional[tuple[Optional[float], str]] = None,
+        limit: int = 100,
+        oldest_first: bool = False
+    ) -> list[tuple[tuple[Optional[float], str], dict[str, Any]]]:
+        """
+        Keyset scan in the same order as query(), or oldest first
+
+        Instead of an offset, the scan resumes strictly after after_key, the
+        (published_ts, id) key of the last article of the previous page, so
+        each page costs an index seek regardless of how deep it is.
+
+        Args:
+            processed: Scan processed (True) or raw (False) articles
+            category: Filter by category
+            source: Filter by source
+            language: Filter by language
+            after_date: Only return articles published after this date
+            after_key: Key of the last article already returned
+            limit: Maximum number of articles to return
+            oldest_first: Scan by ascending publish date (undated articles still last)
+
+        Returns:
+            List of (key, article) tuples
+        """
+        where, params = self._build_filters(processed, category, source, language, after_date)
+        op, direction = (">", "ASC") if oldest_first else ("<", "DESC")
+
+        if after_key is not None:
+            last_ts, last_id = after_key
+            if last_ts is None:
+                where += f" AND published_ts IS NULL AND id {op} ?"
+                params.append(last_id)
+            else:
+                where += (
+                    f" AND (published_ts IS NULL OR published_ts {op} ?"
+                    f" OR (published_ts = ? AND id {op} ?))"
+                )
+                params.extend([last_ts, last_ts, last_id])
+
+        sql = (
+            f"SELECT id, published_ts, data FROM articles WHERE {where} "
+            f"ORDER BY published_ts IS NULL, published_ts {direction}, id {direction} LIMIT ?"
+        )
+        params.append(limit)
+
+        return [
+            ((row["published_ts"], row["id"]), json.loads(row["data"]))
+            for row in self.conn.execute(sql, params)
+        ]
+
+    def scan_inserted(
+        self,
+        after_rowid: int,
+        processed: bool = True,
+        category: Optional[str] = None,
+        limit: int = 100
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """
+        Get articles inserted after a rowid, in insertion order
+
+        Rowids only grow, so a reader can follow new articles by passing the
+        last rowid it has seen. Updates of stored articles keep their rowid.
+
+        Args:
+            after_rowid: Last rowid already returned (see max_rowid())
+            processed: Scan processed (True) or raw (False) articles
+            category: Filter by category
+            limit: Maximum number of articles to return
+
+        Returns:
+            List of (rowid, article) tuples
+        """
+        where, params = self._build_filters(processed, category, None, None, None)
+        rows = self.conn.execute(
+            f"SELECT rowid, data FROM articles WHERE rowid > ? AND {where} ORDER BY rowid LIMIT ?",
+            [after_rowid, *params, limit]
+        )
+        return [(row["rowid"], json.loads(row["data"])) for row in rows]
+
+    def max_rowid(self) -> int:
+        """Rowid of the most recently inserted article (0 if empty)"""
+        return self.conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM articles").fetchone()[0]
+
+    def count(
+        self,
+        processed: bool = True,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        after_date: Optional[datetime] = None
+    ) -> int:
+        """
+        Count articles matching the given filters
+
+        Returns:
+            Number of matching articles
+        """
+        where, params = self._build_filters(processed, category, source, language, after_date)
+        row = self.conn.execute(f"SELECT COUNT(*) FROM articles WHERE {where}", params).fetchone()
+        return row[0]
+
+    def get_counts(self) -> dict[str, dict[str, int]]:
+        """
+        Read the rolling per-dimension counts of processed articles
+
+        Returns:
+            Dictionary mapping dimension ('category', 'source', 'language') to value counts
+        """
+        counts: dict[str, dict[str, int]] = {"category": {}, "source": {}, "language": {}}
+
+        for row in self.conn.execute("SELECT dimension, value, count FROM article_stats WHERE count > 0"):
+            counts.setdefault(row["dimension"], {})[row["value"]] = row["count"]
+
+        return counts
+
+    def get_date_range(self) -> tuple[Optional[str], Optional[str]]:
+        """
+        Get the publish dates of the oldest and newest processed articles
+
+        Both ends are single seeks on the published_at index.
+
+        Returns:
+            Tuple of (oldest, newest) published_at strings
+        """
+        oldest = self.conn.execute(
+            "SELECT published_at FROM articles WHERE processed = 1 AND published_ts IS NOT NULL "
+            "ORDER BY published_ts ASC LIMIT 1"
+        ).fetchone()
+        newest = self.conn.execute(
+            "SELECT published_at FROM articles WHERE processed = 1 AND published_ts IS NOT NULL "
+            "ORDER BY published_ts DESC LIMIT 1"
+        ).fetchone()
+
+        return (
+            oldest["published_at"] if oldest else None,
+            newest["published_at"] if newest else None
+        )
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        limit: Optional[int] = 20,
+        offset: int = 0
+    ) -> list[tuple[dict[str, Any], float]]:
+        """
+        Full-text search over processed articles, best match first
+
+        Args:
+            query: FTS5 MATCH expression (see match_expression())
+            category: Filter by category
+            source: Filter by source
+            language: Filter by language
+            after_date: Only return articles published after this date
+            limit: Maximum number of articles to return (None for all)
+            offset: Number of matching articles to skip
+
+        Returns:
+            List of (article, score) tuples; higher scores are better matches
+        """
+        where, params = self._build_filters(True, category, source, language, after_date)
+        weights = ", ".join(str(weight) for weight in SEARCH_WEIGHTS)
+
+        sql = (
+            f"SELECT articles.data, bm25(article_search, {weights}) AS score "
+            "FROM article_search JOIN articles ON articles.rowid = article_search.rowid "
+            f"WHERE article_search MATCH ? AND {where} "
+            "ORDER BY score"
+        )
+        params.insert(0, query)
+
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit if limit is not None else -1, max(0, offset)])
+
+        return [(json.loads(row["data"]), -row["score"]) for row in self.conn.execute(sql, params)]
+
+    def search_count(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        after_date: Optional[datetime] = None
+    ) -> int:
+        """
+        Count processed articles matching a full-text query
+
+        Args:
+            query: FTS5 MATCH expression (see match_expression())
+
+        Returns:
+            Number of matching articles
+        """
+        where, params = self._build_filters(True, category, source, language, after_date)
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM article_search JOIN articles ON articles.rowid = article_search.rowid "
+            f"WHERE article_search MATCH ? AND {where}",
+            [query, *params]
+        ).fetchone()
+        return row[0]
+
+    def search_mentions(
+        self,
+        queries: list[str],
+        category: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None
+    ) -> list[tuple[int, int, str, float]]:
+        """
+        Find the processed articles matching each of several full-text queries
+
+        All queries run in one statement; article bodies are not read.
+
+        Args:
+            queries: FTS5 MATCH expressions (see match_expression())
+            category: Filter by category
+            after_date: Only articles published at or after this date
+            before_date: Only articles published before this date
+
+        Returns:
+            List of (query index, article rowid, article ID, published timestamp)
+            tuples, newest first within each query
+        """
+        if not queries:
+            return []
+
+        where, params = self._build_filters(True, category, None, None, after_date)
+        where += " AND published_ts IS NOT NULL"
+
+        if before_date:
+            where += " AND published_ts < ?"
+            params.append(before_date.timestamp())
+
+        values = ", ".join("(?, ?)" for _ in queries)
+        query_params = [value for i, query in enumerate(queries) for value in (i, query)]
+
+        # CROSS JOIN keeps the index lookup per query first; otherwise the
+        # planner may scan the articles and probe the index for each one
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
+            f"""
+            WITH queries (position, expression) AS (VALUES {values})
+            SELECT queries.position, articles.rowid, articles.id, articles.published_ts
+            FROM queries
+            CROSS JOIN article_search
+            CROSS JOIN articles ON articles.rowid = article_search.rowid
+            WHERE article_search MATCH queries.expression AND {where}
+            ORDER BY queries.position, articles.published_ts DESC
+            """,
+            [*query_params, *params]
+        ).fetchall()
+
+    def article_sentiment(self, rowids: list[int]) -> dict[int, tuple[Optional[dict[str, Any]], str]]:
+        """
+        Get the stored sentiment of articles without decoding them
+
+        Args:
+            rowids: Article rowids (e.g. from search_mentions())
+
+        Returns:
+            Dictionary mapping rowid to (stored sentiment or None, "title description")
+        """
+        found: dict[int, tuple[Optional[dict[str, Any]], str]] = {}
+        ids = list(dict.fromkeys(rowids))
+
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            rows = self.conn.execute(
+                "SELECT rowid, json_extract(data, '$.sentiment') AS sentiment, "
+                "COALESCE(json_extract(data, '$.title'), '') || ' ' || "
+                "COALESCE(json_extract(data, '$.description'), '') AS text "
+                f"FROM articles WHERE rowid IN ({', '.join('?' for _ in chunk)})",
+                chunk
+            )
+            for row in rows:
+                sentiment = json.loads(row["sentiment"]) if row["sentiment"] else None
+                found[row["rowid"]] = (sentiment if isinstance(sentiment, dict) else None, row["text"])
+
+        return found
+
+    def get_cached_sentiment(self, content_hashes: list[str], model: str) -> dict[str, dict[str, Any]]:
+        """
+        Look up cached sentiment scores
+
+        Args:
+            content_hashes: Hashes of the scored texts
+            model: Sentiment backend name
+
+        Returns:
+            Dictionary mapping content hash to scores, for the hashes found
+        """
+        found: dict[str, dict[str, Any]] = {}
+        keys = list(dict.fromkeys(content_hashes))
+
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            rows = self.conn.execute(
+                "SELECT content_hash, scores FROM sentiment_cache "
+                f"WHERE model = ? AND content_hash IN ({', '.join('?' for _ in chunk)})",
+                [model, *chunk]
+            )
+            found.update((row["content_hash"], json.loads(row["scores"])) for row in rows)
+
+        return found
+
+    def cache_sentiment(self, entries: list[tuple[str, dict[str, Any]]], model: str) -> None:
+        """
+        Store sentiment scores by content hash
+
+        Args:
+            entries: (content hash, scores) pairs
+            model: Sentiment backend name
+        """
+        now = datetime.now().timestamp()
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO sentiment_cache (content_hash, model, scores, cached_ts) VALUES (?, ?, ?, ?)",
+                [(content_hash, model, json.dumps(scores), now) for content_hash, scores in entries]
+            )
+
+    def prune_sentiment_cache(self, before_ts: float) -> int:
+        """
+        Delete sentiment scores cached before a time
+
+        Args:
+            before_ts: Cutoff timestamp
+
+        Returns:
+            Number of cached scores deleted
+        """
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM sentiment_cache WHERE cached_ts < ?", (before_ts,))
+        return cursor.rowcount
+
+    def rebuild_search_index(self) -> None:
+        """Rebuild the full-text index from the articles table (first use and repair path)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM article_search")
+            self.conn.execute(
+                """
+                INSERT INTO article_search (rowid, title, description, content, keywords)
+                SELECT
+                    rowid,
+                    COALESCE(json_extract(data, '$.title'), ''),
+                    COALESCE(json_extract(data, '$.description'), ''),
+                    COALESCE(json_extract(data, '$.content'), ''),
+                    COALESCE((SELECT group_concat(value, ' ') FROM json_each(data, '$.keywords')), '')
+                FROM articles WHERE processed = 1
+                """
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('search_initialized', ?)",
+                (datetime.now().isoformat(),)
+            )
+
+    def topic_counts(
+        self,
+        granularity: str,
+        start_bucket: int,
+        end_bucket: int,
+        category: Optional[str] = None,
+        topic_ids: Optional[list[int]] = None
+    ) -> list[tuple[int, int, int]]:
+        """
+        Read topic mention buckets
+
+        This is a primary-key range scan; rows of different categories are
+        returned separately and summed by the caller.
+
+        Args:
+            granularity: "h" (hourly) or "d" (daily) buckets
+            start_bucket: First bucket (inclusive)
+            end_bucket: Last bucket (inclusive)
+            category: Only count mentions in this category
+            topic_ids: Only these topics
+
+        Returns:
+            List of (topic_id, bucket, count) tuples with non-zero counts
+        """
+        clauses = ["granularity = ?", "bucket BETWEEN ? AND ?", "count > 0"]
+        params: list[Any] = [granularity, start_bucket, end_bucket]
+
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+
+        if topic_ids is not None:
+            if not topic_ids:
+                return []
+            clauses.append(f"topic_id IN ({', '.join('?' for _ in topic_ids)})")
+            params.extend(topic_ids)
+
+        # Plain tuples: this can return many rows
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
+            f"SELECT topic_id, bucket, count FROM topic_counts WHERE {' AND '.join(clauses)}",
+            params
+        ).fetchall()
+
+    def topic_ids(self, topics: list[str]) -> dict[str, int]:
+        """
+        Look up the IDs of topics
+
+        Args:
+            topics: Topics (matched lowercased)
+
+        Returns:
+            Dictionary mapping each known topic to its ID
+        """
+        found: dict[str, int] = {}
+        keys = list(dict.fromkeys(topic.lower().strip() for topic in topics))
+
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT id, topic FROM topics WHERE topic IN ({', '.join('?' for _ in chunk)})", chunk
+            )
+            found.update((row["topic"], row["id"]) for row in rows)
+
+        return found
+
+    def topic_names(self, topic_ids: list[int]) -> dict[int, str]:
+        """
+        Look up topics by ID
+
+        Args:
+            topic_ids: Topic IDs
+
+        Returns:
+            Dictionary mapping topic ID to topic
+        """
+        found: dict[int, str] = {}
+        ids = list(dict.fromkeys(topic_ids))
+
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT id, topic FROM topics WHERE id IN ({', '.join('?' for _ in chunk)})", chunk
+            )
+            found.update((row["id"], row["topic"]) for row in rows)
+
+        return found
+
+    def topic_facets(self, topic_ids: list[int], since_ts: Optional[float] = None) -> dict[int, dict[str, list[str]]]:
+        """
+        Get the categories and sources topics were mentioned in
+
+        Args:
+            topic_ids: Topic IDs
+            since_ts: Only mentions published at or after this timestamp
+
+        Returns:
+            Dictionary mapping topic ID to {"categories": [...], "sources": [...]},
+            most frequent first
+        """
+        facets = {topic_id: {"categories": [], "sources": []} for topic_id in topic_ids}
+        if not topic_ids:
+            return facets
+
+        where = f"topic_id IN ({', '.join('?' for _ in topic_ids)})"
+        params: list[Any] = list(topic_ids)
+
+        if since_ts is not None:
+            where += " AND published_ts >= ?"
+            params.append(since_ts)
+
+        for key, column in [("categories", "category"), ("sources", "source")]:
+            rows = self.conn.execute(
+                f"SELECT topic_id, {column} AS value, COUNT(*) AS mentions FROM article_topics "
+                f"WHERE {where} GROUP BY topic_id, {column} ORDER BY mentions DESC",
+                params
+            )
+            for row in rows:
+                facets[row["topic_id"]][key].append(row["value"])
+
+        return facets
+
+    def topic_articles(
+        self,
+        topic_ids: list[int],
+        since_ts: Optional[float] = None,
+        category: Optional[str] = None,
+        per_topic: int = 10
+    ) -> dict[int, list[str]]:
+        """
+        Get the IDs of the newest articles mentioning each topic
+
+        Args:
+            topic_ids: Topic IDs
+            since_ts: Only articles published at or after this timestamp
+            category: Only articles in this category
+            per_topic: Article IDs returned per topic
+
+        Returns:
+            Dictionary mapping topic ID to article IDs, newest first
+        """
+        found: dict[int, list[str]] = {topic_id: [] for topic_id in topic_ids}
+        if not topic_ids:
+            return found
+
+        clauses = [f"t.topic_id IN ({', '.join('?' for _ in topic_ids)})"]
+        params: list[Any] = list(topic_ids)
+
+        if since_ts is not None:
+            clauses.append("t.published_ts >= ?")
+            params.append(since_ts)
+
+        if category:
+            clauses.append("t.category = ?")
+            params.append(category)
+
+        rows = self.conn.execute(
+            f"""
+            SELECT topic_id, id FROM (
+                SELECT t.topic_id, a.id,
+                    ROW_NUMBER() OVER (PARTITION BY t.topic_id ORDER BY t.published_ts DESC) AS position
+                FROM article_topics t JOIN articles a ON a.rowid = t.article_rowid
+                WHERE {' AND '.join(clauses)}
+            ) WHERE position <= ?
+            ORDER BY topic_id, position
+            """,
+            [*params, per_topic]
+        )
+
+        for row in rows:
+            found[row["topic_id"]].append(row["id"])
+
+        return found
+
+    def prune_topic_counts(self, hourly_before: int, daily_before: int) -> None:
+        """
+        Drop expired topic buckets
+
+        Hourly buckets are only kept for recent windows; daily buckets cover
+        long ones. Buckets emptied by deletions are removed by the triggers.
+
+        Args:
+            hourly_before: Delete hourly buckets older than this bucket
+            daily_before: Delete daily buckets older than this bucket
+        """
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM topic_counts WHERE granularity = ? AND bucket < ?",
+                [("h", hourly_before), ("d", daily_before)]
+            )
+
+    def rebuild_topic_counts(self) -> None:
+        """Rebuild topic rows and counters from the articles table (first use and repair path)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM article_topics")
+            self.conn.execute("DELETE FROM topic_counts")
+            self.conn.execute(
+                """
+                INSERT OR IGNORE INTO topics (topic)
+                SELECT lower(trim(keyword.value))
+                FROM articles, json_each(articles.data, '$.keywords') AS keyword
+                WHERE processed = 1 AND keyword.type = 'text' AND length(trim(keyword.value)) >= 3
+                """
+            )
+            self.conn.execute(
+                """
+                INSERT OR IGNORE INTO article_topics (article_rowid, topic_id, category, source, published_ts)
+                SELECT articles.rowid, topics.id, COALESCE(category, 'general'),
+                    COALESCE(source_name, 'Unknown'), published_ts
+                FROM articles, json_each(articles.data, '$.keywords') AS keyword
+                JOIN topics ON topics.topic = lower(trim(keyword.value))
+                WHERE processed = 1 AND keyword.type = 'text'
+                """
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('topics_initialized', ?)",
+                (datetime.now().isoformat(),)
+            )
+
+    def backfill_published_ts(self) -> None:
+        """Fill in publish timestamps of articles whose dates were stored unparsed (e.g. RFC 822)"""
+        rows = self.conn.execute(
+            "SELECT rowid, published_at FROM articles WHERE published_ts IS NULL AND published_at IS NOT NULL"
+        ).fetchall()
+        updates = [
+            (published_ts, row["rowid"])
+            for row in rows
+            if (published_ts := self._to_timestamp(row["published_at"])) is not None
+        ]
+
+        with self.conn:
+            # Touching data re-runs the topic triggers, so the counters pick up the new timestamps
+            self.conn.executemany("UPDATE articles SET published_ts = ?, data = data WHERE rowid = ?", updates)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('rfc822_dates_backfilled', ?)",
+                (datetime.now().isoformat(),)
+            )
+
+    def recompute_stats(self) -> None:
+        """Rebuild the rolling counts from the articles table (repair path)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM article_stats")
+            for dimension, column, default in [
+                ("category", "category", "general"),
+                ("source", "source_name", "Unknown"),
+                ("language", "language", "en"),
+            ]:
+                self.conn.execute(
+                    f"""
+                    INSERT INTO article_stats (dimension, value, count)
+                    SELECT ?, COALESCE({column}, ?), COUNT(*) FROM articles
+                    WHERE processed = 1 GROUP BY COALESCE({column}, ?)
+                    """,
+                    (dimension, default, default)
+                )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('stats_initialized', ?)",
+                (datetime.now().isoformat(),)
+            )
+
+    def upsert_signatures(
+        self,
+        signatures: list[tuple[str, Optional[str], str, list[str]]]
+    ) -> None:
+        """
+        Store dedup signatures of processed articles
+
+        Args:
+            signatures: List of (article_id, url_hash, title_fingerprint, band_keys)
+        """
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM dedup_bands WHERE article_id = ?",
+                [(article_id,) for article_id, _, _, _ in signatures]
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO dedup_signatures (article_id, url_hash, title) VALUES (?, ?, ?)",
+                [(article_id, url, title) for article_id, url, title, _ in signatures]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO dedup_bands (band_key, article_id) VALUES (?, ?)",
+                [
+                    (key, article_id)
+                    for article_id, _, _, band_keys in signatures
+                    for key in band_keys
+                ]
+            )
+
+    def find_url_hashes(self, url_hashes: list[str]) -> set[str]:
+        """
+        Find which URL hashes belong to stored articles
+
+        Args:
+            url_hashes: URL hashes to look up
+
+        Returns:
+            Subset of url_hashes already stored
+        """
+        found = set()
+        unique = list(set(url_hashes))
+
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT url_hash FROM dedup_signatures WHERE url_hash IN ({placeholders})",
+                chunk
+            )
+            found.update(row["url_hash"] for row in rows)
+
+        return found
+
+    def find_band_matches(self, band_keys: list[str]) -> dict[str, list[tuple[str, str]]]:
+        """
+        Find stored articles sharing LSH band keys
+
+        Args:
+            band_keys: Band keys to look up
+
+        Returns:
+            Dictionary mapping band key to (article_id, title_fingerprint) pairs
+        """
+        matches: dict[str, list[tuple[str, str]]] = {}
+        unique = list(set(band_keys))
+
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"""
+                SELECT b.band_key, s.article_id, s.title
+                FROM dedup_bands b JOIN dedup_signatures s ON s.article_id = b.article_id
+                WHERE b.band_key IN ({placeholders})
+                """,
+                chunk
+            )
+            for row in rows:
+                matches.setdefault(row["band_key"], []).append((row["article_id"], row["title"]))
+
+        return matches
+
+    def clear_signatures(self) -> None:
+        """Remove all dedup signatures"""
+        with self.conn:
+            self.conn.execute("DELETE FROM dedup_bands")
+            self.conn.execute("DELETE FROM dedup_signatures")
+
+    def delete_batch_files(self, batch_files: list[str]) -> int:
+        """
+        Delete all articles whose latest copy lives in one of the given files
+
+        Args:
+            batch_files: Batch file paths that were removed from disk
+
+        Returns:
+            Number of rows deleted
+        """
+        if not batch_files:
+            return 0
+
+        with self.conn:
+            cursor = self.conn.executemany(
+                "DELETE FROM articles WHERE batch_file = ?",
+                [(f,) for f in batch_files]
+            )
+
+        return cursor.rowcount
+
+    def compact(self) -> None:
+        """Checkpoint the write-ahead log and reclaim space freed by deletions"""
+        self.conn.execute("INSERT INTO article_search (article_search) VALUES ('optimize')")
+        self.conn.commit()
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.conn.execute("VACUUM")
+
+    def clear(self) -> None:
+        """Remove all articles from the store"""
+        with self.conn:
+            self.conn.execute("DELETE FROM articles")
+
+    def iter_all(self, processed: bool = True, batch_size: int = 500):
+        """
+        Iterate over all stored articles in batches, in no particular order
+
+        Args:
+            processed: Iterate processed (True) or raw (False) articles
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Lists of article dictionaries
+        """
+        cursor = self.conn.execute(
+            "SELECT data FROM articles WHERE processed = ?", (int(processed),)
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield [json.loads(row["data"]) for row in rows]
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a value from the store metadata table"""
+        row = self.conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Write a value to the store metadata table"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)",
+                (key, value)
+            )
+
+    def _build_filters(
+        self,
+        processed: bool,
+        category: Optional[str],
+        source: Optional[str],
+        language: Optional[str],
+        after_date: Optional[datetime]
+    ) -> tuple[str, list[Any]]:
+        """Build the WHERE clause and parameters for a filtered query"""
+        clauses = ["processed = ?"]
+        params: list[Any] = [int(processed)]
+
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+
+        if language:
+            clauses.append("language = ?")
+            params.append(language)
+
+        if after_date:
+            clauses.append("published_ts >= ?")
+            params.append(after_date.timestamp())
+
+        return " AND ".join(clauses), params
+
+    def _to_row(
+        self,
+        article: dict[str, Any],
+        processed: bool,
+        batch_file: Optional[str]
+    ) -> tuple:
+        """Convert an article dictionary to a table row"""
+        published_at = article.get("published_at")
+
+        return (
+            article.get("id"),
+            int(processed),
+            article.get("category"),
+            article.get("source"),
+            article.get("source_name"),
+            article.get("language"),
+            published_at,
+            self._to_timestamp(published_at),
+            batch_file,
+            json.dumps(article, ensure_ascii=False)
+        )
+
+    @staticmethod
+    def _to_timestamp(date_str: Optional[str]) -> Optional[float]:
+        """
+        Convert an ISO 8601 or RFC 822 (RSS) date string to a POSIX timestamp
+
+        Naive ISO datetimes are interpreted as local time, matching
+        datetime.now() which callers use to build after_date cutoffs; RFC 822
+        dates without a zone ("-0000") are UTC.
+        """
+        if not date_str or not isinstance(date_str, str):
+            return None
+
+        try:
+            return datetime.fromisoformat(date_str.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+
+        try:
+            published = parsedate_to_datetime(date_str)
+        except (TypeError, ValueError):
+            return None
+
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        return published.timestamp()
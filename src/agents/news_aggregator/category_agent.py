@@ -2,14 +2,20 @@
 """
 CategoryAgent - Auto-categorizes news articles
 
-Uses keywords, content analysis, and ML classification to assign categories
+Uses keywords, content analysis, and ML classification to assign categories.
+The "classifier" backend uses a hashed n-gram linear model trained from the
+stored articles (scripts/train_category_model.py) and falls back to keyword
+scoring for low-confidence predictions.
 """
 
-from typing import Any
-import re
+from pathlib import Path
+from typing import Any, Optional
 
 from src.core.logging import get_logger
 
+from .keyword_matcher import KeywordMatcher
+from .text_classifier import load_classifier
+
 
 class CategoryAgent:
     """Agent for categorizing news articles"""
@@ -58,6 +64,13 @@ class CategoryAgent:
         ],
     }
 
+    # Bumped by add_custom_keywords so compiled matchers are rebuilt
+    _keywords_version = 0
+    _matchers: dict[tuple, KeywordMatcher] = {}
+
+    # Loaded classifier models by path, with the file mtime they were loaded at
+    _classifiers: dict[str, tuple[float, Any]] = {}
+
     def __init__(self, config: dict[str, Any]):
         """
         Initialize category agent
@@ -72,6 +85,13 @@ class CategoryAgent:
         # Available categories
         self.categories = self.news_config.get("categories", list(self.CATEGORY_KEYWORDS.keys()))
 
+        # Categorization backend: keywords or classifier
+        self.categorization_config = self.news_config.get("categorization", {})
+        self.backend = self.categorization_config.get("backend", "keywords")
+        self.min_confidence = self.categorization_config.get("min_confidence", 0.5)
+        base_dir = Path(self.news_config.get("storage", {}).get("base_dir", "./data/news"))
+        self.model_path = Path(self.categorization_config.get("model_path", base_dir / "category_model.joblib"))
+
         self.logger.info(f"CategoryAgent initialized with {len(self.categories)} categories")
 
     async def categorize_article(self, article: dict[str, Any]) -> str:
@@ -89,43 +109,146 @@ class CategoryAgent:
         if existing_category in self.categories and existing_category != "general":
             return existing_category
 
-        # Build text for analysis
+        text = self._article_text(article)
+
+        if not text:
+            return "general"
+
+        category = self.categorize_texts([text])[0]
+        self.logger.debug(f"Article '{article.get('title', '')[:50]}' -> {category}")
+        return category
+
+    def categorize_texts(self, texts: list[str]) -> list[str]:
+        """
+        Categorize many texts with batched inference
+
+        With the classifier backend, the whole batch is classified with one
+        sparse matrix product; predictions below min_confidence (or outside
+        the configured categories) go to the keyword scorer instead.
+
+        Args:
+            texts: Lowercased article texts (see _article_text)
+
+        Returns:
+            Category name per text ("general" when nothing matches)
+        """
+        categories: list[Optional[str]] = [None] * len(texts)
+
+        classifier = self._get_classifier() if self.backend == "classifier" else None
+        if classifier is not None:
+            labels, confidences = classifier.predict(texts)
+            for i, (label, confidence) in enumerate(zip(labels, confidences)):
+                if texts[i] and confidence >= self.min_confidence and label in self.categories:
+                    categories[i] = label
+
+        remaining = [i for i, category in enumerate(categories) if category is None]
+        if remaining:
+            keyword_categories = self._keyword_categories([texts[i] for i in remaining])
+            for i, category in zip(remaining, keyword_categories):
+                categories[i] = category
+
+        return categories
+
+    def _keyword_categories(self, texts: list[str]) -> list[str]:
+        """
+        Categorize texts by keyword scoring in one vectorized pass
+
+        Args:
+            texts: Lowercased article texts
+
+        Returns:
+            Category name per text ("general" when no keyword matches)
+        """
+        matcher = self._get_matcher()
+        categories = []
+
+        for text, scores in zip(texts, matcher.score_batch(texts)):
+            best_category, best_score = self._best_category(matcher, scores)
+            categories.append(best_category if text and best_score > 0 else "general")
+
+        return categories
+
+    def _get_classifier(self) -> Any:
+        """
+        Get the trained classifier, reloading it when the model file changes
+
+        Returns:
+            Classifier, or None if no model has been trained
+        """
+        key = str(self.model_path.resolve())
+
+        try:
+            mtime = self.model_path.stat().st_mtime
+        except OSError:
+            return None
+
+        cached = CategoryAgent._classifiers.get(key)
+        if cached is None or cached[0] != mtime:
+            classifier = load_classifier(self.model_path)
+            if classifier is None:
+                return None
+            CategoryAgent._classifiers[key] = (mtime, classifier)
+            self.logger.info(f"Loaded category classifier from {self.model_path}")
+
+        return CategoryAgent._classifiers[key][1]
+
+    def _article_text(self, article: dict[str, Any]) -> str:
+        """
+        Build the lowercased text an article is categorized by
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Title, description and the first 500 characters of content
+        """
         text_parts = [
             article.get("title", ""),
             article.get("description", ""),
-            article.get("content", "")[:500],  # First 500 chars of content
+            (article.get("content") or "")[:500],  # First 500 chars of content
         ]
-        text = " ".join(filter(None, text_parts)).lower()
+        return " ".join(filter(None, text_parts)).lower()
 
-        if not text:
-            return "general"
+    def _best_category(self, matcher: KeywordMatcher, scores: list[int]) -> tuple[str, int]:
+        """
+        Pick the highest scoring category (the first one on ties)
 
-        # Score each category
-        category_scores = {}
+        Args:
+            matcher: Matcher the scores come from
+            scores: Score per matcher category
 
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if category not in self.categories:
-                continue
+        Returns:
+            Tuple of (category, score), or ("general", 0) without categories
+        """
+        if not scores:
+            return "general", 0
+
+        best = max(range(len(scores)), key=lambda c: scores[c])
+        return matcher.categories[best], scores[best]
 
-            score = 0
-            for keyword in keywords:
-                # Count keyword occurrences (with word boundaries)
-                pattern = r"\b" + re.escape(keyword) + r"\b"
-                matches = len(re.findall(pattern, text, re.IGNORECASE))
-                score += matches
+    def _get_matcher(self) -> KeywordMatcher:
+        """
+        Get the compiled matcher for the active categories
 
-            category_scores[category] = score
+        Matchers are cached per keyword version and category set, so they
+        are compiled once and rebuilt only after add_custom_keywords.
 
-        # Find best matching category
-        if category_scores:
-            best_category = max(category_scores.items(), key=lambda x: x[1])
+        Returns:
+            KeywordMatcher instance
+        """
+        active = tuple(category for category in self.CATEGORY_KEYWORDS if category in self.categories)
+        key = (CategoryAgent._keywords_version, active)
 
-            if best_category[1] > 0:  # At least one keyword match
-                self.logger.debug(f"Article '{article.get('title', '')[:50]}' -> {best_category[0]} (score: {best_category[1]})")
-                return best_category[0]
+        matcher = CategoryAgent._matchers.get(key)
+        if matcher is None:
+            matcher = KeywordMatcher({category: self.CATEGORY_KEYWORDS[category] for category in active})
+            # Drop matchers compiled before the last keyword change
+            CategoryAgent._matchers = {
+                k: m for k, m in CategoryAgent._matchers.items() if k[0] == key[0]
+            }
+            CategoryAgent._matchers[key] = matcher
 
-        # Default to general if no match
-        return "general"
+        return matcher
 
     async def categorize_batch(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
@@ -142,8 +265,19 @@ class CategoryAgent:
         categorized = []
         category_counts = {}
 
-        for article in articles:
-            category = await self.categorize_article(article)
+        # Articles that already carry a valid category keep it; the rest are scored together
+        to_score = [
+            i for i, article in enumerate(articles)
+            if article.get("category", "general") not in self.categories
+            or article.get("category", "general") == "general"
+        ]
+        scored = dict(zip(
+            to_score,
+            self.categorize_texts([self._article_text(articles[i]) for i in to_score])
+        ))
+
+        for i, article in enumerate(articles):
+            category = scored.get(i, article.get("category"))
             article["category"] = category
 
             # Track category distribution
@@ -169,13 +303,10 @@ class CategoryAgent:
         self.logger.info("Forcing recategorization of all articles...")
 
         recategorized = []
+        new_categories = self.categorize_texts([self._article_text(article) for article in articles])
 
-        for article in articles:
-            # Temporarily remove category to force re-analysis
+        for article, new_category in zip(articles, new_categories):
             original_category = article.get("category")
-            article["category"] = "general"
-
-            new_category = await self.categorize_article(article)
             article["category"] = new_category
 
             if new_category != original_category:
@@ -240,4 +371,5 @@ class CategoryAgent:
             self.CATEGORY_KEYWORDS[category] = []
 
         self.CATEGORY_KEYWORDS[category].extend(keywords)
+        CategoryAgent._keywords_version += 1
         self.logger.info(f"Added {len(keywords)} custom keywords to category '{category}'")
@@ -2,16 +2,46 @@
 """
 ContentParserAgent - Cleans and structures raw news articles
 
-Extracts metadata, cleans HTML, detects language, and formats articles
+Extracts metadata, cleans HTML, detects language, and formats articles.
+Batches are split into chunks and parsed in a worker pool, since every step
+is CPU-bound.
 """
 
+import asyncio
 import re
+import threading
 from datetime import datetime
-from typing import Any
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator
 from pathlib import Path
 
 from src.core.logging import get_logger
 
+from .worker_pool import get_executor, resolve_workers
+
+# Parser instance reused by each pool worker across chunks
+_WORKER_PARSER = None
+
+
+def _parse_chunk(config: dict[str, Any], raw_articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Parse a chunk of articles inside a pool worker
+
+    Args:
+        config: Complete configuration dictionary
+        raw_articles: Raw article dictionaries
+
+    Returns:
+        Parsed articles, in input order
+    """
+    global _WORKER_PARSER
+
+    if _WORKER_PARSER is None or _WORKER_PARSER.config != config:
+        _WORKER_PARSER = ContentParserAgent(config)
+
+    # Keywords are extracted afterwards for the whole chunk against the corpus model
+    return [_WORKER_PARSER.parse_article_sync(article, with_keywords=False) for article in raw_articles]
+
 
 class ContentParserAgent:
     """Agent for parsing and cleaning news content"""
@@ -34,6 +64,17 @@ class ContentParserAgent:
         self.generate_summary = self.processing_config.get("generate_summary", True)
         self.detect_language = self.processing_config.get("detect_language", True)
 
+        # Parallel batch parsing
+        self.parse_executor = self.processing_config.get("parse_executor", "process")
+        self.parse_workers = self.processing_config.get("parse_workers", 0)
+        self.parse_chunk_size = self.processing_config.get("parse_chunk_size", 50)
+
+        # Corpus keyword model, loaded on first use
+        self.keywords_config = self.processing_config.get("keywords", {})
+        self.max_keywords = self.keywords_config.get("max_keywords", 10)
+        self._keyword_model = None
+        self._keyword_lock = threading.Lock()
+
         self.logger.info("ContentParserAgent initialized")
 
     async def parse_article(self, raw_article: dict[str, Any]) -> dict[str, Any]:
@@ -43,6 +84,19 @@ class ContentParserAgent:
         Args:
             raw_article: Raw article dictionary
 
+        Returns:
+            Cleaned and structured article
+        """
+        return await asyncio.to_thread(self.parse_article_sync, raw_article)
+
+    def parse_article_sync(self, raw_article: dict[str, Any], with_keywords: bool = True) -> dict[str, Any]:
+        """
+        Parse and clean a single article on the calling thread
+
+        Args:
+            raw_article: Raw article dictionary
+            with_keywords: Extract keywords (batch callers do it per chunk instead)
+
         Returns:
             Cleaned and structured article
         """
@@ -54,7 +108,7 @@ class ContentParserAgent:
             # Detect language if enabled
             detected_lang = raw_article.get("language", "en")
             if self.detect_language and cleaned_content:
-                detected_lang = await self._detect_language(cleaned_content)
+                detected_lang = self._detect_language(cleaned_content)
 
             # Build parsed article
             parsed = {
@@ -78,14 +132,14 @@ class ContentParserAgent:
             }
 
             # Extract metadata if enabled
-            if self.extract_keywords and cleaned_content:
-                parsed["keywords"] = await self._extract_keywords(cleaned_content)
+            if with_keywords and self.extract_keywords and cleaned_content:
+                parsed["keywords"] = self._extract_keywords(cleaned_content, self.max_keywords)
 
             if self.extract_entities and cleaned_content:
-                parsed["entities"] = await self._extract_entities(cleaned_content)
+                parsed["entities"] = self._extract_entities(cleaned_content)
 
             if self.generate_summary and cleaned_content:
-                parsed["summary"] = await self._generate_summary(cleaned_content)
+                parsed["summary"] = self._generate_summary(cleaned_content)
 
             return parsed
 
@@ -105,15 +159,88 @@ class ContentParserAgent:
         """
         self.logger.info(f"Parsing {len(raw_articles)} articles...")
 
-        parsed_articles = []
-        for article in raw_articles:
-            parsed = await self.parse_article(article)
-            if parsed:
-                parsed_articles.append(parsed)
+        parsed_articles = [parsed async for parsed in self.parse_stream(raw_articles)]
+        await asyncio.to_thread(self.save_keyword_model)
 
         self.logger.info(f"Successfully parsed {len(parsed_articles)} articles")
         return parsed_articles
 
+    async def parse_stream(self, raw_articles: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+        """
+        Parse articles in a worker pool and yield results in input order
+
+        Articles are sent to the pool in chunks of parse_chunk_size; a
+        bounded number of chunks is in flight at a time, so results stream
+        back while later chunks are still being parsed. The keyword model is
+        updated in memory; callers persist it with save_keyword_model().
+
+        Args:
+            raw_articles: List of raw article dictionaries
+
+        Yields:
+            Parsed articles
+        """
+        if not raw_articles:
+            return
+
+        loop = asyncio.get_running_loop()
+        executor = get_executor(self.parse_executor, self.parse_workers)
+        max_in_flight = 2 * resolve_workers(self.parse_workers)
+
+        chunk_size = max(1, self.parse_chunk_size)
+        chunks = [raw_articles[i:i + chunk_size] for i in range(0, len(raw_articles), chunk_size)]
+
+        pending: list[asyncio.Future] = []
+        next_chunk = 0
+
+        try:
+            while next_chunk < len(chunks) or pending:
+                while next_chunk < len(chunks) and len(pending) < max_in_flight:
+                    pending.append(loop.run_in_executor(executor, _parse_chunk, self.config, chunks[next_chunk]))
+                    next_chunk += 1
+
+                chunk = [parsed for parsed in await pending.pop(0) if parsed]
+
+                if self.extract_keywords:
+                    await asyncio.to_thread(self._add_keywords, chunk)
+
+                for parsed in chunk:
+                    yield parsed
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def ensure_keyword_model(self, storage: Any, batch_size: int = 500) -> None:
+        """
+        Seed an empty keyword model from the stored corpus
+
+        Args:
+            storage: NewsStorage instance
+            batch_size: Articles folded into the model per step
+        """
+        if not self.extract_keywords:
+            return
+
+        model = self._get_keyword_model()
+        if model is None or model.n_docs:
+            return
+
+        self.logger.info("Building keyword model from stored articles...")
+
+        texts = []
+        async for article in storage.iter_articles(processed=True, batch_size=batch_size):
+            if article.get("content"):
+                texts.append(article["content"])
+            if len(texts) >= batch_size:
+                await asyncio.to_thread(self._update_keyword_model, texts)
+                texts = []
+
+        if texts:
+            await asyncio.to_thread(self._update_keyword_model, texts)
+
+        self.save_keyword_model()
+        self.logger.info(f"Keyword model built from {model.n_docs} articles ({len(model)} terms)")
+
     def _clean_html(self, text: str) -> str:
         """
         Remove HTML tags and clean text
@@ -180,7 +307,8 @@ class ContentParserAgent:
         Parse and normalize datetime string
 
         Args:
-            dt_str: Datetime string in various formats
+            dt_str: Datetime string in various formats (ISO 8601, RFC 822 as
+                used by RSS)
 
         Returns:
             ISO format datetime string
@@ -192,11 +320,17 @@ class ContentParserAgent:
             # Try parsing ISO format
             dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
             return dt.isoformat()
+        except Exception:
+            pass
+
+        try:
+            # RSS dates, e.g. "Tue, 10 Jun 2025 14:30:00 GMT"
+            return parsedate_to_datetime(dt_str).isoformat()
         except Exception:
             # Return as-is if parsing fails
             return dt_str
 
-    async def _detect_language(self, text: str) -> str:
+    def _detect_language(self, text: str) -> str:
         """
         Detect language of text
 
@@ -221,9 +355,9 @@ class ContentParserAgent:
             self.logger.debug(f"Language detection failed: {e}, defaulting to 'en'")
             return "en"
 
-    async def _extract_keywords(self, text: str, max_keywords: int = 10) -> list[str]:
+    def _extract_keywords(self, text: str, max_keywords: int = 10) -> list[str]:
         """
-        Extract keywords from text using TF-IDF
+        Extract keywords from text using corpus TF-IDF
 
         Args:
             text: Input text
@@ -232,47 +366,112 @@ class ContentParserAgent:
         Returns:
             List of keywords
         """
-        try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
-            import numpy as np
-
-            # Create TF-IDF vectorizer
-            vectorizer = TfidfVectorizer(
-                max_features=max_keywords,
-                stop_words="english",
-                ngram_range=(1, 2)
-            )
+        return self._extract_keywords_batch([text], max_keywords)[0]
 
-            # Fit and transform
-            tfidf_matrix = vectorizer.fit_transform([text])
+    def _extract_keywords_batch(self, texts: list[str], max_keywords: int = 10) -> list[list[str]]:
+        """
+        Extract keywords for many texts in one vectorized pass
 
-            # Get feature names and scores
-            feature_names = vectorizer.get_feature_names_out()
-            scores = tfidf_matrix.toarray()[0]
+        The batch is added to the corpus document frequencies, then every
+        text is weighted against the corpus IDF at once.
 
-            # Sort by score
-            keyword_indices = np.argsort(scores)[::-1][:max_keywords]
-            keywords = [feature_names[i] for i in keyword_indices if scores[i] > 0]
+        Args:
+            texts: Input texts
+            max_keywords: Maximum number of keywords per text
 
-            return keywords
+        Returns:
+            List of keywords per text
+        """
+        try:
+            model = self._get_keyword_model()
+            if model is None:
+                raise ImportError("scikit-learn not installed")
+
+            with self._keyword_lock:
+                return model.extract_batch(texts, max_keywords)
 
         except ImportError:
             # Fallback: simple word frequency
-            words = text.lower().split()
-            word_freq = {}
-            for word in words:
-                if len(word) > 4:  # Only words longer than 4 chars
-                    word_freq[word] = word_freq.get(word, 0) + 1
-
-            # Sort by frequency
-            sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-            return [word for word, _ in sorted_words[:max_keywords]]
+            results = []
+            for text in texts:
+                words = text.lower().split()
+                word_freq = {}
+                for word in words:
+                    if len(word) > 4:  # Only words longer than 4 chars
+                        word_freq[word] = word_freq.get(word, 0) + 1
+
+                # Sort by frequency
+                sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+                results.append([word for word, _ in sorted_words[:max_keywords]])
+            return results
 
         except Exception as e:
             self.logger.debug(f"Keyword extraction failed: {e}")
-            return []
+            return [[] for _ in texts]
+
+    def _add_keywords(self, parsed_articles: list[dict[str, Any]]) -> None:
+        """
+        Attach keywords to a chunk of parsed articles
+
+        Args:
+            parsed_articles: Parsed articles (modified in place)
+        """
+        with_content = [article for article in parsed_articles if article.get("content")]
+        if not with_content:
+            return
+
+        keywords = self._extract_keywords_batch(
+            [article["content"] for article in with_content],
+            self.max_keywords
+        )
+        for article, article_keywords in zip(with_content, keywords):
+            article["keywords"] = article_keywords
+
+    def _get_keyword_model(self) -> Any:
+        """
+        Load the corpus keyword model
+
+        Returns:
+            KeywordModel, or None if scikit-learn is not installed
+        """
+        if self._keyword_model is None:
+            try:
+                import sklearn  # noqa: F401
+
+                from .keyword_model import KeywordModel
+            except ImportError:
+                return None
+
+            base_dir = Path(self.news_config.get("storage", {}).get("base_dir", "./data/news"))
+            self._keyword_model = KeywordModel(
+                Path(self.keywords_config.get("model_path", base_dir / "keyword_model.json")),
+                max_terms=self.keywords_config.get("max_terms", 200000)
+            )
+
+        return self._keyword_model
+
+    def _update_keyword_model(self, texts: list[str]) -> None:
+        """Fold texts into the keyword model's document frequencies"""
+        with self._keyword_lock:
+            self._get_keyword_model().update(texts)
+
+    def save_keyword_model(self) -> None:
+        """
+        Persist the keyword model if it changed
+
+        Saving prunes and rewrites the whole model, so it is done once per
+        batch or ingestion run rather than per parsed chunk.
+        """
+        if self._keyword_model is None:
+            return
+
+        try:
+            with self._keyword_lock:
+                self._keyword_model.save()
+        except Exception as e:
+            self.logger.warning(f"Could not save keyword model: {e}")
 
-    async def _extract_entities(self, text: str) -> dict[str, list[str]]:
+    def _extract_entities(self, text: str) -> dict[str, list[str]]:
         """
         Extract named entities from text
 
@@ -311,7 +510,7 @@ class ContentParserAgent:
             self.logger.debug(f"Entity extraction failed: {e}")
             return entities
 
-    async def _generate_summary(self, text: str, max_sentences: int = 3) -> str:
+    def _generate_summary(self, text: str, max_sentences: int = 3) -> str:
         """
         Generate summary of text
 
@@ -2,14 +2,35 @@
 """
 DeduplicationAgent - Identifies and removes duplicate news articles
 
-Uses fuzzy matching and content similarity to detect duplicates across sources
+Uses fuzzy matching and content similarity to detect duplicates across sources.
+The minhash method narrows exact comparisons down to LSH candidate pairs, and
+the embedding method compares title/lead vectors with batched matrix products.
+A DedupState carries what was kept across the batches of a stream, so each
+batch is only compared against it instead of deduplicating everything again.
 """
 
-from typing import Any
+from typing import Any, Optional
 from difflib import SequenceMatcher
+from pathlib import Path
 
 from src.core.logging import get_logger
 
+from .minhash import build_lsh
+
+
+class DedupState:
+    """Articles kept so far in a run, in the form each method compares against"""
+
+    def __init__(self):
+        """Initialize empty state"""
+        # Kept titles (fuzzy and minhash); LSH keys are positions in this list
+        self.titles: list[str] = []
+        # MinHash hasher and LSH index, built on first use
+        self.hasher = None
+        self.index = None
+        # L2-normalized vectors of kept articles (embedding)
+        self.vectors = None
+
 
 class DeduplicationAgent:
     """Agent for detecting and removing duplicate articles"""
@@ -30,15 +51,29 @@ class DeduplicationAgent:
         self.enabled = self.dedup_config.get("enabled", True)
         self.similarity_threshold = self.dedup_config.get("similarity_threshold", 0.85)
         self.method = self.dedup_config.get("method", "fuzzy")
+        self.minhash_config = self.dedup_config.get("minhash", {})
+        self.cross_run = self.dedup_config.get("cross_run", True)
+        self.embedding_config = self.dedup_config.get("embedding", {})
+
+        # Embedding backend and vector cache are created on first use
+        self._embedder = None
+        self._embedding_cache = None
 
         self.logger.info(f"DeduplicationAgent initialized (threshold={self.similarity_threshold})")
 
-    async def deduplicate(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    async def deduplicate(
+        self,
+        articles: list[dict[str, Any]],
+        state: Optional[DedupState] = None
+    ) -> list[dict[str, Any]]:
         """
         Remove duplicate articles from list
 
         Args:
             articles: List of article dictionaries
+            state: What earlier batches of the same run kept; articles
+                duplicating it are removed as if all batches had been
+                deduplicated together, and the articles kept here are added
 
         Returns:
             List of unique articles
@@ -48,32 +83,104 @@ class DeduplicationAgent:
 
         self.logger.info(f"Deduplicating {len(articles)} articles...")
 
+        unique_articles = await self._run_method(articles, state or DedupState())
+
+        removed_count = len(articles) - len(unique_articles)
+        self.logger.info(f"Removed {removed_count} duplicates, {len(unique_articles)} unique articles remain")
+
+        return unique_articles
+
+    async def _run_method(self, articles: list[dict[str, Any]], state: DedupState) -> list[dict[str, Any]]:
+        """
+        Deduplicate with the configured method
+
+        Args:
+            articles: List of articles
+            state: Articles kept by earlier batches, updated in place
+
+        Returns:
+            List of unique articles, in input order
+        """
         if self.method == "fuzzy":
-            unique_articles = await self._deduplicate_fuzzy(articles)
+            return await self._deduplicate_fuzzy(articles, state)
+        elif self.method == "minhash":
+            return await self._deduplicate_minhash(articles, state)
         elif self.method == "embedding":
-            unique_articles = await self._deduplicate_embedding(articles)
+            return await self._deduplicate_embedding(articles, state)
         else:  # both
             # First pass with fuzzy, then embedding
-            fuzzy_unique = await self._deduplicate_fuzzy(articles)
-            unique_articles = await self._deduplicate_embedding(fuzzy_unique)
+            fuzzy_unique = await self._deduplicate_fuzzy(articles, state)
+            return await self._deduplicate_embedding(fuzzy_unique, state)
 
-        removed_count = len(articles) - len(unique_articles)
-        self.logger.info(f"Removed {removed_count} duplicates, {len(unique_articles)} unique articles remain")
+    async def filter_seen(self, articles: list[dict[str, Any]], storage: Any) -> list[dict[str, Any]]:
+        """
+        Drop articles that are already in storage before they are parsed
 
-        return unique_articles
+        An article is dropped when its normalized URL was stored before, or
+        when its title is a near-duplicate of a stored title: candidates come
+        from the persistent LSH signature index maintained by NewsStorage and
+        are confirmed with the usual similarity threshold.
 
-    async def _deduplicate_fuzzy(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        Args:
+            articles: List of raw article dictionaries
+            storage: NewsStorage instance holding the signature index
+
+        Returns:
+            Articles not seen in previous runs
+        """
+        if not self.enabled or not self.cross_run or not articles:
+            return articles
+
+        signatures = [storage.signature_for(article) for article in articles]
+
+        known_urls = await storage.find_known_urls([url for url, _, _ in signatures if url])
+        similar = await storage.find_similar_titles(
+            [key for _, _, band_keys in signatures for key in band_keys]
+        )
+
+        fresh_articles = []
+        skipped_urls = 0
+        skipped_titles = 0
+
+        for article, (url, title, band_keys) in zip(articles, signatures):
+            if url and url in known_urls:
+                skipped_urls += 1
+                continue
+
+            candidates = {
+                article_id: stored_title
+                for key in band_keys
+                for article_id, stored_title in similar.get(key, [])
+            }
+
+            if any(
+                self._calculate_similarity(title, stored_title) >= self.similarity_threshold
+                for stored_title in candidates.values()
+            ):
+                skipped_titles += 1
+                continue
+
+            fresh_articles.append(article)
+
+        self.logger.info(
+            f"Skipped {skipped_urls} already stored URLs and {skipped_titles} near-duplicate titles, "
+            f"{len(fresh_articles)} new articles remain"
+        )
+        return fresh_articles
+
+    async def _deduplicate_fuzzy(self, articles: list[dict[str, Any]], state: DedupState) -> list[dict[str, Any]]:
         """
         Deduplicate using fuzzy string matching
 
         Args:
             articles: List of articles
+            state: Articles kept by earlier batches, updated in place
 
         Returns:
             List of unique articles
         """
         unique_articles = []
-        seen_titles = []
+        seen_titles = state.titles
 
         for article in articles:
             title = article.get("title", "").lower().strip()
@@ -98,25 +205,150 @@ class DeduplicationAgent:
 
         return unique_articles
 
-    async def _deduplicate_embedding(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    async def _deduplicate_minhash(self, articles: list[dict[str, Any]], state: DedupState) -> list[dict[str, Any]]:
+        """
+        Deduplicate using MinHash/LSH candidate generation
+
+        Same decision rule as fuzzy matching, but each title is only compared
+        exactly against previously kept titles that share an LSH bucket.
+
+        Args:
+            articles: List of articles
+            state: Articles kept by earlier batches, updated in place
+
+        Returns:
+            List of unique articles
+        """
+        if state.index is None:
+            state.hasher, state.index = build_lsh(self.minhash_config)
+        hasher, index = state.hasher, state.index
+        unique_articles = []
+        kept_titles = state.titles
+
+        for article in articles:
+            title = article.get("title", "").lower().strip()
+
+            if not title:
+                unique_articles.append(article)
+                continue
+
+            signature = hasher.signature(title)
+
+            is_duplicate = False
+            for candidate in index.query(signature):
+                similarity = self._calculate_similarity(title, kept_titles[candidate])
+
+                if similarity >= self.similarity_threshold:
+                    is_duplicate = True
+                    self.logger.debug(f"Duplicate detected: '{title[:50]}...' ~= '{kept_titles[candidate][:50]}...' ({similarity:.2f})")
+                    break
+
+            if not is_duplicate:
+                unique_articles.append(article)
+                index.insert(len(kept_titles), signature)
+                kept_titles.append(title)
+
+        return unique_articles
+
+    async def _deduplicate_embedding(self, articles: list[dict[str, Any]], state: DedupState) -> list[dict[str, Any]]:
         """
         Deduplicate using content embeddings (more accurate but slower)
 
+        Titles and leads are embedded in batches (cached per article ID) and
+        compared block-wise with normalized matrix products; an article is a
+        duplicate when its cosine similarity to an earlier kept article
+        reaches the embedding threshold.
+
         Args:
             articles: List of articles
+            state: Articles kept by earlier batches, updated in place
 
         Returns:
             List of unique articles
         """
+        if not articles:
+            return articles
+
         try:
-            # This would use sentence transformers or OpenAI embeddings
-            # For now, fallback to fuzzy matching
-            self.logger.warning("Embedding-based deduplication not yet implemented, using fuzzy matching")
-            return await self._deduplicate_fuzzy(articles)
+            import numpy as np
+
+            from .embeddings import greedy_unique
+
+            vectors = await self.embed_articles(articles)
+            keep = greedy_unique(
+                vectors,
+                self.embedding_config.get("similarity_threshold", 0.9),
+                block_size=self.embedding_config.get("block_size", 256),
+                previous=state.vectors
+            )
+
+            kept_vectors = vectors[keep]
+            state.vectors = kept_vectors if state.vectors is None else np.vstack([state.vectors, kept_vectors])
+            return [articles[i] for i in keep]
 
         except Exception as e:
+            if self.method == "both":
+                self.logger.error(f"Embedding deduplication failed: {e}, keeping the fuzzy result")
+                return articles
+
             self.logger.error(f"Embedding deduplication failed: {e}, falling back to fuzzy")
-            return await self._deduplicate_fuzzy(articles)
+            return await self._deduplicate_fuzzy(articles, state)
+
+    async def embed_articles(self, articles: list[dict[str, Any]]) -> Any:
+        """
+        Embed article titles and leads, reusing cached vectors
+
+        Args:
+            articles: List of articles
+
+        Returns:
+            NumPy array of L2-normalized vectors, one row per article
+        """
+        import numpy as np
+
+        from .embeddings import EmbeddingCache, get_embedder
+
+        if self._embedder is None:
+            self._embedder = get_embedder(self.embedding_config)
+            cache_path = self.embedding_config.get("cache")
+            if cache_path:
+                self._embedding_cache = EmbeddingCache(Path(cache_path))
+
+        model = self._embedder.model_name
+        ids = [article.get("id") for article in articles]
+        cached = self._embedding_cache.get_many([i for i in ids if i], model) if self._embedding_cache else {}
+
+        missing = [i for i, article_id in enumerate(ids) if article_id not in cached]
+        if missing:
+            texts = [self._embedding_text(articles[i]) for i in missing]
+            embedded = await self._embedder.embed(texts)
+
+            new_vectors = {}
+            for row, i in enumerate(missing):
+                if ids[i]:
+                    cached[ids[i]] = embedded[row]
+                    new_vectors[ids[i]] = embedded[row]
+
+            if self._embedding_cache and new_vectors:
+                self._embedding_cache.put_many(new_vectors, model)
+
+            self.logger.debug(f"Embedded {len(missing)} articles, {len(articles) - len(missing)} from cache")
+
+        rows = []
+        missing_rows = {i: row for row, i in enumerate(missing)}
+        for i, article_id in enumerate(ids):
+            rows.append(cached[article_id] if article_id in cached else embedded[missing_rows[i]])
+
+        if not rows:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        return np.vstack(rows).astype(np.float32, copy=False)
+
+    def _embedding_text(self, article: dict[str, Any]) -> str:
+        """Build the text embedded for an article: title plus lead"""
+        title = article.get("title") or ""
+        lead = article.get("description") or article.get("summary") or article.get("content") or ""
+        return f"{title}. {lead[:500]}".strip()
 
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """
@@ -143,20 +375,32 @@ class DeduplicationAgent:
             Dictionary mapping original article to its duplicates
         """
         duplicates = {}
+        titles = [article.get("title", "").lower().strip() for article in articles]
+
+        if self.method == "minhash":
+            candidates = self._minhash_candidate_pairs(titles)
+        else:
+            candidates = None
 
         for i, article1 in enumerate(articles):
-            title1 = article1.get("title", "").lower().strip()
+            title1 = titles[i]
 
             if not title1 or article1.get("id") in duplicates:
                 continue
 
             duplicates[article1.get("id")] = []
 
-            for j, article2 in enumerate(articles):
+            if candidates is not None:
+                partners = sorted(candidates.get(i, ()))
+            else:
+                partners = range(i + 1, len(articles))
+
+            for j in partners:
                 if i >= j:  # Skip self and already compared pairs
                     continue
 
-                title2 = article2.get("title", "").lower().strip()
+                article2 = articles[j]
+                title2 = titles[j]
 
                 if not title2:
                     continue
@@ -175,6 +419,32 @@ class DeduplicationAgent:
         self.logger.info(f"Found {len(duplicates)} articles with duplicates")
         return duplicates
 
+    def _minhash_candidate_pairs(self, titles: list[str]) -> dict[int, set[int]]:
+        """
+        Find candidate duplicate pairs with one LSH pass over all titles
+
+        Args:
+            titles: Normalized titles, indexed by article position
+
+        Returns:
+            Dictionary mapping article position to candidate positions
+        """
+        hasher, index = build_lsh(self.minhash_config)
+        candidates: dict[int, set[int]] = {}
+
+        for i, title in enumerate(titles):
+            if not title:
+                continue
+
+            signature = hasher.signature(title)
+            for j in index.query(signature):
+                candidates.setdefault(j, set()).add(i)
+                candidates.setdefault(i, set()).add(j)
+
+            index.insert(i, signature)
+
+        return candidates
+
     async def merge_duplicates(
         self,
         articles: list[dict[str, Any]],
@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+"""
+Text embedding backends and an on-disk vector cache for news articles
+
+Two embedders are available:
+- "config": the project's embedding provider from get_embedding_config()
+  (any OpenAI-compatible /embeddings endpoint)
+- "local": a deterministic hashed n-gram embedder that needs no network,
+  used offline and as a stand-in for tests
+
+Vectors are cached per article ID and model in a small SQLite database so
+an article is only embedded once.
+"""
+
+from pathlib import Path
+import re
+import sqlite3
+from typing import Any, Optional
+import zlib
+
+import numpy as np
+
+from src.core.logging import get_logger
+
+
+class HashingEmbedder:
+    """Deterministic local embedder based on hashed word and character n-grams"""
+
+    def __init__(self, dim: int = 256):
+        """
+        Initialize hashing embedder
+
+        Args:
+            dim: Embedding dimension
+        """
+        self.dim = dim
+        self.model_name = f"local-hashing-{dim}"
+
+    async def embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Array of shape (len(texts), dim) with L2-normalized rows
+        """
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+
+        for row, text in enumerate(texts):
+            text = re.sub(r"\s+", " ", (text or "").lower()).strip()
+            words = re.findall(r"\w+", text)
+            features = words + [text[i:i + 4] for i in range(max(0, len(text) - 3))]
+
+            for feature in features:
+                h = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if h & 0x80000000 else -1.0
+                vectors[row, h % self.dim] += sign
+
+        return _normalize(vectors)
+
+
+class ProviderEmbedder:
+    """Embedder backed by the configured OpenAI-compatible embedding provider"""
+
+    def __init__(self, embedding_config: dict[str, Any], batch_size: int = 64):
+        """
+        Initialize provider embedder
+
+        Args:
+            embedding_config: Result of get_embedding_config()
+            batch_size: Texts per API request
+        """
+        from openai import AsyncOpenAI
+
+        self.model_name = embedding_config["model"]
+        self.dim = embedding_config.get("dim")
+        self.batch_size = batch_size
+        self.client = AsyncOpenAI(
+            api_key=embedding_config["api_key"],
+            base_url=embedding_config["base_url"]
+        )
+
+    async def embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts in batches
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Array of shape (len(texts), dim) with L2-normalized rows
+        """
+        rows = []
+
+        for i in range(0, len(texts), self.batch_size):
+            batch = [text or " " for text in texts[i:i + self.batch_size]]
+            response = await self.client.embeddings.create(model=self.model_name, input=batch)
+            rows.extend(item.embedding for item in sorted(response.data, key=lambda d: d.index))
+
+        if not rows:
+            return np.zeros((0, self.dim or 0), dtype=np.float32)
+
+        return _normalize(np.asarray(rows, dtype=np.float32))
+
+
+class EmbeddingCache:
+    """Persistent cache of article vectors keyed by article ID and model"""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize embedding cache
+
+        Args:
+            db_path: Path of the SQLite cache file
+        """
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS article_embeddings (
+                article_id TEXT NOT NULL,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (article_id, model)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def get_many(self, article_ids: list[str], model: str) -> dict[str, np.ndarray]:
+        """
+        Load cached vectors
+
+        Args:
+            article_ids: Article IDs
+            model: Embedding model name
+
+        Returns:
+            Dictionary mapping found article IDs to vectors
+        """
+        found = {}
+        unique = list(set(article_ids))
+
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT article_id, vector FROM article_embeddings WHERE model = ? AND article_id IN ({placeholders})",
+                [model, *chunk]
+            )
+            for article_id, blob in rows:
+                found[article_id] = np.frombuffer(blob, dtype=np.float32)
+
+        return found
+
+    def put_many(self, vectors: dict[str, np.ndarray], model: str) -> None:
+        """
+        Store vectors
+
+        Args:
+            vectors: Dictionary mapping article IDs to vectors
+            model: Embedding model name
+        """
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO article_embeddings (article_id, model, vector) VALUES (?, ?, ?)",
+                [
+                    (article_id, model, np.asarray(vector, dtype=np.float32).tobytes())
+                    for article_id, vector in vectors.items()
+                ]
+            )
+
+
+def get_embedder(embedding_config: dict[str, Any]) -> Any:
+    """
+    Build the embedder selected in the deduplication embedding config
+
+    Falls back to the local hashing embedder when the configured provider
+    is not set up, so deduplication keeps working offline.
+
+    Args:
+        embedding_config: news.deduplication.embedding config block
+
+    Returns:
+        Embedder with an async embed(texts) method and a model_name attribute
+    """
+    provider = embedding_config.get("provider", "config")
+    batch_size = embedding_config.get("batch_size", 64)
+
+    if provider == "config":
+        try:
+            from src.core.core import get_embedding_config
+
+            return ProviderEmbedder(get_embedding_config(), batch_size=batch_size)
+        except Exception as e:
+            get_logger(name="deduplication_agent").warning(
+                f"Embedding provider unavailable ({e}), using local hashing embedder"
+            )
+
+    return HashingEmbedder(dim=embedding_config.get("local_dim", 256))
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving all-zero rows untouched"""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def greedy_unique(
+    vectors: np.ndarray,
+    threshold: float,
+    block_size: int = 256,
+    previous: Optional[np.ndarray] = None
+) -> list[int]:
+    """
+    Select rows that are not near-duplicates of an earlier selected row
+
+    Processes rows in order, comparing each block of rows against all kept
+    rows with one matrix product, then resolving duplicates inside the block.
+
+    Args:
+        vectors: L2-normalized vectors, shape (n, dim)
+        threshold: Cosine similarity at or above which a row is a duplicate
+        block_size: Rows compared per matrix product
+        previous: Vectors kept by an earlier call (e.g. an earlier chunk of
+            a stream); rows duplicating them are not selected
+
+    Returns:
+        Indices of kept rows, in order
+    """
+    kept: list[int] = []
+    kept_matrix: Optional[np.ndarray] = previous
+
+    for start in range(0, len(vectors), block_size):
+        block = vectors[start:start + block_size]
+
+        if kept_matrix is not None and len(kept_matrix):
+            is_dup = (block @ kept_matrix.T).max(axis=1) >= threshold
+        else:
+            is_dup = np.zeros(len(block), dtype=bool)
+
+        intra = block @ block.T
+        block_kept: list[int] = []
+
+        for i in range(len(block)):
+            if is_dup[i]:
+                continue
+            if block_kept and intra[i, block_kept].max() >= threshold:
+                continue
+            block_kept.append(i)
+
+        kept.extend(start + i for i in block_kept)
+        new_rows = block[block_kept]
+        kept_matrix = new_rows if kept_matrix is None else np.vstack([kept_matrix, new_rows])
+
+    return kept
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+"""
+FetchStateStore - Per-source fetch state kept between scraper runs
+
+Stores the HTTP validators (ETag / Last-Modified) returned by each RSS feed
+so the next fetch can be a conditional request: an unchanged feed answers
+304 Not Modified and costs neither a download nor a parse.
+
+Also keeps a high-water mark per source stream (e.g. one NewsAPI
+category/country pair): the newest publish time ingested plus the IDs of
+the most recently ingested items. The scraper stops paginating a stream as
+soon as it reaches items at or behind its mark.
+"""
+
+from datetime import datetime
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_validators (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    checked_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS source_marks (
+    stream TEXT PRIMARY KEY,
+    published_ts REAL,
+    seen_ids TEXT NOT NULL DEFAULT '[]',
+    updated_at TEXT
+);
+"""
+
+
+class FetchStateStore:
+    """SQLite-backed store of per-source fetch state"""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize fetch state store
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def get_validators(self, url: str) -> dict[str, Optional[str]]:
+        """
+        Get the stored validators of a feed
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            Dictionary with etag and last_modified (values may be None)
+        """
+        row = self.conn.execute(
+            "SELECT etag, last_modified FROM feed_validators WHERE url = ?", (url,)
+        ).fetchone()
+
+        if row is None:
+            return {"etag": None, "last_modified": None}
+
+        return {"etag": row["etag"], "last_modified": row["last_modified"]}
+
+    def set_validators(self, url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """
+        Store the validators returned with a feed response
+
+        Args:
+            url: Feed URL
+            etag: ETag header value
+            last_modified: Last-Modified header value
+        """
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO feed_validators (url, etag, last_modified, checked_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    checked_at = excluded.checked_at
+                """,
+                (url, etag, last_modified, datetime.now().isoformat())
+            )
+
+    def touch(self, url: str) -> None:
+        """
+        Record that a feed was checked and found unchanged
+
+        Args:
+            url: Feed URL
+        """
+        with self.conn:
+            self.conn.execute(
+                "UPDATE feed_validators SET checked_at = ? WHERE url = ?",
+                (datetime.now().isoformat(), url)
+            )
+
+    def conditional_headers(self, url: str) -> dict[str, Any]:
+        """
+        Build conditional request headers for a feed
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            Headers dictionary (empty if nothing is stored)
+        """
+        validators = self.get_validators(url)
+        headers = {}
+
+        if validators["etag"]:
+            headers["If-None-Match"] = validators["etag"]
+        if validators["last_modified"]:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        return headers
+
+    def get_mark(self, stream: str) -> dict[str, Any]:
+        """
+        Get the high-water mark of a source stream
+
+        Args:
+            stream: Stream key (e.g. "newsapi:technology:us")
+
+        Returns:
+            Dictionary with published_ts (None if unknown) and seen_ids (set)
+        """
+        row = self.conn.execute(
+            "SELECT published_ts, seen_ids FROM source_marks WHERE stream = ?", (stream,)
+        ).fetchone()
+
+        if row is None:
+            return {"published_ts": None, "seen_ids": set()}
+
+        return {"published_ts": row["published_ts"], "seen_ids": set(json.loads(row["seen_ids"]))}
+
+    def advance_marks(self, marks: dict[str, dict[str, Any]], max_seen_ids: int = 1000) -> None:
+        """
+        Move stream marks forward past newly ingested items
+
+        Args:
+            marks: Dictionary mapping stream keys to dicts with published_ts
+                (newest publish time among the new items, may be None) and
+                ids (list of new item IDs, newest first)
+            max_seen_ids: Number of recent IDs remembered per stream
+        """
+        now = datetime.now().isoformat()
+
+        with self.conn:
+            for stream, update in marks.items():
+                row = self.conn.execute(
+                    "SELECT published_ts, seen_ids FROM source_marks WHERE stream = ?", (stream,)
+                ).fetchone()
+                published_ts = row["published_ts"] if row else None
+                previous = json.loads(row["seen_ids"]) if row else []
+
+                if update.get("published_ts") is not None:
+                    published_ts = max(published_ts or 0.0, update["published_ts"])
+
+                seen_ids = list(dict.fromkeys(list(update.get("ids", [])) + previous))[:max_seen_ids]
+
+                self.conn.execute(
+                    """
+                    INSERT INTO source_marks (stream, published_ts, seen_ids, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT (stream) DO UPDATE SET
+                        published_ts = excluded.published_ts,
+                        seen_ids = excluded.seen_ids,
+                        updated_at = excluded.updated_at
+                    """,
+                    (stream, published_ts, json.dumps(seen_ids), now)
+                )
+
+    def clear(self) -> None:
+        """Forget all stored fetch state"""
+        with self.conn:
+            self.conn.execute("DELETE FROM feed_validators")
+            self.conn.execute("DELETE FROM source_marks")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Article fingerprints for cross-run deduplication
+
+Fingerprints are computed the same way for raw (just fetched) and stored
+(processed) articles, so a freshly scraped story can be matched against the
+stored corpus before it goes through parsing.
+"""
+
+import hashlib
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .minhash import normalize_text
+
+# Query parameters that only track the click and never change the story
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "cmpid", "ocid")
+
+
+def url_hash(url: Optional[str]) -> Optional[str]:
+    """
+    Hash an article URL after stripping tracking noise
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Hex digest, or None if there is no URL
+    """
+    if not url:
+        return None
+
+    try:
+        parts = urlsplit(url.strip())
+        query = [
+            (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not k.lower().startswith(_TRACKING_PARAMS)
+        ]
+        normalized = urlunsplit((
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            urlencode(query),
+            ""
+        ))
+    except ValueError:
+        normalized = url.strip()
+
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:32]
+
+
+def title_fingerprint(title: Optional[str]) -> str:
+    """
+    Normalize a title for similarity comparison
+
+    Bracketed and parenthesized fragments are removed, mirroring
+    ContentParserAgent._clean_text, so raw and parsed titles agree.
+
+    Args:
+        title: Article title
+
+    Returns:
+        Normalized title
+    """
+    if not title:
+        return ""
+
+    title = re.sub(r"\[.*?\]", "", title)
+    title = re.sub(r"\(.*?\)", "", title)
+    return normalize_text(title)
+
+
+def band_key(band: int, values: tuple[int, ...]) -> str:
+    """
+    Encode one LSH band of a signature as a compact string key
+
+    Args:
+        band: Band number
+        values: Signature values in the band
+
+    Returns:
+        String key
+    """
+    digest = hashlib.blake2b(repr(values).encode("ascii"), digest_size=8).hexdigest()
+    return f"{band}:{digest}"
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+"""
+Shared async HTTP client for news sources
+
+One aiohttp session is shared by every source during a fetch. Requests are
+bounded by a global concurrency limit, paced by a per-source token bucket,
+and retried with exponential backoff on connection errors, 429 and 5xx
+responses (honoring Retry-After when the server sends it).
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Optional
+
+from src.core.logging import get_logger
+
+# Status codes worth retrying: rate limited or transient server errors
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Async token bucket rate limiter"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held (requests allowed back-to-back)
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class HTTPStatusError(Exception):
+    """Raised when a request ends with a non-success status"""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+
+
+class RateLimitedClient:
+    """aiohttp session wrapper with concurrency limit, rate limits and retries"""
+
+    def __init__(self, http_config: Optional[dict[str, Any]] = None, rate_limits: Optional[dict[str, dict[str, Any]]] = None):
+        """
+        Initialize client
+
+        Args:
+            http_config: news.http config (max_concurrency, timeout, retries, backoff)
+            rate_limits: Per-source dicts with requests_per_second and burst
+        """
+        http_config = http_config or {}
+        self.max_concurrency = http_config.get("max_concurrency", 16)
+        self.timeout = http_config.get("timeout", 30)
+        self.retries = http_config.get("retries", 3)
+        self.backoff = http_config.get("backoff", 1.0)
+        self.logger = get_logger(name="news_scraper_agent")
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._buckets = {
+            source: TokenBucket(limits.get("requests_per_second", 1.0), limits.get("burst", 1))
+            for source, limits in (rate_limits or {}).items()
+            if limits.get("requests_per_second")
+        }
+        self.session = None
+
+    async def __aenter__(self) -> "RateLimitedClient":
+        import aiohttp
+
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def get_json(
+        self,
+        source: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None
+    ) -> Any:
+        """
+        GET a URL and decode the JSON body
+
+        Args:
+            source: Source name selecting the rate limit bucket
+            url: Request URL
+            params: Query parameters
+            headers: Request headers
+
+        Returns:
+            Decoded JSON body
+
+        Raises:
+            HTTPStatusError: If the final response is not 200
+        """
+        response = await self.request(source, url, params=params, headers=headers)
+        if response["status"] != 200:
+            raise HTTPStatusError(response["status"], url)
+        return response["json"]
+
+    async def request(
+        self,
+        source: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        raw: bool = False
+    ) -> dict[str, Any]:
+        """
+        GET a URL with rate limiting and retries
+
+        Args:
+            source: Source name selecting the rate limit bucket
+            url: Request URL
+            params: Query parameters
+            headers: Request headers
+            raw: Return the body as bytes instead of decoded JSON
+
+        Returns:
+            Dictionary with status, headers (lowercased names) and json (or body)
+            of the last response
+        """
+        import aiohttp
+
+        bucket = self._buckets.get(source)
+        attempt = 0
+
+        while True:
+            if bucket is not None:
+                await bucket.acquire()
+
+            try:
+                async with self._semaphore:
+                    async with self.session.get(url, params=params, headers=headers) as response:
+                        status = response.status
+                        retry_after = response.headers.get("Retry-After")
+
+                        if status not in _RETRY_STATUSES or attempt >= self.retries:
+                            result = {
+                                "status": status,
+                                "headers": {k.lower(): v for k, v in response.headers.items()}
+                            }
+                            if status == 200:
+                                if raw:
+                                    result["body"] = await response.read()
+                                else:
+                                    result["json"] = await response.json(content_type=None)
+                            return result
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= self.retries:
+                    raise
+                self.logger.debug(f"Request to {url} failed ({e}), retrying")
+                retry_after = None
+
+            attempt += 1
+            await asyncio.sleep(self._retry_delay(attempt, retry_after))
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """
+        Compute the wait before a retry
+
+        Args:
+            attempt: Retry number (1-based)
+            retry_after: Retry-After header value, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+        return self.backoff * (2 ** (attempt - 1)) * (1 + random.random() * 0.25)
@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+"""
+IngestionPipeline - Streaming fetch → parse → dedup → categorize → sentiment → novelty → save
+
+Each stage is an async task reading chunks of articles from a bounded
+queue and writing its output to the next one. Articles start flowing
+through parsing as soon as the first source answers, a full queue pauses
+the stage feeding it (backpressure), and results are written to storage
+in chunks, so memory stays proportional to the queue sizes instead of the
+whole fetch.
+"""
+
+import asyncio
+from collections import deque
+from contextlib import aclosing
+from datetime import datetime
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from src.agents.trend_analyzer.novelty_evaluator_agent import NoveltyEvaluatorAgent
+from src.agents.trend_analyzer.sentiment_tracker_agent import SentimentTrackerAgent
+from src.core.logging import get_logger
+
+from .category_agent import CategoryAgent
+from .content_parser_agent import ContentParserAgent
+from .deduplication_agent import DeduplicationAgent, DedupState
+from .news_scraper_agent import NewsScraperAgent
+from .news_storage import NewsStorage
+from .worker_pool import resolve_workers
+
+# Marks the end of a stage's output
+_DONE = object()
+
+STAGES = ["fetch", "filter_seen", "parse", "dedup", "categorize", "sentiment", "novelty", "save"]
+
+
+class IngestionPipeline:
+    """Staged streaming ingestion of news articles"""
+
+    def __init__(
+        self,
+        config: dict[str, Any],
+        storage: Optional[NewsStorage] = None,
+        progress: Optional[Callable[[dict[str, Any]], None]] = None
+    ):
+        """
+        Initialize ingestion pipeline
+
+        Args:
+            config: Complete configuration dictionary
+            storage: NewsStorage to write to (created from config if omitted)
+            progress: Called with the current stats after every chunk a stage finishes
+        """
+        self.config = config
+        self.news_config = config.get("news", {})
+        self.logger = get_logger(name="ingestion_pipeline")
+
+        pipeline_config = self.news_config.get("pipeline", {})
+        self.queue_size = pipeline_config.get("queue_size", 4)
+        self.chunk_size = pipeline_config.get("chunk_size", 100)
+        self.save_chunk_size = pipeline_config.get("save_chunk_size", 500)
+
+        self.scraper = NewsScraperAgent(config)
+        self.parser = ContentParserAgent(config)
+        self.parse_concurrency = resolve_workers(
+            pipeline_config.get("parse_concurrency") or self.parser.parse_workers
+        )
+        self.dedup = DeduplicationAgent(config)
+        self.categorizer = CategoryAgent(config)
+        self.sentiment = SentimentTrackerAgent(config)
+        self.novelty = NoveltyEvaluatorAgent(config)
+        self.score_novelty = config.get("trend_analysis", {}).get("novelty", {}).get("score_on_ingest", True)
+        self.storage = storage or NewsStorage(config)
+        self.progress = progress
+
+        self.stats = self._new_stats()
+        self.categories: dict[str, dict[str, Any]] = {}
+        self._dedup_state = DedupState()
+
+    def _new_stats(self) -> dict[str, Any]:
+        """Build empty per-stage counters"""
+        return {
+            "started_at": None,
+            "finished_at": None,
+            "elapsed_seconds": 0.0,
+            "failed_saves": 0,
+            "stages": {
+                name: {"chunks": 0, "items_in": 0, "items_out": 0, "busy_seconds": 0.0, "items_per_second": 0.0}
+                for name in STAGES
+            }
+        }
+
+    async def run(
+        self,
+        category: Optional[str] = None,
+        hours: Optional[int] = None,
+        incremental: Optional[bool] = None,
+        sources: Optional[list[str]] = None
+    ) -> dict[str, Any]:
+        """
+        Run one ingestion
+
+        Args:
+            category: Only fetch this category
+            hours: Only keep articles published in the last N hours
+            incremental: Override the configured incremental mode
+            sources: Only fetch these sources (default all)
+
+        Returns:
+            Summary with totals, category distribution and per-stage stats
+        """
+        self.stats = self._new_stats()
+        self.stats["started_at"] = datetime.now().isoformat()
+        self.categories = {}
+        self._dedup_state = DedupState()
+        started = time.perf_counter()
+
+        # Keywords are weighted against the stored corpus
+        await self.parser.ensure_keyword_model(self.storage)
+
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in STAGES[1:]]
+
+        tasks = [
+            asyncio.create_task(self._fetch_stage(queues[0], category, hours, incremental, sources)),
+            asyncio.create_task(self._stage("filter_seen", self._filter_seen, queues[0], queues[1])),
+            asyncio.create_task(self._parse_stage(queues[1], queues[2])),
+            asyncio.create_task(self._stage("dedup", self._deduplicate, queues[2], queues[3])),
+            asyncio.create_task(self._stage("categorize", self._categorize, queues[3], queues[4])),
+            asyncio.create_task(self._stage("sentiment", self._score_sentiment, queues[4], queues[5])),
+            asyncio.create_task(self._stage("novelty", self._score_novelty, queues[5], queues[6])),
+            asyncio.create_task(self._save_stage(queues[6])),
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        # Document frequencies of the whole run are written once
+        await asyncio.to_thread(self.parser.save_keyword_model)
+
+        # Source marks only move on once every fetched article is stored; after a
+        # failed save the next run fetches the same items again
+        if self.stats["failed_saves"]:
+            self.logger.warning(
+                f"{self.stats['failed_saves']} article saves failed, source marks not advanced"
+            )
+        else:
+            self.scraper.commit_marks()
+
+        self.stats["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        self.stats["finished_at"] = datetime.now().isoformat()
+
+        stages = self.stats["stages"]
+        self.logger.info(
+            f"Ingested {stages['save']['items_out']} of {stages['fetch']['items_out']} fetched articles "
+            f"in {self.stats['elapsed_seconds']}s"
+        )
+
+        return {
+            "total_fetched": stages["fetch"]["items_out"],
+            "total_new": stages["filter_seen"]["items_out"],
+            "total_unique": stages["dedup"]["items_out"],
+            "total_saved": stages["save"]["items_out"],
+            "total_failed": self.stats["failed_saves"],
+            "categories": self.categories,
+            "pipeline": self.stats
+        }
+
+    async def _fetch_stage(
+        self,
+        output: asyncio.Queue,
+        category: Optional[str],
+        hours: Optional[int],
+        incremental: Optional[bool],
+        sources: Optional[list[str]]
+    ) -> None:
+        """Feed fetched articles into the pipeline in chunks as sources finish"""
+        stats = self.stats["stages"]["fetch"]
+        batches = self.scraper.stream_sources(
+            incremental=incremental,
+            category=category,
+            hours=hours,
+            save_raw=True,
+            sources=sources
+        )
+
+        async with aclosing(batches):
+            started = time.perf_counter()
+            async for articles in batches:
+                for i in range(0, len(articles), self.chunk_size):
+                    chunk = articles[i:i + self.chunk_size]
+                    stats["busy_seconds"] += time.perf_counter() - started
+                    self._record(stats, len(chunk), len(chunk))
+
+                    await output.put(chunk)
+                    started = time.perf_counter()
+
+            stats["busy_seconds"] += time.perf_counter() - started
+
+        await output.put(_DONE)
+
+    async def _stage(
+        self,
+        name: str,
+        process: Callable[[list[dict[str, Any]]], Awaitable[list[dict[str, Any]]]],
+        source: asyncio.Queue,
+        output: asyncio.Queue
+    ) -> None:
+        """
+        Run one processing stage until its input is exhausted
+
+        Args:
+            name: Stage name in the stats
+            process: Coroutine function turning an input chunk into an output chunk
+            source: Input queue
+            output: Output queue
+        """
+        stats = self.stats["stages"][name]
+
+        while True:
+            chunk = await source.get()
+            if chunk is _DONE:
+                break
+
+            started = time.perf_counter()
+            result = await process(chunk)
+            stats["busy_seconds"] += time.perf_counter() - started
+            self._record(stats, len(chunk), len(result))
+
+            if result:
+                await output.put(result)
+
+        await output.put(_DONE)
+
+    async def _parse_stage(self, source: asyncio.Queue, output: asyncio.Queue) -> None:
+        """
+        Parse up to parse_concurrency chunks at once, passing them on in input order
+
+        A single pipeline chunk only fills a few pool workers, so several are
+        kept in flight to keep every parsing worker busy.
+
+        Args:
+            source: Input queue
+            output: Output queue
+        """
+        stats = self.stats["stages"]["parse"]
+        pending: deque[tuple[int, asyncio.Task]] = deque()
+        # Wall time with at least one chunk in flight, so overlapping parses count once
+        busy_since = 0.0
+
+        async def emit_oldest() -> None:
+            items_in, task = pending.popleft()
+            result = await task
+            if not pending:
+                stats["busy_seconds"] += time.perf_counter() - busy_since
+            self._record(stats, items_in, len(result))
+            if result:
+                await output.put(result)
+
+        try:
+            while True:
+                chunk = await source.get()
+                if chunk is _DONE:
+                    break
+
+                if not pending:
+                    busy_since = time.perf_counter()
+                pending.append((len(chunk), asyncio.create_task(self._parse(chunk))))
+                if len(pending) >= self.parse_concurrency:
+                    await emit_oldest()
+
+            while pending:
+                await emit_oldest()
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+        await output.put(_DONE)
+
+    async def _save_stage(self, source: asyncio.Queue) -> None:
+        """Write categorized articles to storage in chunks of save_chunk_size"""
+        stats = self.stats["stages"]["save"]
+        buffer: list[dict[str, Any]] = []
+
+        async def flush() -> None:
+            started = time.perf_counter()
+            saved = await self.storage.save_articles(buffer, processed=True)
+            stats["busy_seconds"] += time.perf_counter() - started
+            self.stats["failed_saves"] += len(buffer) - saved
+            self._record(stats, len(buffer), saved)
+            buffer.clear()
+
+        while True:
+            chunk = await source.get()
+            if chunk is _DONE:
+                break
+
+            buffer.extend(chunk)
+            if len(buffer) >= self.save_chunk_size:
+                await flush()
+
+        if buffer:
+            await flush()
+
+    async def _filter_seen(self, chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Skip stories stored by previous runs before the expensive parsing stage"""
+        return await self.dedup.filter_seen(chunk, self.storage)
+
+    async def _parse(self, chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Parse and clean a chunk in the worker pool"""
+        return [parsed async for parsed in self.parser.parse_stream(chunk)]
+
+    async def _deduplicate(self, chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Deduplicate a chunk against itself and everything kept earlier in the run"""
+        return await self.dedup.deduplicate(chunk, state=self._dedup_state)
+
+    async def _categorize(self, chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Categorize a chunk and add it to the category distribution"""
+        categorized = await self.categorizer.categorize_batch(chunk)
+
+        chunk_stats = await self.categorizer.get_category_stats(categorized)
+        for category, info in chunk_stats["categories"].items():
+            merged = self.categories.setdefault(category, {"count": 0, "sources": [], "languages": []})
+            merged["count"] += info["count"]
+            merged["sources"] = sorted(set(merged["sources"]) | set(info["sources"]))
+            merged["languages"] = sorted(set(merged["languages"]) | set(info["languages"]))
+
+        return categorized
+
+    async def _score_sentiment(self, chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Score the sentiment of a chunk in one batch, stored with each article"""
+        return await self.sentiment.score_articles(chunk)
+
+    async def _score_novelty(self, chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Score a chunk against the sliding window of recent articles"""
+        if not self.score_novelty:
+            return chunk
+        return await self.novelty.score_articles(chunk, self.storage)
+
+    def _record(self, stats: dict[str, Any], items_in: int, items_out: int) -> None:
+        """Update a stage's counters and report progress"""
+        stats["chunks"] += 1
+        stats["items_in"] += items_in
+        stats["items_out"] += items_out
+        if stats["busy_seconds"] > 0:
+            stats["items_per_second"] = round(stats["items_in"] / stats["busy_seconds"], 1)
+
+        if self.progress is not None:
+            self.progress(self.stats)
@@ -0,0 +1,488 @@
+#!/usr/bin/env python
+"""
+IngestionScheduler - Background ingestion jobs on per-source cadences
+
+Runs inside the API process. Every schedule (by default one per source)
+fires on its own cadence derived from update_frequency / update_time, with
+a random jitter so sources are not polled in lockstep. Due schedules and
+API requests become jobs in a persisted queue that one worker runs through
+IngestionPipeline. A schedule is skipped while a job for any of its
+sources is still queued or running, and jobs interrupted by a restart are
+queued again on startup.
+"""
+
+import asyncio
+import copy
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Optional
+
+from src.core.logging import get_logger
+
+from .ingestion_pipeline import IngestionPipeline
+from .job_store import ACTIVE_STATUSES, JobStore
+from .news_scraper_agent import SOURCE_NAMES
+
+# Seconds between persisted progress updates of a running job
+PROGRESS_SAVE_INTERVAL = 1.0
+
+
+def next_run_time(frequency: str, at_time: str, after: datetime, interval_minutes: Optional[int] = None) -> datetime:
+    """
+    Compute the next scheduled run strictly after a moment
+
+    Args:
+        frequency: hourly, daily or weekly (weekly runs on Mondays)
+        at_time: UTC time of day "HH:MM" (only the minutes are used for hourly)
+        after: Reference moment (timezone-aware)
+        interval_minutes: Fixed interval overriding frequency and at_time
+
+    Returns:
+        Next run time (UTC)
+    """
+    after = after.astimezone(timezone.utc)
+
+    if interval_minutes:
+        return after + timedelta(minutes=interval_minutes)
+
+    hour, minute = (int(part) for part in at_time.split(":"))
+
+    if frequency == "hourly":
+        run = after.replace(minute=minute, second=0, microsecond=0)
+        return run if run > after else run + timedelta(hours=1)
+
+    run = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if run <= after:
+        run += timedelta(days=1)
+
+    if frequency == "weekly":
+        run += timedelta(days=(7 - run.weekday()) % 7)
+    elif frequency != "daily":
+        raise ValueError(f"Unsupported update frequency: {frequency}")
+
+    return run
+
+
+class IngestionScheduler:
+    """In-process scheduler and job queue for news ingestion"""
+
+    _instance: Optional["IngestionScheduler"] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, config: dict[str, Any]) -> "IngestionScheduler":
+        """
+        Get the process-wide scheduler
+
+        Args:
+            config: Complete configuration dictionary (used on first call)
+
+        Returns:
+            Scheduler instance
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(config)
+        return cls._instance
+
+    def __init__(self, config: dict[str, Any]):
+        """
+        Initialize ingestion scheduler
+
+        Args:
+            config: Complete configuration dictionary
+        """
+        self.config = config
+        self.news_config = config.get("news", {})
+        self.logger = get_logger(name="ingestion_scheduler")
+
+        scheduler_config = self.news_config.get("scheduler", {})
+        self.enabled = scheduler_config.get("enabled", True)
+        self.jitter_seconds = scheduler_config.get("jitter_seconds", 300)
+        self.poll_interval = scheduler_config.get("poll_interval", 30)
+        self.keep_jobs = scheduler_config.get("keep_jobs", 200)
+
+        base_dir = Path(self.news_config.get("storage", {}).get("base_dir", "./data/news"))
+        self.store = JobStore(Path(scheduler_config.get("state_db", base_dir / "scheduler.db")))
+
+        self.schedules = self._build_schedules(scheduler_config.get("jobs"))
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        self._schedule_task: Optional[asyncio.Task] = None
+
+        # Sources of queued and running jobs (overlap protection)
+        self._active: dict[str, set[str]] = {}
+        # Latest progress of the running job and its stream subscribers
+        self._progress: dict[str, dict[str, Any]] = {}
+        self._subscribers: dict[str, list[asyncio.Queue]] = {}
+
+    def _build_schedules(self, jobs_config: Optional[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """
+        Resolve schedule definitions, defaulting to one daily job per source
+
+        Args:
+            jobs_config: Dictionary mapping schedule names to options
+                (sources, frequency, time, interval_minutes, enabled)
+
+        Returns:
+            Dictionary mapping schedule names to resolved schedules
+        """
+        if jobs_config is None:
+            jobs_config = {name: {"sources": [name]} for name in SOURCE_NAMES}
+
+        schedules = {}
+        for name, options in jobs_config.items():
+            options = options or {}
+            if not options.get("enabled", True):
+                continue
+
+            schedules[name] = {
+                "sources": options.get("sources", [name]),
+                "frequency": options.get("frequency", self.news_config.get("update_frequency", "daily")),
+                "time": options.get("time", self.news_config.get("update_time", "06:00")),
+                "interval_minutes": options.get("interval_minutes"),
+                "category": options.get("category"),
+                "hours": options.get("hours")
+            }
+
+        return schedules
+
+    async def start(self) -> None:
+        """Resume persisted jobs and start the worker and, if enabled, the schedule loop"""
+        self._ensure_worker()
+
+        if self.enabled and self._schedule_task is None:
+            self._schedule_task = asyncio.create_task(self._schedule_loop())
+            self.logger.info(f"Ingestion scheduler started with {len(self.schedules)} schedules")
+
+    async def stop(self) -> None:
+        """Stop the schedule loop and the worker; a running job is queued again"""
+        tasks = [task for task in (self._schedule_task, self._worker_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._schedule_task = None
+        self._worker_task = None
+        self._queue = None
+        self._active = {}
+
+    def _ensure_worker(self) -> None:
+        """Start the job worker, re-queueing jobs left over from a previous run"""
+        if self._worker_task is not None:
+            return
+
+        self._queue = asyncio.Queue()
+
+        for job in self.store.active_jobs():
+            if job["status"] == "running":
+                # Interrupted mid-run; marks only move after a full save, so rerunning is safe
+                self.store.update_job(job["id"], status="queued", started_at=None)
+                self.logger.info(f"Resuming interrupted job {job['id']}")
+            self._track(job)
+
+        self._worker_task = asyncio.create_task(self._worker())
+
+    def _track(self, job: dict[str, Any]) -> None:
+        """Register a queued job for overlap checks and hand it to the worker"""
+        self._active[job["id"]] = set(job["params"].get("sources") or SOURCE_NAMES)
+        self._queue.put_nowait(job["id"])
+
+    async def submit(
+        self,
+        params: dict[str, Any],
+        trigger: str = "manual"
+    ) -> dict[str, Any]:
+        """
+        Queue an ingestion job
+
+        An identical job that is still waiting in the queue is returned
+        instead of queueing the same work twice.
+
+        Args:
+            params: IngestionPipeline.run() arguments (category, hours,
+                incremental, sources)
+            trigger: Schedule name, or "manual" for API requests
+
+        Returns:
+            Job dictionary
+        """
+        self._ensure_worker()
+
+        for job_id in self._active:
+            job = self.store.get_job(job_id)
+            if job and job["status"] == "queued" and job["params"] == params:
+                return job
+
+        job = self.store.create_job(trigger, params)
+        self._track(job)
+        self.logger.info(f"Queued ingestion job {job['id']} ({trigger})")
+        return job
+
+    def get_job(self, job_id: str) -> Optional[dict[str, Any]]:
+        """
+        Get a job with its latest progress
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job dictionary, or None if unknown
+        """
+        job = self.store.get_job(job_id)
+        if job is not None and job_id in self._progress:
+            job["progress"] = self._progress[job_id]
+        return job
+
+    def list_jobs(self, limit: int = 50, status: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        List jobs newest first
+
+        Args:
+            limit: Maximum jobs returned
+            status: Only jobs with this status
+
+        Returns:
+            Job dictionaries
+        """
+        return self.store.list_jobs(limit=limit, status=status)
+
+    def get_schedules(self) -> list[dict[str, Any]]:
+        """
+        Describe the configured schedules with their persisted state
+
+        Returns:
+            Schedule dictionaries
+        """
+        schedules = []
+        for name, schedule in self.schedules.items():
+            state = self.store.get_schedule(name)
+            next_run_ts = state.pop("next_run_ts")
+            schedules.append({
+                "name": name,
+                **schedule,
+                **state,
+                "next_run_at": (
+                    datetime.fromtimestamp(next_run_ts, timezone.utc).isoformat() if next_run_ts else None
+                )
+            })
+        return schedules
+
+    async def watch(self, job_id: str) -> AsyncIterator[dict[str, Any]]:
+        """
+        Follow a job until it finishes
+
+        Args:
+            job_id: Job ID
+
+        Yields:
+            Job snapshots: the current state, then one per progress update
+            and a final one once the job has finished
+        """
+        updates: asyncio.Queue = asyncio.Queue(maxsize=16)
+        self._subscribers.setdefault(job_id, []).append(updates)
+
+        try:
+            job = self.get_job(job_id)
+            if job is None:
+                return
+            yield job
+
+            while job["status"] in ACTIVE_STATUSES:
+                await updates.get()
+                # Skip to the newest state if updates piled up
+                while not updates.empty():
+                    updates.get_nowait()
+
+                job = self.get_job(job_id)
+                yield job
+        finally:
+            self._subscribers[job_id].remove(updates)
+            if not self._subscribers[job_id]:
+                del self._subscribers[job_id]
+
+    def _notify(self, job_id: str) -> None:
+        """Wake the stream subscribers of a job"""
+        for updates in self._subscribers.get(job_id, []):
+            if not updates.full():
+                updates.put_nowait(True)
+
+    async def _worker(self) -> None:
+        """Run queued jobs one at a time; an error in one job never stops the worker"""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(job_id)
+            except Exception as e:
+                # E.g. "database is locked" while reading or updating the job
+                self.logger.error(f"Ingestion job {job_id} stopped by an error: {e}")
+                try:
+                    self.store.update_job(
+                        job_id,
+                        status="failed",
+                        error=str(e),
+                        finished_at=datetime.now().isoformat()
+                    )
+                except Exception as store_error:
+                    self.logger.error(f"Could not mark ingestion job {job_id} failed: {store_error}")
+            finally:
+                self._active.pop(job_id, None)
+                self._progress.pop(job_id, None)
+                self._notify(job_id)
+
+            try:
+                self.store.prune_jobs(self.keep_jobs)
+            except Exception as e:
+                self.logger.error(f"Error pruning ingestion jobs: {e}")
+
+    async def _run_job(self, job_id: str) -> None:
+        """
+        Run one job through the ingestion pipeline
+
+        Args:
+            job_id: Job ID
+        """
+        job = self.store.get_job(job_id)
+        if job is None or job["status"] != "queued":
+            return
+
+        self.store.update_job(job_id, status="running", started_at=datetime.now().isoformat())
+        self._notify(job_id)
+        self.logger.info(f"Running ingestion job {job_id} ({job['trigger']})")
+
+        last_saved = 0.0
+
+        def on_progress(stats: dict[str, Any]) -> None:
+            nonlocal last_saved
+            self._progress[job_id] = copy.deepcopy(stats)
+            self._notify(job_id)
+
+            now = time.monotonic()
+            if now - last_saved >= PROGRESS_SAVE_INTERVAL:
+                self.store.update_job(job_id, progress=self._progress[job_id])
+                last_saved = now
+
+        try:
+            pipeline = IngestionPipeline(self.config, progress=on_progress)
+            result = await pipeline.run(**job["params"])
+        except asyncio.CancelledError:
+            # Shutdown: leave the job for the next start
+            self.store.update_job(job_id, status="queued", started_at=None)
+            self._set_schedule_status(job, "queued")
+            raise
+        except Exception as e:
+            self.logger.error(f"Ingestion job {job_id} failed: {e}")
+            self.store.update_job(
+                job_id,
+                status="failed",
+                error=str(e),
+                progress=self._progress.get(job_id),
+                finished_at=datetime.now().isoformat()
+            )
+            self._set_schedule_status(job, "failed")
+            return
+
+        # Unsaved articles are fetched again by the next run (the marks did not move)
+        status = "failed" if result["total_failed"] else "completed"
+        self.store.update_job(
+            job_id,
+            status=status,
+            error=f"Failed to save {result['total_failed']} articles" if result["total_failed"] else None,
+            progress=result["pipeline"],
+            result=result,
+            finished_at=datetime.now().isoformat()
+        )
+        self._set_schedule_status(job, status)
+        self.logger.info(f"Ingestion job {job_id} saved {result['total_saved']} articles")
+
+    def _set_schedule_status(self, job: dict[str, Any], status: str) -> None:
+        """Record the outcome of a scheduled job on its schedule"""
+        if job["trigger"] in self.schedules:
+            self.store.set_schedule(job["trigger"], last_status=status)
+
+    async def _schedule_loop(self) -> None:
+        """Queue schedules as they fall due"""
+        while True:
+            try:
+                wake_ts = self._run_due_schedules(time.time())
+            except Exception as e:
+                self.logger.error(f"Error checking ingestion schedules: {e}")
+                wake_ts = time.time() + self.poll_interval
+
+            await asyncio.sleep(max(1.0, min(self.poll_interval, wake_ts - time.time())))
+
+    def _run_due_schedules(self, now_ts: float) -> float:
+        """
+        Queue every due schedule and plan its next run
+
+        A schedule that fell due while the process was down runs once on
+        the first check after startup.
+
+        Args:
+            now_ts: Current timestamp
+
+        Returns:
+            Timestamp of the earliest next run
+        """
+        wake_ts = now_ts + self.poll_interval
+
+        for name, schedule in self.schedules.items():
+            state = self.store.get_schedule(name)
+            next_run_ts = state["next_run_ts"]
+
+            if next_run_ts is None:
+                next_run_ts = self._plan_next_run(schedule, now_ts)
+                self.store.set_schedule(name, next_run_ts=next_run_ts)
+
+            elif next_run_ts <= now_ts:
+                busy = set(schedule["sources"]) & set().union(*self._active.values())
+
+                if busy:
+                    self.logger.info(f"Skipping schedule {name}: {', '.join(sorted(busy))} still in progress")
+                    self.store.set_schedule(name, last_status="skipped")
+                else:
+                    params = {
+                        "category": schedule["category"],
+                        "hours": schedule["hours"],
+                        "incremental": None,
+                        "sources": schedule["sources"]
+                    }
+                    job = self.store.create_job(name, params)
+                    self._track(job)
+                    self.store.set_schedule(
+                        name,
+                        last_run_at=datetime.now().isoformat(),
+                        last_job_id=job["id"],
+                        last_status="queued"
+                    )
+
+                next_run_ts = self._plan_next_run(schedule, now_ts)
+                self.store.set_schedule(name, next_run_ts=next_run_ts)
+
+            wake_ts = min(wake_ts, next_run_ts)
+
+        return wake_ts
+
+    def _plan_next_run(self, schedule: dict[str, Any], now_ts: float) -> float:
+        """
+        Next run timestamp of a schedule, including jitter
+
+        Args:
+            schedule: Resolved schedule
+            now_ts: Current timestamp
+
+        Returns:
+            Timestamp
+        """
+        run = next_run_time(
+            schedule["frequency"],
+            schedule["time"],
+            datetime.fromtimestamp(now_ts, timezone.utc),
+            schedule["interval_minutes"]
+        )
+        return run.timestamp() + random.uniform(0, self.jitter_seconds)
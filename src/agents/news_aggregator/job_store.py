@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+"""
+JobStore - Persisted state of background ingestion jobs
+
+Keeps every ingestion job (queued, running or finished) with its
+parameters, latest progress and result, plus the next due time of each
+schedule, so the scheduler resumes interrupted jobs and keeps its cadence
+across restarts.
+"""
+
+from datetime import datetime
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any, Optional
+import uuid
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingestion_jobs (
+    id TEXT PRIMARY KEY,
+    trigger TEXT NOT NULL,
+    params TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    progress TEXT,
+    result TEXT,
+    error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_status ON ingestion_jobs(status, created_at);
+
+CREATE TABLE IF NOT EXISTS ingestion_schedules (
+    name TEXT PRIMARY KEY,
+    next_run_ts REAL,
+    last_run_at TEXT,
+    last_job_id TEXT,
+    last_status TEXT
+);
+"""
+
+# Job statuses that still have work to do
+ACTIVE_STATUSES = ("queued", "running")
+
+# Columns stored as JSON text
+_JSON_COLUMNS = ("params", "progress", "result")
+
+
+class JobStore:
+    """SQLite-backed store of ingestion jobs and schedule state"""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize job store
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def create_job(self, trigger: str, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Add a queued job
+
+        Args:
+            trigger: Schedule name, or "manual" for API requests
+            params: IngestionPipeline.run() arguments
+
+        Returns:
+            Job dictionary
+        """
+        job_id = f"ingest_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO ingestion_jobs (id, trigger, params, status, created_at)
+                VALUES (?, ?, ?, 'queued', ?)
+                """,
+                (job_id, trigger, json.dumps(params), datetime.now().isoformat())
+            )
+
+        return self.get_job(job_id)
+
+    def update_job(self, job_id: str, **fields: Any) -> None:
+        """
+        Update columns of a job
+
+        Args:
+            job_id: Job ID
+            **fields: Column values (params, progress and result are JSON-encoded)
+        """
+        if not fields:
+            return
+
+        values = [
+            json.dumps(value) if column in _JSON_COLUMNS and value is not None else value
+            for column, value in fields.items()
+        ]
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+
+        with self.conn:
+            self.conn.execute(f"UPDATE ingestion_jobs SET {assignments} WHERE id = ?", (*values, job_id))
+
+    def get_job(self, job_id: str) -> Optional[dict[str, Any]]:
+        """
+        Get a job
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job dictionary, or None if unknown
+        """
+        row = self.conn.execute("SELECT * FROM ingestion_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, limit: int = 50, status: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        List jobs newest first
+
+        Args:
+            limit: Maximum jobs returned
+            status: Only jobs with this status
+
+        Returns:
+            Job dictionaries
+        """
+        if status:
+            rows = self.conn.execute(
+                "SELECT * FROM ingestion_jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?",
+                (status, limit)
+            ).fetchall()
+        else:
+            rows = self.conn.execute(
+                "SELECT * FROM ingestion_jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+        return [self._row_to_job(row) for row in rows]
+
+    def active_jobs(self) -> list[dict[str, Any]]:
+        """
+        Get queued and running jobs oldest first
+
+        Returns:
+            Job dictionaries
+        """
+        rows = self.conn.execute(
+            f"SELECT * FROM ingestion_jobs WHERE status IN ({', '.join('?' * len(ACTIVE_STATUSES))}) "
+            "ORDER BY created_at",
+            ACTIVE_STATUSES
+        ).fetchall()
+
+        return [self._row_to_job(row) for row in rows]
+
+    def prune_jobs(self, keep: int) -> int:
+        """
+        Delete the oldest finished jobs beyond a limit
+
+        Args:
+            keep: Number of finished jobs kept
+
+        Returns:
+            Number of jobs deleted
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                f"""
+                DELETE FROM ingestion_jobs
+                WHERE status NOT IN ({', '.join('?' * len(ACTIVE_STATUSES))})
+                AND id NOT IN (
+                    SELECT id FROM ingestion_jobs
+                    WHERE status NOT IN ({', '.join('?' * len(ACTIVE_STATUSES))})
+                    ORDER BY created_at DESC LIMIT ?
+                )
+                """,
+                (*ACTIVE_STATUSES, *ACTIVE_STATUSES, keep)
+            )
+            return cursor.rowcount
+
+    def get_schedule(self, name: str) -> dict[str, Any]:
+        """
+        Get the stored state of a schedule
+
+        Args:
+            name: Schedule name
+
+        Returns:
+            Dictionary with next_run_ts, last_run_at, last_job_id and
+            last_status (values are None for a new schedule)
+        """
+        row = self.conn.execute(
+            "SELECT next_run_ts, last_run_at, last_job_id, last_status FROM ingestion_schedules WHERE name = ?",
+            (name,)
+        ).fetchone()
+
+        if row is None:
+            return {"next_run_ts": None, "last_run_at": None, "last_job_id": None, "last_status": None}
+
+        return dict(row)
+
+    def set_schedule(self, name: str, **fields: Any) -> None:
+        """
+        Update the stored state of a schedule
+
+        Args:
+            name: Schedule name
+            **fields: next_run_ts, last_run_at, last_job_id and/or last_status
+        """
+        state = self.get_schedule(name)
+        state.update(fields)
+
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO ingestion_schedules (name, next_run_ts, last_run_at, last_job_id, last_status)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    next_run_ts = excluded.next_run_ts,
+                    last_run_at = excluded.last_run_at,
+                    last_job_id = excluded.last_job_id,
+                    last_status = excluded.last_status
+                """,
+                (name, state["next_run_ts"], state["last_run_at"], state["last_job_id"], state["last_status"])
+            )
+
+    def _row_to_job(self, row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a job row to a dictionary with decoded JSON columns"""
+        job = dict(row)
+        for column in _JSON_COLUMNS:
+            if job[column] is not None:
+                job[column] = json.loads(job[column])
+        return job
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""
+Compiled multi-keyword matcher for rule-based categorization
+
+All category keywords are compiled into one regular expression, so a text
+is scanned once instead of once per keyword. The pattern is a lookahead
+alternation ordered longest-first: at every position it reports the
+longest keyword that matches there, and shorter keywords matching at the
+same position (which must be prefixes of it ending on a word boundary) are
+credited from a precomputed table. Counts are identical to running
+``re.findall(r"\\bkeyword\\b", text)`` for every keyword separately.
+"""
+
+import re
+from typing import Optional
+
+
+class KeywordMatcher:
+    """Scores texts against keyword lists of several categories in one pass"""
+
+    def __init__(self, category_keywords: dict[str, list[str]]):
+        """
+        Compile the matcher
+
+        Args:
+            category_keywords: Dictionary mapping category names to keywords
+                (a keyword listed twice counts twice)
+        """
+        self.categories = list(category_keywords.keys())
+
+        # Keyword -> per-category weight (number of times it is listed)
+        self.keywords: list[str] = []
+        self._keyword_index: dict[str, int] = {}
+        self._weights: list[dict[int, int]] = []
+
+        for c, keywords in enumerate(category_keywords.values()):
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                if keyword not in self._keyword_index:
+                    self._keyword_index[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    self._weights.append({})
+                k = self._keyword_index[keyword]
+                self._weights[k][c] = self._weights[k].get(c, 0) + 1
+
+        # Keywords credited when a longer keyword matches at the same position
+        self._closure: list[list[int]] = [
+            [self._keyword_index[prefix] for prefix in self._boundary_prefixes(keyword)] + [k]
+            for k, keyword in enumerate(self.keywords)
+        ]
+
+        self._pattern: Optional[re.Pattern] = None
+        if self.keywords:
+            alternation = "|".join(
+                re.escape(keyword) for keyword in sorted(self.keywords, key=len, reverse=True)
+            )
+            self._pattern = re.compile(rf"(?=\b({alternation})\b)", re.IGNORECASE)
+
+    def _boundary_prefixes(self, keyword: str) -> list[str]:
+        """
+        Find other keywords that are prefixes of a keyword ending on a word boundary
+
+        Args:
+            keyword: Keyword
+
+        Returns:
+            Prefix keywords
+        """
+        prefixes = []
+        for i in range(1, len(keyword)):
+            prefix = keyword[:i]
+            if prefix in self._keyword_index and _is_word(keyword[i - 1]) != _is_word(keyword[i]):
+                prefixes.append(prefix)
+        return prefixes
+
+    def keyword_counts(self, text: str) -> dict[int, int]:
+        """
+        Count keyword occurrences in a text
+
+        Args:
+            text: Input text
+
+        Returns:
+            Dictionary mapping keyword index to occurrence count
+        """
+        counts: dict[int, int] = {}
+        if self._pattern is None or not text:
+            return counts
+
+        last_end: dict[int, int] = {}
+
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for k in self._closure[self._keyword_index[match.group(1).lower()]]:
+                # Occurrences of one keyword never overlap, as with re.findall
+                if start < last_end.get(k, 0):
+                    continue
+                counts[k] = counts.get(k, 0) + 1
+                last_end[k] = start + len(self.keywords[k])
+
+        return counts
+
+    def score(self, text: str) -> list[int]:
+        """
+        Score a text against every category
+
+        Args:
+            text: Input text
+
+        Returns:
+            Score per category, in the order of self.categories
+        """
+        scores = [0] * len(self.categories)
+        for k, count in self.keyword_counts(text).items():
+            for c, weight in self._weights[k].items():
+                scores[c] += count * weight
+        return scores
+
+    def score_batch(self, texts: list[str]) -> list[list[int]]:
+        """
+        Score many texts against every category
+
+        Keyword counts of the whole batch are collected into a sparse
+        document-keyword matrix and multiplied by the keyword-category
+        weight matrix in one step.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Score rows, one per text, in the order of self.categories
+        """
+        try:
+            import numpy as np
+            from scipy.sparse import csr_matrix
+        except ImportError:
+            return [self.score(text) for text in texts]
+
+        rows, cols, values = [], [], []
+        for row, text in enumerate(texts):
+            for k, count in self.keyword_counts(text).items():
+                rows.append(row)
+                cols.append(k)
+                values.append(count)
+
+        counts = csr_matrix(
+            (values, (rows, cols)),
+            shape=(len(texts), len(self.keywords)),
+            dtype=np.int64
+        )
+
+        weights = np.zeros((len(self.keywords), len(self.categories)), dtype=np.int64)
+        for k, category_weights in enumerate(self._weights):
+            for c, weight in category_weights.items():
+                weights[k, c] = weight
+
+        return np.asarray(counts @ weights).tolist()
+
+
+def _is_word(char: str) -> bool:
+    """Check whether a character counts as a word character for \\b"""
+    return char.isalnum() or char == "_"
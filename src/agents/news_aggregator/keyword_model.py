@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+"""
+Corpus-level TF-IDF keyword model
+
+Keeps document frequencies for every term seen across the parsed corpus and
+persists them between runs, so keyword weights reflect how rare a term is
+in the news corpus rather than in a single article. A batch of articles is
+counted with one vectorizer pass, folded into the document frequencies, and
+weighted and ranked with sparse-matrix operations.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+
+class KeywordModel:
+    """Incrementally updated document-frequency model for keyword extraction"""
+
+    def __init__(self, path: Optional[Path] = None, max_terms: int = 200000, ngram_range: tuple[int, int] = (1, 2)):
+        """
+        Initialize keyword model
+
+        Args:
+            path: JSON file the model is loaded from and saved to (None = in memory)
+            max_terms: Maximum terms kept; the rarest are pruned beyond this
+            ngram_range: Word n-gram range of candidate keywords
+        """
+        self.path = Path(path) if path else None
+        self.max_terms = max_terms
+        self.ngram_range = tuple(ngram_range)
+        self.n_docs = 0
+        self.df: dict[str, int] = {}
+        self._dirty = False
+
+        if self.path and self.path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def load(self) -> None:
+        """Load the model from its JSON file"""
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        self.n_docs = data.get("n_docs", 0)
+        self.df = data.get("df", {})
+        self._dirty = False
+
+    def save(self) -> None:
+        """Write the model to its JSON file if it changed"""
+        if not self.path or not self._dirty:
+            return
+
+        self._prune()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"n_docs": self.n_docs, "df": self.df}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+        self._dirty = False
+
+    def update(self, texts: Iterable[str]) -> None:
+        """
+        Add documents to the document frequencies without extracting keywords
+
+        Args:
+            texts: Document texts
+        """
+        texts = [text for text in texts if text]
+        if texts:
+            self._count(texts)
+
+    def extract_batch(self, texts: list[str], max_keywords: int = 10, update: bool = True) -> list[list[str]]:
+        """
+        Extract keywords for a batch of documents
+
+        Args:
+            texts: Document texts
+            max_keywords: Keywords returned per document
+            update: Fold the batch into the document frequencies first
+
+        Returns:
+            Keyword list per document, in input order
+        """
+        results: list[list[str]] = [[] for _ in texts]
+        positions = [i for i, text in enumerate(texts) if text]
+        if not positions:
+            return results
+
+        counts, terms = self._count([texts[i] for i in positions], update=update)
+        if counts is None:
+            return results
+
+        # Corpus IDF for the batch vocabulary (smoothed as in scikit-learn)
+        df = np.array([self.df.get(term, 0) for term in terms], dtype=np.float64)
+        idf = np.log((1 + self.n_docs) / (1 + df)) + 1
+
+        weights = counts.multiply(idf).tocsr()
+
+        for row, position in enumerate(positions):
+            start, end = weights.indptr[row], weights.indptr[row + 1]
+            if start == end:
+                continue
+
+            scores = weights.data[start:end]
+            columns = weights.indices[start:end]
+            top = np.argsort(-scores, kind="stable")[:max_keywords]
+            results[position] = [terms[columns[i]] for i in top]
+
+        return results
+
+    def _count(self, texts: list[str], update: bool = True) -> tuple[Any, list[str]]:
+        """
+        Count terms of a batch and optionally update document frequencies
+
+        Args:
+            texts: Non-empty document texts
+            update: Add the batch to the document frequencies
+
+        Returns:
+            Tuple of (sparse count matrix, column terms), or (None, []) if the
+            batch has no usable terms
+        """
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        vectorizer = CountVectorizer(stop_words="english", ngram_range=self.ngram_range)
+        try:
+            counts = vectorizer.fit_transform(texts)
+        except ValueError:
+            # Only stop words or empty documents
+            return None, []
+
+        terms = vectorizer.get_feature_names_out().tolist()
+
+        if update:
+            doc_freq = np.asarray((counts > 0).sum(axis=0)).ravel()
+            for term, freq in zip(terms, doc_freq):
+                self.df[term] = self.df.get(term, 0) + int(freq)
+            self.n_docs += len(texts)
+            self._dirty = True
+
+        return counts, terms
+
+    def _prune(self) -> None:
+        """Drop the rarest terms when the vocabulary exceeds max_terms"""
+        if len(self.df) <= self.max_terms:
+            return
+
+        cutoff = sorted(self.df.values(), reverse=True)[self.max_terms - 1]
+        kept = {term: freq for term, freq in self.df.items() if freq > cutoff}
+        for term, freq in self.df.items():
+            if len(kept) >= self.max_terms:
+                break
+            if freq == cutoff:
+                kept[term] = freq
+        self.df = kept
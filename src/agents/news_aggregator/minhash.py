@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+"""
+MinHash signatures and locality-sensitive hashing for near-duplicate text
+
+Texts are reduced to character (or word) shingles, each shingle set to a fixed-length
+MinHash signature, and signatures are split into bands. Two texts land in
+the same bucket of some band with a probability that rises steeply with
+their Jaccard similarity, so bucket collisions give a small candidate set
+that can then be checked exactly.
+"""
+
+from collections import defaultdict
+import random
+import re
+from typing import Any, Hashable, Optional
+import zlib
+
+# Mersenne prime 2^31 - 1: keeps (a * x + b) within 64 bits for 32-bit hashes
+_PRIME = (1 << 31) - 1
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    Normalize text for signature computation
+
+    Args:
+        text: Input text
+
+    Returns:
+        Lowercased text with collapsed whitespace
+    """
+    if not text:
+        return ""
+
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+class MinHasher:
+    """Computes MinHash signatures over character or word shingles"""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1, shingle_unit: str = "char"):
+        """
+        Initialize MinHasher
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            shingle_size: Shingle length in characters or words
+            seed: Seed for the permutation coefficients
+            shingle_unit: "char" or "word"
+        """
+        if shingle_unit not in ("char", "word"):
+            raise ValueError(f"shingle_unit must be 'char' or 'word', got {shingle_unit!r}")
+
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.shingle_unit = shingle_unit
+
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+
+        try:
+            import numpy as np
+
+            self._np = np
+            self._a_arr = np.array(self._a, dtype=np.uint64)[:, None]
+            self._b_arr = np.array(self._b, dtype=np.uint64)[:, None]
+        except ImportError:
+            self._np = None
+
+    def shingles(self, text: str) -> set[str]:
+        """
+        Split text into overlapping character or word shingles
+
+        Args:
+            text: Normalized text
+
+        Returns:
+            Set of shingles
+        """
+        k = self.shingle_size
+
+        if self.shingle_unit == "word":
+            words = re.findall(r"\w+", text)
+            if len(words) <= k:
+                return {" ".join(words)} if words else set()
+            return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+        if len(text) <= k:
+            return {text} if text else set()
+
+        return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        """
+        Compute the MinHash signature of a text
+
+        Args:
+            text: Input text (normalized internally)
+
+        Returns:
+            Signature tuple of length num_perm (empty for empty text)
+        """
+        shingles = self.shingles(normalize_text(text))
+        if not shingles:
+            return ()
+
+        hashes = [zlib.crc32(s.encode("utf-8")) & _PRIME for s in shingles]
+
+        if self._np is not None:
+            np = self._np
+            values = np.array(hashes, dtype=np.uint64)[None, :]
+            permuted = (self._a_arr * values + self._b_arr) % _PRIME
+            return tuple(int(v) for v in permuted.min(axis=1))
+
+        return tuple(
+            min((a * h + b) % _PRIME for h in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    @staticmethod
+    def jaccard(sig1: tuple[int, ...], sig2: tuple[int, ...]) -> float:
+        """
+        Estimate Jaccard similarity from two signatures
+
+        Args:
+            sig1: First signature
+            sig2: Second signature
+
+        Returns:
+            Estimated similarity (0.0 to 1.0)
+        """
+        if not sig1 or not sig2:
+            return 0.0
+
+        return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class LSHIndex:
+    """Banded LSH index over MinHash signatures"""
+
+    def __init__(self, num_perm: int = 128, bands: int = 32):
+        """
+        Initialize LSH index
+
+        Args:
+            num_perm: Signature length (must be divisible by bands)
+            bands: Number of bands; rows per band = num_perm // bands
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: list[dict[tuple[int, ...], set[Hashable]]] = [
+            defaultdict(set) for _ in range(bands)
+        ]
+        self._signatures: dict[Hashable, tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def band_keys(self, signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        """
+        Split a signature into its band keys
+
+        Args:
+            signature: MinHash signature
+
+        Returns:
+            One tuple per band
+        """
+        r = self.rows
+        return [signature[i * r:(i + 1) * r] for i in range(self.bands)]
+
+    def insert(self, key: Hashable, signature: tuple[int, ...]) -> None:
+        """
+        Add a signature to the index
+
+        Args:
+            key: Identifier returned by query()
+            signature: MinHash signature
+        """
+        if not signature:
+            return
+
+        if key in self._signatures:
+            self.remove(key)
+
+        self._signatures[key] = signature
+        for band, band_key in enumerate(self.band_keys(signature)):
+            self._buckets[band][band_key].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove a signature from the index
+
+        Args:
+            key: Identifier passed to insert()
+        """
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+
+        for band, band_key in enumerate(self.band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def query(self, signature: tuple[int, ...]) -> set[Hashable]:
+        """
+        Find keys that share at least one band with the signature
+
+        Args:
+            signature: MinHash signature
+
+        Returns:
+            Set of candidate keys
+        """
+        candidates: set[Hashable] = set()
+        if not signature:
+            return candidates
+
+        for band, band_key in enumerate(self.band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                candidates.update(bucket)
+
+        return candidates
+
+    def get_signature(self, key: Hashable) -> Optional[tuple[int, ...]]:
+        """Return the stored signature for a key"""
+        return self._signatures.get(key)
+
+
+def build_lsh(config: dict[str, Any]) -> tuple[MinHasher, LSHIndex]:
+    """
+    Build a MinHasher and an empty LSH index from a config block
+
+    Args:
+        config: Dictionary with optional num_perm, bands, shingle_size,
+            shingle_unit and seed
+
+    Returns:
+        Tuple of (hasher, index)
+    """
+    num_perm = config.get("num_perm", 128)
+    hasher = MinHasher(
+        num_perm=num_perm,
+        shingle_size=config.get("shingle_size", 3),
+        seed=config.get("seed", 1),
+        shingle_unit=config.get("shingle_unit", "char")
+    )
+    return hasher, LSHIndex(num_perm=num_perm, bands=config.get("bands", 32))
+
@@ -9,14 +9,121 @@ Handles news aggregation from:
 """
 
 import asyncio
-from datetime import datetime, timedelta
+from concurrent.futures import Executor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Optional
 import hashlib
 import json
 
 from src.core.logging import get_logger
 
+from .fetch_state import FetchStateStore
+from .http_client import RateLimitedClient
+from .worker_pool import get_executor
+
+# Source names accepted by stream_sources(sources=...)
+SOURCE_NAMES = ["newsapi", "guardian", "rss"]
+
+
+def generate_article_id(article: dict) -> str:
+    """
+    Generate unique ID for an article based on URL or title
+
+    Args:
+        article: Article dictionary
+
+    Returns:
+        Unique article ID (SHA256 hash)
+    """
+    # Try URL first, fallback to title + published date
+    identifier = article.get("url") or article.get("link")
+    if not identifier:
+        title = article.get("title", "")
+        published = article.get("published_at") or article.get("published") or article.get("webPublicationDate", "")
+        identifier = f"{title}_{published}"
+
+    return hashlib.sha256(identifier.encode()).hexdigest()[:16]
+
+
+def _published_timestamp(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a publish date (ISO 8601 or RFC 822) into a UTC timestamp
+
+    Args:
+        value: Date string as returned by the source
+
+    Returns:
+        POSIX timestamp, or None if the date cannot be parsed
+    """
+    if not value:
+        return None
+
+    try:
+        published = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            published = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+
+    return published.timestamp()
+
+
+def parse_feed(body: bytes, feed_config: dict[str, Any], headers: dict[str, str]) -> list[dict[str, Any]]:
+    """
+    Parse a downloaded RSS/Atom feed into article dictionaries
+
+    Runs in a worker process, so it only takes and returns plain data.
+
+    Args:
+        body: Raw feed document
+        feed_config: Feed entry from sources.rss_feeds
+        headers: Lowercased response headers (used for encoding and base URL detection)
+
+    Returns:
+        List of articles
+    """
+    import feedparser
+
+    name = feed_config.get("name", "Unknown")
+    language = feed_config.get("language", "en")
+    credibility = feed_config.get("credibility_score", 0.85)
+
+    response_headers = dict(headers)
+    response_headers.setdefault("content-location", feed_config.get("url", ""))
+    feed = feedparser.parse(body, response_headers=response_headers)
+
+    articles = []
+    for entry in feed.entries:
+        # Try to extract category from tags
+        category = "general"
+        if hasattr(entry, "tags") and entry.tags:
+            category = entry.tags[0].get("term", "general")
+
+        articles.append({
+            "id": generate_article_id(entry),
+            "source": "rss",
+            "source_name": name,
+            "title": entry.get("title"),
+            "description": entry.get("summary", ""),
+            "content": entry.get("content", [{}])[0].get("value", entry.get("summary", "")),
+            "url": entry.get("link"),
+            "image_url": entry.get("media_thumbnail", [{}])[0].get("url") if hasattr(entry, "media_thumbnail") else None,
+            "published_at": entry.get("published", entry.get("updated")),
+            "author": entry.get("author"),
+            "category": category,
+            "language": language,
+            "credibility_score": credibility,
+            "fetched_at": datetime.now().isoformat()
+        })
+
+    return articles
+
 
 class NewsScraperAgent:
     """Agent for scraping news from multiple sources"""
@@ -41,257 +148,449 @@ class NewsScraperAgent:
         self.sources_config = self.news_config.get("sources", {})
         self.update_frequency = self.news_config.get("update_frequency", "daily")
 
+        # HTTP settings and per-source rate limits
+        self.http_config = self.news_config.get("http", {})
+        self.rate_limits = {
+            name: source.get("rate_limit", {})
+            for name, source in self.sources_config.items()
+            if isinstance(source, dict)
+        }
+
+        # RSS options and persisted per-feed fetch state
+        self.rss_config = self.sources_config.get("rss", {})
+        storage_config = self.news_config.get("storage", {})
+        self.fetch_state = FetchStateStore(
+            Path(storage_config.get("fetch_state", self.base_dir / "fetch_state.db"))
+        )
+
+        # Incremental fetching: stop each stream at its high-water mark
+        self.incremental_config = self.news_config.get("incremental", {})
+        self.incremental = self.incremental_config.get("enabled", True)
+        self.max_seen_ids = self.incremental_config.get("max_seen_ids", 1000)
+        # Items dated this far before the mark may still be new (late additions, ranked lists)
+        self.grace_seconds = self.incremental_config.get("grace_hours", 24) * 3600
+        self._since_ts: Optional[float] = None
+        self._pending_marks: dict[str, dict[str, Any]] = {}
+        self._pending_validators: dict[str, tuple[Optional[str], Optional[str]]] = {}
+
         # Categories and languages
         self.categories = self.news_config.get("categories", ["general"])
         self.languages = self.news_config.get("languages", ["en"])
 
         self.logger.info(f"NewsScraperAgent initialized with {len(self.categories)} categories")
 
-    async def fetch_all_sources(self) -> list[dict[str, Any]]:
+    async def fetch_all_sources(self, incremental: Optional[bool] = None) -> list[dict[str, Any]]:
         """
         Fetch news from all configured sources
 
+        In incremental mode each source stream stops paginating at a page
+        holding only items ingested by a previous fetch, so a run costs
+        requests in proportion to the new items only. The marks are not
+        advanced here: call commit_marks() once the articles are stored.
+
+        Args:
+            incremental: Override the configured incremental mode
+
         Returns:
             List of raw article dictionaries
         """
         self.logger.info("Starting news aggregation from all sources...")
 
-        all_articles = []
+        all_articles = await self._collect(incremental=incremental)
+
+        self.logger.info(f"Fetched {len(all_articles)} articles from all sources")
+        return all_articles
 
-        # Fetch from different sources concurrently
-        tasks = []
+    async def stream_sources(
+        self,
+        incremental: Optional[bool] = None,
+        category: Optional[str] = None,
+        hours: Optional[int] = None,
+        save_raw: bool = False,
+        sources: Optional[list[str]] = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Fetch all configured sources concurrently, yielding each source's
+        articles as soon as that source finishes
+
+        Stream marks and feed validators are not advanced here: call
+        commit_marks() once the yielded articles have been stored.
 
-        if self.sources_config.get("newsapi", {}).get("enabled", False):
-            tasks.append(self._fetch_newsapi())
+        Args:
+            incremental: Override the configured incremental mode
+            category: Only fetch this category
+            hours: Only keep articles published in the last N hours
+            save_raw: Save each yielded batch as a raw article file
+            sources: Only fetch these sources (names from SOURCE_NAMES, default all)
+
+        Yields:
+            Lists of raw article dictionaries
+        """
+        original_state = (self.incremental, self.categories, self._since_ts)
+        if incremental is not None:
+            self.incremental = incremental
+        if category:
+            self.categories = [category]
 
-        if self.sources_config.get("guardian", {}).get("enabled", False):
-            tasks.append(self._fetch_guardian())
+        cutoff_ts = (datetime.now() - timedelta(hours=hours)).timestamp() if hours else None
+        self._since_ts = cutoff_ts
+        self._pending_marks = {}
+        self._pending_validators = {}
 
-        if self.sources_config.get("rss_feeds"):
-            tasks.append(self._fetch_rss_feeds())
+        try:
+            # Fetch from different sources concurrently over one shared HTTP session
+            async with RateLimitedClient(self.http_config, self.rate_limits) as client:
+                fetches = []
+                selected = set(sources or SOURCE_NAMES)
 
-        # Execute all fetch tasks concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+                if "newsapi" in selected and self.sources_config.get("newsapi", {}).get("enabled", False):
+                    fetches.append(self._fetch_newsapi(client))
 
-        for result in results:
-            if isinstance(result, Exception):
-                self.logger.error(f"Error fetching from source: {result}")
-            elif isinstance(result, list):
-                all_articles.extend(result)
+                if "guardian" in selected and self.sources_config.get("guardian", {}).get("enabled", False):
+                    fetches.append(self._fetch_guardian(client))
 
-        self.logger.info(f"Fetched {len(all_articles)} articles from all sources")
+                if "rss" in selected and self.sources_config.get("rss_feeds"):
+                    fetches.append(self._fetch_rss_feeds(client))
+
+                tasks = [asyncio.ensure_future(fetch) for fetch in fetches]
+
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        try:
+                            articles = await next_done
+                        except Exception as e:
+                            self.logger.error(f"Error fetching from source: {e}")
+                            continue
+
+                        # Filter by published date (sources that cannot stop early, e.g. RSS)
+                        if cutoff_ts is not None:
+                            articles = self._filter_since(articles, cutoff_ts)
+
+                        if not articles:
+                            continue
+
+                        if save_raw:
+                            await self._save_raw_articles(articles)
+
+                        yield articles
+                finally:
+                    for task in tasks:
+                        task.cancel()
+        finally:
+            self.incremental, self.categories, self._since_ts = original_state
+
+    def commit_marks(self) -> None:
+        """Move the stream marks and feed validators past the articles fetched by the last run"""
+        self.fetch_state.advance_marks(self._pending_marks, self.max_seen_ids)
+        for url, (etag, last_modified) in self._pending_validators.items():
+            self.fetch_state.set_validators(url, etag, last_modified)
+        self._pending_marks = {}
+        self._pending_validators = {}
+
+    async def _collect(self, **kwargs) -> list[dict[str, Any]]:
+        """
+        Fetch every source into one list and save it as a raw file
+
+        Stream marks stay pending until the caller has stored the articles
+        and calls commit_marks(); otherwise the next fetch returns them again.
+
+        Args:
+            **kwargs: Arguments for stream_sources()
+
+        Returns:
+            List of raw article dictionaries
+        """
+        all_articles = []
+        async for articles in self.stream_sources(**kwargs):
+            all_articles.extend(articles)
 
-        # Save raw articles
         await self._save_raw_articles(all_articles)
 
         return all_articles
 
-    async def _fetch_newsapi(self) -> list[dict[str, Any]]:
+    def _filter_since(self, articles: list[dict[str, Any]], cutoff_ts: float) -> list[dict[str, Any]]:
+        """
+        Keep articles published at or after a cutoff
+
+        Args:
+            articles: Articles to filter
+            cutoff_ts: Cutoff timestamp
+
+        Returns:
+            Articles with a publish date in the window (undated articles are
+            dropped, unparseable dates are kept)
+        """
+        recent_articles = []
+
+        for article in articles:
+            published_str = article.get("published_at")
+            if published_str:
+                published_ts = _published_timestamp(published_str)
+                # If parsing fails, include the article anyway
+                if published_ts is None or published_ts >= cutoff_ts:
+                    recent_articles.append(article)
+
+        return recent_articles
+
+    async def _fetch_newsapi(self, client: RateLimitedClient) -> list[dict[str, Any]]:
         """
         Fetch news from NewsAPI.org
 
+        Each (category, country) stream is paginated on its own, and streams
+        run concurrently within the client's concurrency and rate limits.
+
+        Args:
+            client: Shared HTTP client
+
         Returns:
             List of articles from NewsAPI
         """
         try:
             import os
-            from newsapi import NewsApiClient
 
             api_key = os.getenv("NEWSAPI_KEY")
             if not api_key:
                 self.logger.warning("NEWSAPI_KEY not set, skipping NewsAPI")
                 return []
 
-            newsapi = NewsApiClient(api_key=api_key)
-            articles = []
-
             newsapi_config = self.sources_config.get("newsapi", {})
             countries = newsapi_config.get("countries", ["us"])
-            page_size = newsapi_config.get("page_size", 100)
-            max_pages = newsapi_config.get("max_pages", 5)
 
             self.logger.info(f"Fetching from NewsAPI: {len(countries)} countries")
 
-            for category in self.categories:
-                for country in countries:
-                    try:
-                        # Fetch top headlines
-                        for page in range(1, max_pages + 1):
-                            response = newsapi.get_top_headlines(
-                                category=category,
-                                country=country,
-                                page_size=page_size,
-                                page=page
-                            )
-
-                            if response["status"] == "ok":
-                                for article in response.get("articles", []):
-                                    articles.append({
-                                        "id": self._generate_article_id(article),
-                                        "source": "newsapi",
-                                        "source_name": article.get("source", {}).get("name", "Unknown"),
-                                        "title": article.get("title"),
-                                        "description": article.get("description"),
-                                        "content": article.get("content"),
-                                        "url": article.get("url"),
-                                        "image_url": article.get("urlToImage"),
-                                        "published_at": article.get("publishedAt"),
-                                        "author": article.get("author"),
-                                        "category": category,
-                                        "country": country,
-                                        "language": "en",  # NewsAPI primarily English
-                                        "fetched_at": datetime.now().isoformat()
-                                    })
-
-                            # Break if we got fewer articles than page size (last page)
-                            if len(response.get("articles", [])) < page_size:
-                                break
-
-                    except Exception as e:
-                        self.logger.error(f"Error fetching NewsAPI category {category}, country {country}: {e}")
+            streams = await asyncio.gather(*[
+                self._fetch_newsapi_stream(client, api_key, category, country)
+                for category in self.categories
+                for country in countries
+            ])
+
+            articles = [article for stream in streams for article in stream]
 
             self.logger.info(f"Fetched {len(articles)} articles from NewsAPI")
             return articles
 
-        except ImportError:
-            self.logger.error("newsapi-python not installed. Run: pip install newsapi-python")
-            return []
         except Exception as e:
             self.logger.error(f"Error in NewsAPI fetch: {e}")
             return []
 
-    async def _fetch_guardian(self) -> list[dict[str, Any]]:
+    async def _fetch_newsapi_stream(
+        self,
+        client: RateLimitedClient,
+        api_key: str,
+        category: str,
+        country: str
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all pages of NewsAPI top headlines for one category and country
+
+        Args:
+            client: Shared HTTP client
+            api_key: NewsAPI key
+            category: News category
+            country: Country code
+
+        Returns:
+            List of articles
+        """
+        newsapi_config = self.sources_config.get("newsapi", {})
+        page_size = newsapi_config.get("page_size", 100)
+        max_pages = newsapi_config.get("max_pages", 5)
+
+        stream = f"newsapi:{category}:{country}"
+        mark = self._load_mark(stream)
+        articles = []
+
+        try:
+            # Fetch top headlines (newest first)
+            for page in range(1, max_pages + 1):
+                response = await client.get_json(
+                    "newsapi",
+                    "https://newsapi.org/v2/top-headlines",
+                    params={
+                        "category": category,
+                        "country": country,
+                        "pageSize": page_size,
+                        "page": page
+                    },
+                    headers={"X-Api-Key": api_key}
+                )
+
+                page_articles = []
+                if response.get("status") == "ok":
+                    for article in response.get("articles", []):
+                        page_articles.append({
+                            "id": self._generate_article_id(article),
+                            "source": "newsapi",
+                            "source_name": (article.get("source") or {}).get("name", "Unknown"),
+                            "title": article.get("title"),
+                            "description": article.get("description"),
+                            "content": article.get("content"),
+                            "url": article.get("url"),
+                            "image_url": article.get("urlToImage"),
+                            "published_at": article.get("publishedAt"),
+                            "author": article.get("author"),
+                            "category": category,
+                            "country": country,
+                            "language": "en",  # NewsAPI primarily English
+                            "fetched_at": datetime.now().isoformat()
+                        })
+
+                fresh, page_behind = self._take_fresh(stream, mark, page_articles)
+                articles.extend(fresh)
+
+                # Headlines are ranked, not strictly dated: stop only at a page of
+                # already ingested items, or on the last page
+                if page_behind or len(response.get("articles", [])) < page_size:
+                    break
+
+        except Exception as e:
+            self.logger.error(f"Error fetching NewsAPI category {category}, country {country}: {e}")
+
+        return articles
+
+    async def _fetch_guardian(self, client: RateLimitedClient) -> list[dict[str, Any]]:
         """
         Fetch news from The Guardian API
 
+        Args:
+            client: Shared HTTP client
+
         Returns:
             List of articles from Guardian
         """
         try:
             import os
-            import aiohttp
 
             api_key = os.getenv("GUARDIAN_API_KEY")
             if not api_key:
                 self.logger.warning("GUARDIAN_API_KEY not set, skipping Guardian API")
                 return []
 
-            articles = []
-            guardian_config = self.sources_config.get("guardian", {})
-            page_size = guardian_config.get("page_size", 50)
-            max_pages = guardian_config.get("max_pages", 10)
-
             self.logger.info("Fetching from The Guardian API")
 
-            async with aiohttp.ClientSession() as session:
-                for category in self.categories:
-                    for page in range(1, max_pages + 1):
-                        url = "https://content.guardianapis.com/search"
-                        params = {
-                            "api-key": api_key,
-                            "section": category,
-                            "page-size": page_size,
-                            "page": page,
-                            "show-fields": "headline,body,thumbnail,byline",
-                            "order-by": "newest"
-                        }
-
-                        try:
-                            async with session.get(url, params=params) as response:
-                                if response.status == 200:
-                                    data = await response.json()
-                                    results = data.get("response", {}).get("results", [])
-
-                                    for article in results:
-                                        fields = article.get("fields", {})
-                                        articles.append({
-                                            "id": self._generate_article_id(article),
-                                            "source": "guardian",
-                                            "source_name": "The Guardian",
-                                            "title": fields.get("headline", article.get("webTitle")),
-                                            "description": fields.get("body", "")[:500],  # First 500 chars
-                                            "content": fields.get("body"),
-                                            "url": article.get("webUrl"),
-                                            "image_url": fields.get("thumbnail"),
-                                            "published_at": article.get("webPublicationDate"),
-                                            "author": fields.get("byline"),
-                                            "category": category,
-                                            "country": "gb",
-                                            "language": "en",
-                                            "fetched_at": datetime.now().isoformat()
-                                        })
-
-                                    # Break if we got fewer results than page size
-                                    if len(results) < page_size:
-                                        break
+            streams = await asyncio.gather(*[
+                self._fetch_guardian_section(client, api_key, category)
+                for category in self.categories
+            ])
 
-                        except Exception as e:
-                            self.logger.error(f"Error fetching Guardian page {page}: {e}")
+            articles = [article for stream in streams for article in stream]
 
             self.logger.info(f"Fetched {len(articles)} articles from The Guardian")
             return articles
 
-        except ImportError:
-            self.logger.error("aiohttp not installed. Run: pip install aiohttp")
-            return []
         except Exception as e:
             self.logger.error(f"Error in Guardian API fetch: {e}")
             return []
 
-    async def _fetch_rss_feeds(self) -> list[dict[str, Any]]:
+    async def _fetch_guardian_section(
+        self,
+        client: RateLimitedClient,
+        api_key: str,
+        category: str
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all pages of one Guardian section
+
+        Args:
+            client: Shared HTTP client
+            api_key: Guardian API key
+            category: Section name
+
+        Returns:
+            List of articles
+        """
+        guardian_config = self.sources_config.get("guardian", {})
+        page_size = guardian_config.get("page_size", 50)
+        max_pages = guardian_config.get("max_pages", 10)
+
+        stream = f"guardian:{category}"
+        mark = self._load_mark(stream)
+        articles = []
+
+        # Let the API skip content older than the mark (less the grace window) or the fetch window
+        mark_ts = mark["published_ts"] - self.grace_seconds if mark["published_ts"] else None
+        lower_ts = max(filter(None, [mark_ts, self._since_ts]), default=None)
+
+        for page in range(1, max_pages + 1):
+            params = {
+                "api-key": api_key,
+                "section": category,
+                "page-size": page_size,
+                "page": page,
+                "show-fields": "headline,body,thumbnail,byline",
+                "order-by": "newest"
+            }
+            if lower_ts is not None:
+                params["from-date"] = datetime.fromtimestamp(lower_ts, tz=timezone.utc).date().isoformat()
+
+            try:
+                data = await client.get_json("guardian", "https://content.guardianapis.com/search", params=params)
+                results = data.get("response", {}).get("results", [])
+
+                page_articles = []
+                for article in results:
+                    fields = article.get("fields", {})
+                    page_articles.append({
+                        "id": self._generate_article_id(article),
+                        "source": "guardian",
+                        "source_name": "The Guardian",
+                        "title": fields.get("headline", article.get("webTitle")),
+                        "description": fields.get("body", "")[:500],  # First 500 chars
+                        "content": fields.get("body"),
+                        "url": article.get("webUrl"),
+                        "image_url": fields.get("thumbnail"),
+                        "published_at": article.get("webPublicationDate"),
+                        "author": fields.get("byline"),
+                        "category": category,
+                        "country": "gb",
+                        "language": "en",
+                        "fetched_at": datetime.now().isoformat()
+                    })
+
+                fresh, page_behind = self._take_fresh(stream, mark, page_articles, sorted_by_date=True)
+                articles.extend(fresh)
+
+                # Stop once pages are behind the mark, or when we got fewer results than page size
+                if page_behind or len(results) < page_size:
+                    break
+
+            except Exception as e:
+                self.logger.error(f"Error fetching Guardian page {page}: {e}")
+                break
+
+        return articles
+
+    async def _fetch_rss_feeds(self, client: RateLimitedClient) -> list[dict[str, Any]]:
         """
         Fetch news from RSS feeds
 
+        In incremental mode feeds are downloaded concurrently with conditional
+        requests based on the stored ETag/Last-Modified validators; unchanged
+        feeds answer 304 and are not parsed. Changed feeds are parsed in a
+        worker pool so the event loop stays responsive. New validators are
+        stored by commit_marks(), once the articles have been saved.
+
+        Args:
+            client: Shared HTTP client
+
         Returns:
             List of articles from RSS feeds
         """
         try:
-            import feedparser
+            import feedparser  # noqa: F401 - parsing happens in the worker pool
 
             feeds = self.sources_config.get("rss_feeds", [])
             if not feeds:
                 self.logger.info("No RSS feeds configured")
                 return []
 
-            articles = []
             self.logger.info(f"Fetching from {len(feeds)} RSS feeds")
 
-            for feed_config in feeds:
-                try:
-                    url = feed_config.get("url")
-                    name = feed_config.get("name", "Unknown")
-                    language = feed_config.get("language", "en")
-                    credibility = feed_config.get("credibility_score", 0.85)
-
-                    feed = feedparser.parse(url)
-
-                    for entry in feed.entries:
-                        # Try to extract category from tags
-                        category = "general"
-                        if hasattr(entry, "tags") and entry.tags:
-                            category = entry.tags[0].get("term", "general")
-
-                        articles.append({
-                            "id": self._generate_article_id(entry),
-                            "source": "rss",
-                            "source_name": name,
-                            "title": entry.get("title"),
-                            "description": entry.get("summary", ""),
-                            "content": entry.get("content", [{}])[0].get("value", entry.get("summary", "")),
-                            "url": entry.get("link"),
-                            "image_url": entry.get("media_thumbnail", [{}])[0].get("url") if hasattr(entry, "media_thumbnail") else None,
-                            "published_at": entry.get("published", entry.get("updated")),
-                            "author": entry.get("author"),
-                            "category": category,
-                            "language": language,
-                            "credibility_score": credibility,
-                            "fetched_at": datetime.now().isoformat()
-                        })
-
-                    self.logger.info(f"Fetched {len(feed.entries)} articles from {name}")
+            results = await asyncio.gather(*[
+                self._fetch_rss_feed(client, feed_config) for feed_config in feeds
+            ])
 
-                except Exception as e:
-                    self.logger.error(f"Error fetching RSS feed {feed_config.get('name')}: {e}")
+            articles = [article for feed_articles in results for article in feed_articles]
 
             self.logger.info(f"Fetched {len(articles)} articles from RSS feeds")
             return articles
@@ -303,6 +602,143 @@ class NewsScraperAgent:
             self.logger.error(f"Error in RSS feed fetch: {e}")
             return []
 
+    async def _fetch_rss_feed(self, client: RateLimitedClient, feed_config: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Fetch and parse a single RSS feed
+
+        Args:
+            client: Shared HTTP client
+            feed_config: Feed entry from sources.rss_feeds
+
+        Returns:
+            List of articles (empty if the feed is unchanged)
+        """
+        url = feed_config.get("url")
+        name = feed_config.get("name", "Unknown")
+
+        try:
+            # A full (non-incremental) fetch must get the feed even if it is unchanged
+            conditional = self.incremental and self.rss_config.get("conditional_get", True)
+            headers = self.fetch_state.conditional_headers(url) if conditional else {}
+            response = await client.request("rss", url, headers=headers, raw=True)
+
+            if response["status"] == 304:
+                self.fetch_state.touch(url)
+                self.logger.info(f"{name} not modified since last fetch")
+                return []
+
+            if response["status"] != 200:
+                self.logger.error(f"Error fetching RSS feed {name}: HTTP {response['status']}")
+                return []
+
+            loop = asyncio.get_running_loop()
+            articles = await loop.run_in_executor(
+                self._get_parse_pool(),
+                parse_feed,
+                response["body"],
+                feed_config,
+                response["headers"]
+            )
+
+            self._pending_validators[url] = (
+                response["headers"].get("etag"),
+                response["headers"].get("last-modified")
+            )
+
+            stream = f"rss:{url}"
+            articles, _ = self._take_fresh(stream, self._load_mark(stream), articles)
+
+            self.logger.info(f"Fetched {len(articles)} new articles from {name}")
+            return articles
+
+        except Exception as e:
+            self.logger.error(f"Error fetching RSS feed {name}: {e}")
+            return []
+
+    def _get_parse_pool(self) -> Executor:
+        """
+        Get the shared feed parsing pool
+
+        Returns:
+            Process pool when parse_workers > 0, otherwise a single thread
+        """
+        workers = self.rss_config.get("parse_workers", 4)
+        if workers > 0:
+            return get_executor("process", workers)
+        return get_executor("thread", 1)
+
+    def _load_mark(self, stream: str) -> dict[str, Any]:
+        """
+        Get the high-water mark a stream is fetched against
+
+        Args:
+            stream: Stream key
+
+        Returns:
+            Stored mark in incremental mode, an empty mark otherwise
+        """
+        if not self.incremental:
+            return {"published_ts": None, "seen_ids": set()}
+
+        return self.fetch_state.get_mark(stream)
+
+    def _take_fresh(
+        self,
+        stream: str,
+        mark: dict[str, Any],
+        page_articles: list[dict[str, Any]],
+        sorted_by_date: bool = False
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """
+        Keep the articles of a page that are ahead of the stream mark
+
+        An article is behind the mark when its ID was ingested before, when
+        it was published more than the grace window before the mark, or when
+        it falls outside the fetch window. An older publish date alone does
+        not make an article behind: ranked lists and feeds add items late.
+        Fresh articles are queued to advance the mark once the fetch is saved.
+
+        Args:
+            stream: Stream key
+            mark: Mark from _load_mark()
+            page_articles: Articles of one page
+            sorted_by_date: Whether the stream is sorted newest first, so a
+                page reaching past the grace window ends the pagination
+
+        Returns:
+            Tuple of (fresh articles, whether pagination can stop at this page)
+        """
+        fresh = []
+        reached_cutoff = False
+        cutoff_ts = mark["published_ts"] - self.grace_seconds if mark["published_ts"] is not None else None
+
+        for article in page_articles:
+            published_ts = _published_timestamp(article.get("published_at"))
+            too_old = published_ts is not None and cutoff_ts is not None and published_ts < cutoff_ts
+            reached_cutoff = reached_cutoff or too_old
+
+            if (
+                article["id"] in mark["seen_ids"]
+                or too_old
+                or (published_ts is not None and self._since_ts is not None and published_ts < self._since_ts)
+            ):
+                continue
+
+            fresh.append(article)
+
+        if fresh:
+            pending = self._pending_marks.setdefault(stream, {"published_ts": None, "ids": []})
+            pending["ids"].extend(article["id"] for article in fresh)
+
+            timestamps = [
+                ts for ts in (_published_timestamp(article.get("published_at")) for article in fresh)
+                if ts is not None
+            ]
+            if timestamps:
+                pending["published_ts"] = max(timestamps + [pending["published_ts"] or 0.0])
+
+        return fresh, bool(page_articles) and (not fresh or (sorted_by_date and reached_cutoff))
+
     def _generate_article_id(self, article: dict) -> str:
         """
         Generate unique ID for an article based on URL or title
@@ -313,14 +749,7 @@ class NewsScraperAgent:
         Returns:
             Unique article ID (SHA256 hash)
         """
-        # Try URL first, fallback to title + published date
-        identifier = article.get("url") or article.get("link")
-        if not identifier:
-            title = article.get("title", "")
-            published = article.get("published_at") or article.get("published") or article.get("webPublicationDate", "")
-            identifier = f"{title}_{published}"
-
-        return hashlib.sha256(identifier.encode()).hexdigest()[:16]
+        return generate_article_id(article)
 
     async def _save_raw_articles(self, articles: list[dict[str, Any]]) -> None:
         """
@@ -329,7 +758,7 @@ class NewsScraperAgent:
         Args:
             articles: List of article dictionaries
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filename = self.raw_dir / f"articles_{timestamp}.json"
 
         try:
@@ -341,54 +770,37 @@ class NewsScraperAgent:
         except Exception as e:
             self.logger.error(f"Error saving raw articles: {e}")
 
-    async def fetch_by_category(self, category: str) -> list[dict[str, Any]]:
+    async def fetch_by_category(self, category: str, incremental: Optional[bool] = None) -> list[dict[str, Any]]:
         """
         Fetch news for a specific category
 
+        Call commit_marks() once the articles are stored.
+
         Args:
             category: News category (e.g., 'technology', 'science')
+            incremental: Override the configured incremental mode
 
         Returns:
             List of articles in that category
         """
-        # Temporarily override categories
-        original_categories = self.categories
-        self.categories = [category]
-
-        articles = await self.fetch_all_sources()
-
-        # Restore original categories
-        self.categories = original_categories
+        return await self._collect(incremental=incremental, category=category)
 
-        return articles
-
-    async def fetch_recent(self, hours: int = 24) -> list[dict[str, Any]]:
+    async def fetch_recent(self, hours: int = 24, incremental: Optional[bool] = None) -> list[dict[str, Any]]:
         """
         Fetch recent news from the last N hours
 
+        Sources stop paginating once they reach items older than the
+        window, instead of fetching everything and filtering afterwards.
+        Call commit_marks() once the articles are stored.
+
         Args:
             hours: Number of hours to look back
+            incremental: Override the configured incremental mode
 
         Returns:
             List of recent articles
         """
-        all_articles = await self.fetch_all_sources()
-
-        # Filter by published date
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        recent_articles = []
-
-        for article in all_articles:
-            published_str = article.get("published_at")
-            if published_str:
-                try:
-                    # Parse ISO format datetime
-                    published = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-                    if published.replace(tzinfo=None) >= cutoff_time:
-                        recent_articles.append(article)
-                except Exception:
-                    # If parsing fails, include the article anyway
-                    recent_articles.append(article)
+        recent_articles = await self._collect(incremental=incremental, hours=hours)
 
         self.logger.info(f"Found {len(recent_articles)} articles from last {hours} hours")
         return recent_articles
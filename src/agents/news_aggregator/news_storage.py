@@ -2,16 +2,25 @@
 """
 NewsStorage - File-based storage manager for news articles
 
-Handles saving, loading, and querying news articles in JSON format
+Handles saving, loading, and querying news articles. Batch files in JSON
+format remain the archive of record; queries are answered by an embedded
+SQLite index (see ArticleStore).
 """
 
+import base64
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from src.core.logging import get_logger
 
+from .article_store import BUCKET_SECONDS, ArticleStore, match_expression
+from .fingerprints import band_key, title_fingerprint, url_hash
+from .minhash import build_lsh
+from .topic_series import TopicSeries
+from .topic_timelines import TopicTimelines
+
 
 class NewsStorage:
     """Storage manager for news articles"""
@@ -38,44 +47,83 @@ class NewsStorage:
         self.max_articles_per_source = storage_config.get("max_articles_per_source", 1000)
         self.cleanup_after_days = storage_config.get("cleanup_after_days", 30)
 
+        # Topic counter retention (hourly buckets serve short trend windows)
+        counters_config = config.get("trend_analysis", {}).get("counters", {})
+        self.hourly_retention_days = counters_config.get("hourly_retention_days", 14)
+        self.daily_retention_days = counters_config.get("daily_retention_days", 400)
+
         # Create directories
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.processed_dir.mkdir(parents=True, exist_ok=True)
         self.images_dir.mkdir(parents=True, exist_ok=True)
 
-        # Index file for quick lookups
-        self.index_file = self.processed_dir / "articles_index.json"
+        # Indexed article store used for filtered queries and ID lookups
+        self.db_path = Path(storage_config.get("database", str(self.base_dir / "articles.db")))
+        self.store = ArticleStore(self.db_path)
+
+        # Cross-run dedup signatures share the LSH settings of DeduplicationAgent
+        minhash_config = self.news_config.get("deduplication", {}).get("minhash", {})
+        self.hasher, self._lsh_layout = build_lsh(minhash_config)
+        self._signature_params = json.dumps(
+            [self.hasher.num_perm, self.hasher.shingle_size, minhash_config.get("seed", 1), self._lsh_layout.bands]
+        )
+
+        self._bootstrap_store()
+        self._remove_legacy_index()
+        if self.store.get_meta("signature_params") != self._signature_params:
+            self.rebuild_signatures()
 
         self.logger.info(f"NewsStorage initialized at {self.base_dir}")
 
-    async def save_articles(self, articles: list[dict[str, Any]], processed: bool = False) -> None:
+    async def save_articles(self, articles: list[dict[str, Any]], processed: bool = False) -> int:
         """
         Save articles to storage
 
+        Errors are logged, not raised; callers that must know whether the
+        articles are stored check the returned count.
+
         Args:
             articles: List of article dictionaries
             processed: Whether these are processed articles (True) or raw (False)
+
+        Returns:
+            Number of articles saved (0 if saving failed)
         """
         if not articles:
-            return
+            return 0
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Microseconds keep batch files written within the same second apart
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         target_dir = self.processed_dir if processed else self.raw_dir
         filename = target_dir / f"articles_{timestamp}.json"
 
         try:
+            mtime_before = target_dir.stat().st_mtime
+            size_before = filename.stat().st_size if filename.exists() else 0
+
             # Save articles to file
             with open(filename, "w", encoding="utf-8") as f:
                 json.dump(articles, f, indent=2, ensure_ascii=False)
 
+            self._adjust_directory_size(target_dir, mtime_before, filename.stat().st_size - size_before)
+
             self.logger.info(f"Saved {len(articles)} {'processed' if processed else 'raw'} articles to {filename}")
 
-            # Update index if processed
+            self.store.upsert(articles, processed=processed, batch_file=str(filename))
+
             if processed:
-                await self._update_index(articles)
+                self.store.upsert_signatures([
+                    (article["id"], *self.signature_for(article))
+                    for article in articles
+                    if article.get("id")
+                ])
+                self._prune_topic_counts()
 
         except Exception as e:
             self.logger.error(f"Error saving articles: {e}")
+            return 0
+
+        return len(articles)
 
     async def load_articles(
         self,
@@ -83,58 +131,475 @@ class NewsStorage:
         limit: Optional[int] = None,
         category: Optional[str] = None,
         source: Optional[str] = None,
-        after_date: Optional[datetime] = None
+        after_date: Optional[datetime] = None,
+        language: Optional[str] = None,
+        offset: int = 0
     ) -> list[dict[str, Any]]:
         """
         Load articles from storage with filtering
 
+        Filters, ordering (newest first) and pagination are evaluated by the
+        article store indexes, so only the requested page is deserialized.
+
         Args:
             processed: Load processed articles (True) or raw (False)
             limit: Maximum number of articles to return
             category: Filter by category
             source: Filter by source
             after_date: Only return articles published after this date
+            language: Filter by language
+            offset: Number of matching articles to skip
 
         Returns:
             List of articles
         """
-        target_dir = self.processed_dir if processed else self.raw_dir
+        try:
+            articles = self.store.query(
+                processed=processed,
+                category=category,
+                source=source,
+                language=language,
+                after_date=after_date,
+                limit=limit,
+                offset=offset
+            )
+        except Exception as e:
+            self.logger.error(f"Error querying article store: {e}")
+            return []
 
-        all_articles = []
+        self.logger.info(f"Loaded {len(articles)} articles from storage")
+        return articles
 
-        # Load all article files
-        for article_file in sorted(target_dir.glob("articles_*.json"), reverse=True):
-            try:
-                with open(article_file, "r", encoding="utf-8") as f:
-                    articles = json.load(f)
+    async def load_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        processed: bool = True,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        language: Optional[str] = None
+    ) -> tuple[list[dict[str, Any]], Optional[str]]:
+        """
+        Load one page of articles using a continuation cursor
 
-                # Apply filters
-                filtered_articles = articles
+        Args:
+            limit: Page size
+            cursor: Opaque cursor returned with the previous page (None for the first page)
+            processed: Load processed articles (True) or raw (False)
+            category: Filter by category
+            source: Filter by source
+            after_date: Only return articles published after this date
+            language: Filter by language
 
-                if category:
-                    filtered_articles = [a for a in filtered_articles if a.get("category") == category]
+        Returns:
+            Tuple of (articles, next_cursor); next_cursor is None on the last page
+        """
+        after_key = self._decode_cursor(cursor) if cursor else None
 
-                if source:
-                    filtered_articles = [a for a in filtered_articles if a.get("source") == source]
+        rows = self.store.scan(
+            processed=processed,
+            category=category,
+            source=source,
+            language=language,
+            after_date=after_date,
+            after_key=after_key,
+            limit=limit + 1  # One extra row tells us whether another page exists
+        )
 
-                if after_date:
-                    filtered_articles = [
-                        a for a in filtered_articles
-                        if self._parse_date(a.get("published_at")) >= after_date
-                    ]
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = self._encode_cursor(rows[-1][0]) if has_more and rows else None
 
-                all_articles.extend(filtered_articles)
+        return [article for _, article in rows], next_cursor
 
-                # Check if we've hit the limit
-                if limit and len(all_articles) >= limit:
-                    all_articles = all_articles[:limit]
-                    break
+    async def iter_articles(
+        self,
+        processed: bool = True,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        language: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 200,
+        oldest_first: bool = False
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Lazily yield articles newest (or oldest) first
+
+        Articles are fetched from the store in keyset batches of batch_size,
+        so memory stays bounded no matter how many articles are consumed.
+
+        Args:
+            processed: Iterate processed articles (True) or raw (False)
+            category: Filter by category
+            source: Filter by source
+            after_date: Only yield articles published after this date
+            language: Filter by language
+            limit: Stop after this many articles
+            batch_size: Number of articles fetched per store round trip
+            oldest_first: Yield in ascending publish order
+
+        Yields:
+            Article dictionaries
+        """
+        after_key = None
+        yielded = 0
+
+        while True:
+            size = batch_size if limit is None else min(batch_size, limit - yielded)
+            if size <= 0:
+                return
+
+            rows = self.store.scan(
+                processed=processed,
+                category=category,
+                source=source,
+                language=language,
+                after_date=after_date,
+                after_key=after_key,
+                limit=size,
+                oldest_first=oldest_first
+            )
+
+            for _, article in rows:
+                yield article
+
+            yielded += len(rows)
+            if len(rows) < size:
+                return
+
+            after_key = rows[-1][0]
+
+    async def count_articles(
+        self,
+        processed: bool = True,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        language: Optional[str] = None
+    ) -> int:
+        """
+        Count stored articles matching the given filters
 
-            except Exception as e:
-                self.logger.error(f"Error loading {article_file}: {e}")
+        Args:
+            processed: Count processed articles (True) or raw (False)
+            category: Filter by category
+            source: Filter by source
+            after_date: Only count articles published after this date
+            language: Filter by language
 
-        self.logger.info(f"Loaded {len(all_articles)} articles from storage")
-        return all_articles
+        Returns:
+            Number of matching articles
+        """
+        try:
+            return self.store.count(
+                processed=processed,
+                category=category,
+                source=source,
+                language=language,
+                after_date=after_date
+            )
+        except Exception as e:
+            self.logger.error(f"Error counting articles: {e}")
+            return 0
+
+    async def search_articles(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        limit: Optional[int] = 20,
+        offset: int = 0,
+        phrase: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Search processed articles by text, best match first
+
+        Title, description, content and keywords are matched through the
+        full-text index and ranked with BM25; filters are applied in the
+        same query.
+
+        Args:
+            query: Search text (every word must occur)
+            category: Filter by category
+            source: Filter by source
+            language: Filter by language
+            after_date: Only return articles published after this date
+            limit: Maximum number of articles to return (None for all)
+            offset: Number of matching articles to skip
+            phrase: Match the words as one phrase
+
+        Returns:
+            Matching articles, each with its relevance "score"
+        """
+        expression = match_expression(query, phrase=phrase)
+        if expression is None:
+            return []
+
+        try:
+            results = self.store.search(
+                expression,
+                category=category,
+                source=source,
+                language=language,
+                after_date=after_date,
+                limit=limit,
+                offset=offset
+            )
+        except Exception as e:
+            self.logger.error(f"Error searching articles: {e}")
+            return []
+
+        return [{**article, "score": round(score, 4)} for article, score in results]
+
+    async def count_search_results(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        phrase: bool = False
+    ) -> int:
+        """
+        Count processed articles matching a text search
+
+        Args:
+            query: Search text
+            category: Filter by category
+            source: Filter by source
+            language: Filter by language
+            after_date: Only count articles published after this date
+            phrase: Match the words as one phrase
+
+        Returns:
+            Number of matching articles
+        """
+        expression = match_expression(query, phrase=phrase)
+        if expression is None:
+            return 0
+
+        try:
+            return self.store.search_count(
+                expression,
+                category=category,
+                source=source,
+                language=language,
+                after_date=after_date
+            )
+        except Exception as e:
+            self.logger.error(f"Error counting search results: {e}")
+            return 0
+
+    async def topic_series(
+        self,
+        start: datetime,
+        end: Optional[datetime] = None,
+        granularity: str = "d",
+        category: Optional[str] = None,
+        topics: Optional[list[str]] = None,
+        min_mentions: Optional[int] = None,
+        mentions_since: Optional[datetime] = None
+    ) -> TopicSeries:
+        """
+        Read topic mention counts between two dates as a dense series
+
+        Counts come from the per-topic counters kept up to date on every
+        save, so no article is loaded.
+
+        Args:
+            start: Start of the first bucket
+            end: End of the range (default now)
+            granularity: "h" (hourly) or "d" (daily) buckets
+            category: Only count mentions in this category
+            topics: Only these topics, in this row order
+            min_mentions: Only topics mentioned at least this often since
+                mentions_since (ignored when topics is given)
+            mentions_since: Start of the min_mentions range (default start)
+
+        Returns:
+            TopicSeries covering every bucket from start to end
+        """
+        size = BUCKET_SECONDS[granularity]
+        start_bucket = int(start.timestamp() // size)
+        end_bucket = int((end or datetime.now()).timestamp() // size)
+
+        if topics is None:
+            topic_ids = None
+            rows = self.store.topic_counts(granularity, start_bucket, end_bucket, category=category)
+        else:
+            known = self.store.topic_ids(topics)
+            topic_ids = [known.get(topic.lower().strip(), -1) for topic in topics]
+            rows = self.store.topic_counts(
+                granularity, start_bucket, end_bucket, category=category, topic_ids=list(known.values())
+            )
+
+        series = TopicSeries.from_rows(rows, start_bucket, end_bucket, granularity, topic_ids=topic_ids)
+
+        if topics is not None:
+            return series.named(dict(zip(topic_ids, topics)))
+
+        if min_mentions:
+            from_column = max(0, int(mentions_since.timestamp() // size) - start_bucket) if mentions_since else 0
+            series = series.with_min_total(min_mentions, from_column)
+
+        # Only the remaining topics need their names
+        return series.named(self.store.topic_names(series.topic_ids.tolist()))
+
+    async def topic_details(
+        self,
+        topics: list[str],
+        after_date: Optional[datetime] = None,
+        category: Optional[str] = None,
+        sample_size: int = 10
+    ) -> dict[str, dict[str, list[str]]]:
+        """
+        Get the categories, sources and newest article IDs of topics
+
+        Args:
+            topics: Topics to look up
+            after_date: Only consider mentions published after this date
+            category: Only sample articles in this category
+            sample_size: Article IDs returned per topic
+
+        Returns:
+            Dictionary mapping topic to {"categories", "sources", "articles"}
+        """
+        since_ts = after_date.timestamp() if after_date else None
+
+        known = self.store.topic_ids(topics)
+        ids = list(known.values())
+        facets = self.store.topic_facets(ids, since_ts=since_ts)
+        articles = self.store.topic_articles(ids, since_ts=since_ts, category=category, per_topic=sample_size)
+
+        details = {}
+        for topic in topics:
+            topic_id = known.get(topic.lower().strip())
+            if topic_id is None:
+                details[topic] = {"categories": [], "sources": [], "articles": []}
+            else:
+                details[topic] = {**facets[topic_id], "articles": articles[topic_id]}
+
+        return details
+
+    async def topic_timelines(
+        self,
+        topics: list[str],
+        after_date: datetime,
+        end: Optional[datetime] = None,
+        category: Optional[str] = None
+    ) -> TopicTimelines:
+        """
+        Build aligned daily mention timelines of several topics
+
+        Each topic is matched as a phrase against the full-text index; all
+        topics are looked up in one query and no article is decoded.
+
+        Args:
+            topics: Topics to track
+            after_date: Start of the first day
+            end: End of the range (default now)
+            category: Only count articles in this category
+
+        Returns:
+            TopicTimelines with one day column from after_date to end
+        """
+        end = end or datetime.now()
+        expressions = [match_expression(topic, phrase=True) for topic in topics]
+
+        # Topics without a word match nothing
+        positions = [i for i, expression in enumerate(expressions) if expression]
+        rows = self.store.search_mentions(
+            [expressions[i] for i in positions],
+            category=category,
+            after_date=after_date,
+            before_date=end
+        )
+        rows = [(positions[position], rowid, article_id, ts) for position, rowid, article_id, ts in rows]
+
+        return TopicTimelines.from_mentions(
+            topics,
+            rows,
+            int(after_date.timestamp() // 86400),
+            int(end.timestamp() // 86400)
+        )
+
+    async def get_article_sentiment(self, rowids: list[int]) -> dict[int, tuple[Optional[dict[str, Any]], str]]:
+        """
+        Get the stored sentiment of articles by store rowid
+
+        Args:
+            rowids: Article rowids (e.g. TopicTimelines.article_rowids)
+
+        Returns:
+            Dictionary mapping rowid to (stored sentiment or None, "title description")
+        """
+        return self.store.article_sentiment(rowids)
+
+    async def get_cached_sentiment(self, content_hashes: list[str], model: str) -> dict[str, dict[str, Any]]:
+        """
+        Look up sentiment scores cached by content hash
+
+        Args:
+            content_hashes: Hashes of the scored texts
+            model: Sentiment backend name
+
+        Returns:
+            Dictionary mapping content hash to scores, for the hashes found
+        """
+        try:
+            return self.store.get_cached_sentiment(content_hashes, model)
+        except Exception as e:
+            self.logger.error(f"Error reading sentiment cache: {e}")
+            return {}
+
+    async def cache_sentiment(self, entries: list[tuple[str, dict[str, Any]]], model: str) -> None:
+        """
+        Cache sentiment scores by content hash
+
+        Args:
+            entries: (content hash, scores) pairs
+            model: Sentiment backend name
+        """
+        try:
+            self.store.cache_sentiment(entries, model)
+        except Exception as e:
+            self.logger.error(f"Error writing sentiment cache: {e}")
+
+    async def get_insert_position(self) -> int:
+        """
+        Get the position of the most recently stored article
+
+        Returns:
+            Position to pass to load_inserted_since()
+        """
+        return self.store.max_rowid()
+
+    async def load_inserted_since(
+        self,
+        position: int,
+        category: Optional[str] = None,
+        limit: int = 200
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Get processed articles stored after a position, oldest first
+
+        Args:
+            position: Position from get_insert_position() or a previous call
+            category: Filter by category
+            limit: Maximum number of articles to return
+
+        Returns:
+            Tuple of (articles, position to continue from)
+        """
+        rows = self.store.scan_inserted(position, processed=True, category=category, limit=limit)
+        if not rows:
+            return [], position
+
+        return [article for _, article in rows], rows[-1][0]
 
     async def get_article_by_id(self, article_id: str) -> Optional[dict[str, Any]]:
         """
@@ -146,52 +611,142 @@ class NewsStorage:
         Returns:
             Article dictionary or None if not found
         """
-        # Check index first
-        index = await self._load_index()
+        try:
+            return self.store.get(article_id)
+        except Exception as e:
+            self.logger.error(f"Error loading article {article_id}: {e}")
+            return None
+
+    async def get_articles_by_ids(self, article_ids: list[str]) -> list[dict[str, Any]]:
+        """
+        Get several articles by ID in one lookup
+
+        Args:
+            article_ids: Article IDs
+
+        Returns:
+            Found articles, in the order requested (missing IDs are skipped)
+        """
+        try:
+            found = self.store.get_many(article_ids)
+        except Exception as e:
+            self.logger.error(f"Error loading articles by ID: {e}")
+            return []
+
+        return [found[article_id] for article_id in article_ids if article_id in found]
+
+    def signature_for(self, article: dict[str, Any]) -> tuple[Optional[str], str, list[str]]:
+        """
+        Compute the cross-run dedup signature of an article
+
+        Works on raw and processed articles alike.
+
+        Args:
+            article: Article dictionary
+
+        Returns:
+            Tuple of (url_hash, title_fingerprint, lsh_band_keys)
+        """
+        title = title_fingerprint(article.get("title"))
+        signature = self.hasher.signature(title)
+        band_keys = [
+            band_key(band, values)
+            for band, values in enumerate(self._lsh_layout.band_keys(signature))
+        ] if signature else []
+
+        return url_hash(article.get("url")), title, band_keys
+
+    async def find_known_urls(self, url_hashes: list[str]) -> set[str]:
+        """
+        Find URL hashes that belong to already stored articles
+
+        Args:
+            url_hashes: URL hashes from signature_for()
+
+        Returns:
+            Subset of url_hashes already stored
+        """
+        try:
+            return self.store.find_url_hashes(url_hashes)
+        except Exception as e:
+            self.logger.error(f"Error looking up known URLs: {e}")
+            return set()
+
+    async def find_similar_titles(self, band_keys: list[str]) -> dict[str, list[tuple[str, str]]]:
+        """
+        Find stored articles whose title shares an LSH band key
+
+        Args:
+            band_keys: Band keys from signature_for()
+
+        Returns:
+            Dictionary mapping band key to (article_id, title_fingerprint) pairs
+        """
+        try:
+            return self.store.find_band_matches(band_keys)
+        except Exception as e:
+            self.logger.error(f"Error looking up similar titles: {e}")
+            return {}
 
-        if article_id in index:
-            file_path = index[article_id]["file"]
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    articles = json.load(f)
+    def rebuild_signatures(self) -> None:
+        """Recompute dedup signatures for all stored processed articles"""
+        self.store.clear_signatures()
+        count = 0
 
-                for article in articles:
-                    if article.get("id") == article_id:
-                        return article
+        for batch in self.store.iter_all(processed=True):
+            self.store.upsert_signatures([
+                (article["id"], *self.signature_for(article))
+                for article in batch
+                if article.get("id")
+            ])
+            count += len(batch)
 
-            except Exception as e:
-                self.logger.error(f"Error loading article {article_id}: {e}")
+        self.store.set_meta("signature_params", self._signature_params)
 
-        return None
+        if count:
+            self.logger.info(f"Rebuilt dedup signatures for {count} articles")
 
     async def delete_old_articles(self) -> int:
         """
         Delete articles older than cleanup_after_days
 
+        Sentiment scores cached longer than that are deleted as well.
+
         Returns:
             Number of articles deleted
         """
         cutoff_date = datetime.now() - timedelta(days=self.cleanup_after_days)
         deleted_count = 0
+        deleted_files = []
 
         for article_dir in [self.raw_dir, self.processed_dir]:
             for article_file in article_dir.glob("articles_*.json"):
                 try:
-                    # Parse timestamp from filename
+                    # Parse timestamp from filename (older files have no microseconds)
                     timestamp_str = article_file.stem.replace("articles_", "")
-                    file_date = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+                    file_date = datetime.strptime(timestamp_str[:15], "%Y%m%d_%H%M%S")
 
                     if file_date < cutoff_date:
+                        mtime_before = article_dir.stat().st_mtime
+                        file_size = article_file.stat().st_size
                         article_file.unlink()
+                        self._adjust_directory_size(article_dir, mtime_before, -file_size)
                         deleted_count += 1
+                        deleted_files.append(str(article_file))
                         self.logger.info(f"Deleted old article file: {article_file.name}")
 
                 except Exception as e:
                     self.logger.error(f"Error deleting {article_file}: {e}")
 
         if deleted_count > 0:
-            # Rebuild index after deletion
-            await self._rebuild_index()
+            self.store.delete_batch_files(deleted_files)
+
+        pruned = self.store.prune_sentiment_cache(cutoff_date.timestamp())
+        if pruned:
+            self.logger.info(f"Deleted {pruned} cached sentiment scores")
+
+        if deleted_count > 0 or pruned:
+            self.store.compact()
 
         return deleted_count
 
@@ -199,154 +754,198 @@ class NewsStorage:
         """
         Get storage statistics
 
+        Counts come from the rolling stats the article store maintains on
+        every write, the date range from two index seeks, and directory sizes
+        from a cache that is only refreshed when a directory changed. Use
+        recompute_stats() to repair the sidecar if it ever drifts.
+
         Returns:
             Statistics dictionary
         """
-        stats = {
-            "total_articles": 0,
-            "by_category": {},
-            "by_source": {},
-            "by_language": {},
-            "storage_size_mb": 0,
-            "oldest_article": None,
-            "newest_article": None
+        counts = self.store.get_counts()
+        oldest, newest = self.store.get_date_range()
+
+        total_size = sum(
+            self._directory_size(path)
+            for path in [self.raw_dir, self.processed_dir, self.images_dir]
+        )
+        for db_file in [self.db_path, Path(f"{self.db_path}-wal")]:
+            if db_file.exists():
+                total_size += db_file.stat().st_size
+
+        return {
+            "total_articles": sum(counts.get("category", {}).values()),
+            "by_category": counts.get("category", {}),
+            "by_source": counts.get("source", {}),
+            "by_language": counts.get("language", {}),
+            "storage_size_mb": round(total_size / (1024 * 1024), 2),
+            "oldest_article": oldest,
+            "newest_article": newest
         }
 
-        # Load all processed articles
-        articles = await self.load_articles(processed=True, limit=None)
-
-        stats["total_articles"] = len(articles)
-
-        # Calculate statistics
-        for article in articles:
-            # Category stats
-            category = article.get("category", "general")
-            stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
+    async def recompute_stats(self) -> dict[str, Any]:
+        """
+        Recompute all statistics from scratch (repair path)
 
-            # Source stats
-            source = article.get("source_name", "Unknown")
-            stats["by_source"][source] = stats["by_source"].get(source, 0) + 1
+        Returns:
+            Statistics dictionary
+        """
+        self.store.recompute_stats()
 
-            # Language stats
-            language = article.get("language", "en")
-            stats["by_language"][language] = stats["by_language"].get(language, 0) + 1
+        for path in [self.raw_dir, self.processed_dir, self.images_dir]:
+            self.store.set_meta(self._directory_size_key(path), "")
 
-            # Date range
-            published = self._parse_date(article.get("published_at"))
-            if published:
-                if not stats["oldest_article"] or published < self._parse_date(stats["oldest_article"]):
-                    stats["oldest_article"] = article.get("published_at")
+        return await self.get_stats()
 
-                if not stats["newest_article"] or published > self._parse_date(stats["newest_article"]):
-                    stats["newest_article"] = article.get("published_at")
+    def _prune_topic_counts(self) -> None:
+        """Expire topic buckets beyond the configured retention"""
+        now = datetime.now().timestamp()
+        self.store.prune_topic_counts(
+            hourly_before=int((now - self.hourly_retention_days * 86400) // BUCKET_SECONDS["h"]),
+            daily_before=int((now - self.daily_retention_days * 86400) // BUCKET_SECONDS["d"])
+        )
 
-        # Calculate storage size
-        total_size = 0
-        for path in [self.raw_dir, self.processed_dir, self.images_dir]:
-            for file in path.rglob("*"):
-                if file.is_file():
-                    total_size += file.stat().st_size
+    def _directory_size(self, path: Path) -> int:
+        """
+        Get the total size of files under a directory
 
-        stats["storage_size_mb"] = round(total_size / (1024 * 1024), 2)
+        The result is cached in the store metadata together with the
+        directory mtime, which changes whenever a file is added or removed,
+        so the directory is only rescanned after someone else modified it.
 
-        return stats
+        Args:
+            path: Directory path
 
-    async def _update_index(self, articles: list[dict[str, Any]]) -> None:
+        Returns:
+            Size in bytes
         """
-        Update the articles index for faster lookups
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return 0
+
+        key = self._directory_size_key(path)
+        cached = self.store.get_meta(key)
+        if cached:
+            entry = json.loads(cached)
+            if entry["mtime"] == mtime:
+                return entry["bytes"]
+
+        total_size = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+        self.store.set_meta(key, json.dumps({"mtime": mtime, "bytes": total_size}))
+        return total_size
+
+    def _adjust_directory_size(self, path: Path, mtime_before: Optional[float], delta: int) -> None:
+        """
+        Apply a size change caused by our own write or delete
+
+        The cached size is only updated if it was current before the change,
+        otherwise it is left stale and the next read rescans the directory.
 
         Args:
-            articles: List of articles to index
+            path: Directory that was modified
+            mtime_before: Directory mtime observed before the modification
+            delta: Change in bytes
         """
-        index = await self._load_index()
+        key = self._directory_size_key(path)
+        cached = self.store.get_meta(key)
+        if not cached:
+            return
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = self.processed_dir / f"articles_{timestamp}.json"
+        entry = json.loads(cached)
+        if entry["mtime"] != mtime_before:
+            return
 
-        for article in articles:
-            article_id = article.get("id")
-            if article_id:
-                index[article_id] = {
-                    "file": str(filename),
-                    "title": article.get("title"),
-                    "category": article.get("category"),
-                    "published_at": article.get("published_at"),
-                    "indexed_at": datetime.now().isoformat()
-                }
+        self.store.set_meta(key, json.dumps({
+            "mtime": path.stat().st_mtime,
+            "bytes": max(0, entry["bytes"] + delta)
+        }))
 
-        # Save index
-        try:
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(index, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            self.logger.error(f"Error updating index: {e}")
+    @staticmethod
+    def _directory_size_key(path: Path) -> str:
+        """Store metadata key for a cached directory size"""
+        return f"dir_size:{path.resolve()}"
+
+    def _bootstrap_store(self) -> None:
+        """Import existing batch files into the article store on first use"""
+        if self.store.get_meta("bootstrapped"):
+            return
+
+        self.rebuild_store()
 
-    async def _load_index(self) -> dict[str, Any]:
+    def _remove_legacy_index(self) -> None:
         """
-        Load the articles index
+        Delete the JSON index that predates the article store, once
 
-        Returns:
-            Index dictionary
+        The store answers every lookup the index served, so the file is no
+        longer maintained; the migration is recorded in the store metadata
+        and never runs again.
         """
-        if not self.index_file.exists():
-            return {}
+        if self.store.get_meta("legacy_index_removed"):
+            return
 
+        legacy_index_file = self.processed_dir / "articles_index.json"
         try:
-            with open(self.index_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Error loading index: {e}")
-            return {}
+            if legacy_index_file.exists():
+                legacy_index_file.unlink()
+                self.logger.info("Removed legacy articles_index.json (superseded by article store)")
+        except OSError as e:
+            self.logger.warning(f"Could not remove legacy articles_index.json: {e}")
+            return
 
-    async def _rebuild_index(self) -> None:
-        """Rebuild the articles index from scratch"""
-        self.logger.info("Rebuilding articles index...")
+        self.store.set_meta("legacy_index_removed", datetime.now().isoformat())
 
-        index = {}
+    def rebuild_store(self) -> int:
+        """
+        Rebuild the article store from the batch files on disk
 
-        for article_file in self.processed_dir.glob("articles_*.json"):
-            try:
-                with open(article_file, "r", encoding="utf-8") as f:
-                    articles = json.load(f)
+        Files are replayed oldest first so the newest copy of an article wins.
 
-                for article in articles:
-                    article_id = article.get("id")
-                    if article_id:
-                        index[article_id] = {
-                            "file": str(article_file),
-                            "title": article.get("title"),
-                            "category": article.get("category"),
-                            "published_at": article.get("published_at"),
-                            "indexed_at": datetime.now().isoformat()
-                        }
+        Returns:
+            Number of articles imported
+        """
+        imported = 0
+        self.store.clear()
 
-            except Exception as e:
-                self.logger.error(f"Error reading {article_file} for index: {e}")
+        for processed, article_dir in [(False, self.raw_dir), (True, self.processed_dir)]:
+            for article_file in sorted(article_dir.glob("articles_*.json")):
+                if article_file.name == "articles_index.json":
+                    continue
 
-        # Save rebuilt index
-        try:
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(index, f, indent=2, ensure_ascii=False)
+                try:
+                    with open(article_file, "r", encoding="utf-8") as f:
+                        articles = json.load(f)
 
-            self.logger.info(f"Index rebuilt with {len(index)} articles")
+                    imported += self.store.upsert(articles, processed=processed, batch_file=str(article_file))
 
-        except Exception as e:
-            self.logger.error(f"Error saving rebuilt index: {e}")
+                except Exception as e:
+                    self.logger.error(f"Error importing {article_file} into article store: {e}")
 
-    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """
-        Parse date string to datetime
+        self.store.set_meta("bootstrapped", datetime.now().isoformat())
+        self.rebuild_signatures()
 
-        Args:
-            date_str: ISO format date string
+        if imported:
+            self.logger.info(f"Imported {imported} articles into article store")
 
-        Returns:
-            datetime object or None
+        return imported
+
+    @staticmethod
+    def _encode_cursor(key: tuple[Optional[float], str]) -> str:
+        """Encode a store key as an opaque URL-safe cursor"""
+        raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[Optional[float], str]:
         """
-        if not date_str:
-            return None
+        Decode a cursor produced by _encode_cursor
 
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            padded = cursor + "=" * (-len(cursor) % 4)
+            published_ts, article_id = json.loads(base64.urlsafe_b64decode(padded))
+            return published_ts, str(article_id)
         except Exception:
-            return None
+            raise ValueError("Invalid cursor")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Trained category classifier for CategoryAgent
+
+Hashed word n-gram features feed a linear model trained offline from the
+stored, already categorized articles. Hashing needs no vocabulary, so the
+model is small, loads fast and classifies a whole batch with one sparse
+matrix product. The model is saved with joblib next to the news data.
+"""
+
+from pathlib import Path
+from typing import Any, Optional
+
+
+class HashedLinearClassifier:
+    """Hashed n-gram features with a linear (logistic regression) model"""
+
+    def __init__(self, n_features: int = 2 ** 18, ngram_range: tuple[int, int] = (1, 2)):
+        """
+        Initialize classifier
+
+        Args:
+            n_features: Hashed feature space size
+            ngram_range: Word n-gram range
+        """
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=self.ngram_range,
+            alternate_sign=False,
+            norm="l2"
+        )
+        self.model = None
+
+    @property
+    def classes(self) -> list[str]:
+        """Category labels the model can predict"""
+        return [] if self.model is None else [str(c) for c in self.model.classes_]
+
+    def fit(self, texts: list[str], labels: list[str], epochs: int = 10) -> "HashedLinearClassifier":
+        """
+        Train the model
+
+        Args:
+            texts: Article texts
+            labels: Category label per text
+            epochs: Training passes over the data
+
+        Returns:
+            self
+        """
+        from sklearn.linear_model import SGDClassifier
+
+        features = self.vectorizer.transform(texts)
+        self.model = SGDClassifier(
+            loss="log_loss",
+            alpha=1e-5,
+            max_iter=epochs,
+            tol=None,
+            class_weight="balanced",
+            random_state=0
+        )
+        self.model.fit(features, labels)
+        return self
+
+    def predict(self, texts: list[str]) -> tuple[list[str], list[float]]:
+        """
+        Classify a batch of texts
+
+        Args:
+            texts: Article texts
+
+        Returns:
+            Tuple of (predicted labels, confidence of each prediction)
+        """
+        if self.model is None:
+            raise ValueError("Classifier is not trained")
+        if not texts:
+            return [], []
+
+        probabilities = self.model.predict_proba(self.vectorizer.transform(texts))
+        best = probabilities.argmax(axis=1)
+
+        labels = [str(self.model.classes_[i]) for i in best]
+        confidences = probabilities[range(len(texts)), best].tolist()
+        return labels, confidences
+
+    def save(self, path: Path) -> None:
+        """
+        Serialize the classifier
+
+        Args:
+            path: Output file
+        """
+        import joblib
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(
+            {"n_features": self.n_features, "ngram_range": self.ngram_range, "model": self.model},
+            path
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "HashedLinearClassifier":
+        """
+        Load a serialized classifier
+
+        Args:
+            path: File written by save()
+
+        Returns:
+            Classifier instance
+        """
+        import joblib
+
+        data = joblib.load(Path(path))
+        classifier = cls(n_features=data["n_features"], ngram_range=data["ngram_range"])
+        classifier.model = data["model"]
+        return classifier
+
+
+def load_classifier(path: Optional[Path]) -> Optional[Any]:
+    """
+    Load a classifier if the file exists and scikit-learn is available
+
+    Args:
+        path: Model file
+
+    Returns:
+        Classifier, or None
+    """
+    if not path or not Path(path).exists():
+        return None
+
+    try:
+        return HashedLinearClassifier.load(path)
+    except ImportError:
+        return None
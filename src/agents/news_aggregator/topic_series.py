@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+TopicSeries - Topic mention counts as a dense NumPy matrix
+
+One row per topic and one column per consecutive time bucket, built from
+the sparse counters the article store keeps, so trend statistics over any
+window are a few array operations.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from .article_store import BUCKET_SECONDS
+
+
+class TopicSeries:
+    """Per-topic mention counts in consecutive hourly or daily buckets"""
+
+    def __init__(
+        self,
+        topic_ids: np.ndarray,
+        counts: np.ndarray,
+        start_bucket: int,
+        granularity: str,
+        topics: Optional[list[str]] = None
+    ):
+        """
+        Initialize topic series
+
+        Args:
+            topic_ids: Topic ID of each row
+            counts: Matrix of shape (len(topic_ids), number of buckets)
+            start_bucket: Bucket number of the first column
+            granularity: "h" (hourly) or "d" (daily) buckets
+            topics: Topic of each row (see named())
+        """
+        self.topic_ids = topic_ids
+        self.counts = counts
+        self.start_bucket = start_bucket
+        self.granularity = granularity
+        self.topics = topics if topics is not None else [str(topic_id) for topic_id in topic_ids]
+        self.index = {topic: i for i, topic in enumerate(self.topics)}
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: list[tuple[int, int, int]],
+        start_bucket: int,
+        end_bucket: int,
+        granularity: str,
+        topic_ids: Optional[list[int]] = None
+    ) -> "TopicSeries":
+        """
+        Build a series from (topic_id, bucket, count) rows
+
+        Args:
+            rows: Sparse counts, e.g. from ArticleStore.topic_counts()
+            start_bucket: First bucket (inclusive)
+            end_bucket: Last bucket (inclusive)
+            granularity: "h" or "d"
+            topic_ids: Row order (default: topic IDs of the rows, sorted)
+
+        Returns:
+            TopicSeries (call named() to attach topic names)
+        """
+        columns = max(0, end_bucket - start_bucket + 1)
+        data = np.array(rows, dtype=np.int64).reshape(-1, 3)
+
+        if topic_ids is None:
+            ids, positions = np.unique(data[:, 0], return_inverse=True)
+        else:
+            ids = np.array(topic_ids, dtype=np.int64)
+            order = np.argsort(ids, kind="stable")
+            found = np.searchsorted(ids[order], data[:, 0]).clip(0, max(0, len(ids) - 1))
+            known = (ids[order][found] == data[:, 0]) if len(ids) else np.zeros(len(data), dtype=bool)
+            data, positions = data[known], order[found[known]]
+
+        counts = np.zeros((len(ids), columns), dtype=np.int64)
+        np.add.at(counts, (positions, data[:, 1] - start_bucket), data[:, 2])
+
+        return cls(ids, counts, start_bucket, granularity)
+
+    def named(self, names: dict[int, str]) -> "TopicSeries":
+        """
+        Attach topic names to the rows
+
+        Args:
+            names: Topic of each topic ID, e.g. from ArticleStore.topic_names()
+
+        Returns:
+            New TopicSeries with topics set
+        """
+        topics = [names.get(int(topic_id), str(topic_id)) for topic_id in self.topic_ids]
+        return TopicSeries(self.topic_ids, self.counts, self.start_bucket, self.granularity, topics=topics)
+
+    def with_min_total(self, min_total: int, from_column: int = 0) -> "TopicSeries":
+        """
+        Keep only topics with enough mentions
+
+        Args:
+            min_total: Minimum mentions
+            from_column: Count mentions from this column on
+
+        Returns:
+            New TopicSeries with the remaining topics
+        """
+        keep = np.flatnonzero(self.counts[:, from_column:].sum(axis=1) >= min_total)
+        return TopicSeries(
+            self.topic_ids[keep],
+            self.counts[keep],
+            self.start_bucket,
+            self.granularity,
+            topics=[self.topics[i] for i in keep]
+        )
+
+    @property
+    def bucket_seconds(self) -> int:
+        """Length of one bucket in seconds"""
+        return BUCKET_SECONDS[self.granularity]
+
+    @property
+    def bucket_days(self) -> float:
+        """Length of one bucket in days"""
+        return self.bucket_seconds / 86400
+
+    def bucket_start(self, column: int) -> datetime:
+        """
+        Start time of a bucket
+
+        Args:
+            column: Column index
+
+        Returns:
+            Local datetime
+        """
+        return datetime.fromtimestamp((self.start_bucket + column) * self.bucket_seconds)
+
+    def row(self, topic: str) -> np.ndarray:
+        """
+        Counts of one topic (zeros if the topic has no mentions)
+
+        Args:
+            topic: Topic
+
+        Returns:
+            Array with one count per bucket
+        """
+        if topic in self.index:
+            return self.counts[self.index[topic]]
+        return np.zeros(self.counts.shape[1], dtype=np.int64)
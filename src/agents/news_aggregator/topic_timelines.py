@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+"""
+TopicTimelines - Daily mentions and sentiment of several topics as NumPy columns
+
+Every (topic, article) match is one entry of three integer columns (topic,
+article, day). Daily counts and sentiment sums for all topics come from a
+single bincount over those columns, on one day axis shared by every topic,
+so timelines of many topics are aligned and built at once.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import numpy as np
+
+# Sentiment scores summed per topic and day, in column order
+SENTIMENT_FIELDS = ("positive", "negative", "neutral")
+
+
+class TopicTimelines:
+    """Aligned daily timelines of several topics"""
+
+    def __init__(
+        self,
+        topics: list[str],
+        start_day: int,
+        n_days: int,
+        topic_index: np.ndarray,
+        article_index: np.ndarray,
+        day_index: np.ndarray,
+        article_rowids: np.ndarray,
+        article_ids: list[str]
+    ):
+        """
+        Initialize topic timelines
+
+        Args:
+            topics: Topic of each timeline
+            start_day: Day number (days since the epoch, UTC) of the first column
+            n_days: Number of days
+            topic_index: Topic of each mention
+            article_index: Article (position in article_rowids) of each mention
+            day_index: Day column of each mention
+            article_rowids: Store rowid of each distinct article
+            article_ids: Article ID of each distinct article
+        """
+        self.topics = topics
+        self.start_day = start_day
+        self.n_days = n_days
+        self.topic_index = topic_index
+        self.article_index = article_index
+        self.day_index = day_index
+        self.article_rowids = article_rowids
+        self.article_ids = article_ids
+
+        self.counts = self._daily_sum().astype(np.int64)
+        self.sentiment_sums: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_mentions(
+        cls,
+        topics: list[str],
+        rows: list[tuple[int, int, str, float]],
+        start_day: int,
+        end_day: int
+    ) -> "TopicTimelines":
+        """
+        Build timelines from (topic index, article rowid, article ID, timestamp) rows
+
+        Args:
+            topics: Topic of each timeline
+            rows: Matches, e.g. from ArticleStore.search_mentions()
+            start_day: First day (inclusive)
+            end_day: Last day (inclusive)
+
+        Returns:
+            TopicTimelines (mentions outside the day range are dropped)
+        """
+        n_days = max(0, end_day - start_day + 1)
+
+        if rows:
+            positions, rowids, ids, timestamps = zip(*rows)
+        else:
+            positions, rowids, ids, timestamps = (), (), (), ()
+
+        topic_index = np.array(positions, dtype=np.int64)
+        day_index = np.floor(np.array(timestamps, dtype=np.float64) / 86400).astype(np.int64) - start_day
+
+        keep = (day_index >= 0) & (day_index < n_days)
+        topic_index, day_index = topic_index[keep], day_index[keep]
+        rowids = np.array(rowids, dtype=np.int64)[keep]
+
+        article_rowids, first, article_index = np.unique(rowids, return_index=True, return_inverse=True)
+        kept_ids = np.flatnonzero(keep)
+        article_ids = [ids[kept_ids[i]] for i in first]
+
+        return cls(topics, start_day, n_days, topic_index, article_index, day_index, article_rowids, article_ids)
+
+    def _daily_sum(self, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sum one value per mention (default 1) into a (topics, days) matrix"""
+        cells = self.topic_index * self.n_days + self.day_index
+        sums = np.bincount(cells, weights=weights, minlength=len(self.topics) * self.n_days)
+        return sums.reshape(len(self.topics), self.n_days)
+
+    def with_sentiment(self, scores: np.ndarray) -> "TopicTimelines":
+        """
+        Add daily sentiment sums
+
+        Args:
+            scores: Matrix of shape (len(article_rowids), len(SENTIMENT_FIELDS))
+                with the sentiment of each distinct article
+
+        Returns:
+            self
+        """
+        per_mention = scores[self.article_index] if len(self.article_index) else np.zeros((0, len(SENTIMENT_FIELDS)))
+        self.sentiment_sums = np.stack(
+            [self._daily_sum(per_mention[:, field]) for field in range(len(SENTIMENT_FIELDS))],
+            axis=-1
+        )
+        return self
+
+    @property
+    def dates(self) -> list[str]:
+        """Date (YYYY-MM-DD, UTC) of each day column"""
+        return [
+            datetime.fromtimestamp((self.start_day + i) * 86400, tz=timezone.utc).strftime("%Y-%m-%d")
+            for i in range(self.n_days)
+        ]
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Mentions of each topic over the whole range"""
+        return self.counts.sum(axis=1)
+
+    def sentiment_means(self) -> Optional[np.ndarray]:
+        """
+        Average sentiment per topic and day
+
+        Returns:
+            Array of shape (topics, days, len(SENTIMENT_FIELDS)), NaN on days
+            without mentions, or None without sentiment
+        """
+        if self.sentiment_sums is None:
+            return None
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.sentiment_sums / self.counts[:, :, None]
+
+    def overall_sentiment(self, index: int) -> dict[str, float]:
+        """
+        Average sentiment of one topic over the whole range
+
+        Args:
+            index: Topic index
+
+        Returns:
+            Dictionary with one average per sentiment field (0 without mentions)
+        """
+        total = self.totals[index]
+        if self.sentiment_sums is None or not total:
+            return {field: 0 for field in SENTIMENT_FIELDS}
+
+        sums = self.sentiment_sums[index].sum(axis=0)
+        return {field: round(float(sums[i] / total), 2) for i, field in enumerate(SENTIMENT_FIELDS)}
+
+    def article_sample(self, index: int, limit: int = 50) -> list[str]:
+        """
+        IDs of articles mentioning a topic, in the order they were matched
+
+        Args:
+            index: Topic index
+            limit: Maximum IDs returned
+
+        Returns:
+            Article IDs
+        """
+        matches = self.article_index[self.topic_index == index][:limit]
+        return [self.article_ids[i] for i in matches]
+
+    def timeline(self, index: int) -> list[dict[str, Any]]:
+        """
+        Daily mention counts of one topic, days without mentions omitted
+
+        Args:
+            index: Topic index
+
+        Returns:
+            List of {"date", "count"} dictionaries
+        """
+        dates = self.dates
+        return [
+            {"date": dates[day], "count": int(self.counts[index, day])}
+            for day in np.flatnonzero(self.counts[index])
+        ]
+
+    def sentiment_timeline(self, index: int) -> list[dict[str, Any]]:
+        """
+        Daily average sentiment of one topic, days without mentions omitted
+
+        Args:
+            index: Topic index
+
+        Returns:
+            List of {"date", <sentiment fields>, "article_count"} dictionaries
+        """
+        means = self.sentiment_means()
+        if means is None:
+            return []
+
+        dates = self.dates
+        return [
+            {
+                "date": dates[day],
+                **{field: round(float(means[index, day, i]), 2) for i, field in enumerate(SENTIMENT_FIELDS)},
+                "article_count": int(self.counts[index, day])
+            }
+            for day in np.flatnonzero(self.counts[index])
+        ]
+
+    def aligned(self, index: int) -> dict[str, Any]:
+        """
+        Full timeline of one topic with one value per day column
+
+        Args:
+            index: Topic index
+
+        Returns:
+            Dictionary with topic, total_mentions, counts and, with sentiment,
+            per-field daily averages (None on days without mentions)
+        """
+        result = {
+            "topic": self.topics[index],
+            "total_mentions": int(self.totals[index]),
+            "counts": self.counts[index].tolist()
+        }
+
+        means = self.sentiment_means()
+        if means is not None:
+            result["sentiment"] = {
+                field: [None if np.isnan(value) else round(float(value), 2) for value in means[index, :, i]]
+                for i, field in enumerate(SENTIMENT_FIELDS)
+            }
+            result["overall_sentiment"] = self.overall_sentiment(index)
+
+        return result
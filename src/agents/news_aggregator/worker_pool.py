@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+Shared executors for CPU-bound news processing
+
+Feed parsing and article parsing are CPU-bound, so they run in a process
+pool (or a thread pool when configured) instead of on the event loop.
+Executors are created on first use and shared by all agent instances in
+the process.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import os
+from typing import Optional
+
+_EXECUTORS: dict[tuple[str, int], Executor] = {}
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Resolve a configured worker count
+
+    Args:
+        workers: Configured count; None or 0 means one per CPU core
+
+    Returns:
+        Worker count (at least 1)
+    """
+    if not workers:
+        workers = os.cpu_count() or 1
+    return max(1, workers)
+
+
+def get_executor(kind: str = "process", workers: Optional[int] = None) -> Executor:
+    """
+    Get the shared executor of a kind and size
+
+    Args:
+        kind: "process" or "thread"
+        workers: Worker count (None or 0 for one per CPU core)
+
+    Returns:
+        Executor instance
+    """
+    key = (kind, resolve_workers(workers))
+
+    if key not in _EXECUTORS:
+        if kind == "thread":
+            _EXECUTORS[key] = ThreadPoolExecutor(max_workers=key[1])
+        else:
+            _EXECUTORS[key] = ProcessPoolExecutor(max_workers=key[1])
+
+    return _EXECUTORS[key]
+
+
+def shutdown_executors() -> None:
+    """Shut down all shared executors"""
+    for executor in _EXECUTORS.values():
+        executor.shutdown(wait=False, cancel_futures=True)
+    _EXECUTORS.clear()
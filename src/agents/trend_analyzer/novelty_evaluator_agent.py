@@ -2,12 +2,15 @@
 """
 NoveltyEvaluatorAgent - Detects genuinely new information vs recycled content
 
-Evaluates how novel an article's information is compared to previous coverage
+Evaluates how novel an article's information is compared to previous coverage.
+Earlier articles of the same category within lookback_days are kept in a
+sliding-window MinHash/LSH index (NoveltyIndex), so each article is scored
+with one index query instead of a text diff against every predecessor.
 """
 
-from datetime import datetime, timedelta
-from typing import Any
-from difflib import SequenceMatcher
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterable, AsyncIterator, Optional
 from pathlib import Path
 import sys
 
@@ -17,17 +20,33 @@ if str(_project_root) not in sys.path:
 
 from src.core.logging import get_logger
 
+from .novelty_index import NoveltyIndex
+
+# Articles are compared on word sets, which keeps paraphrases of one story close;
+# 60 bands of 2 rows find word sets 20% alike with 92% probability
+NOVELTY_INDEX_DEFAULTS = {"shingle_unit": "word", "shingle_size": 1, "bands": 60}
+
 
 class NoveltyEvaluatorAgent:
     """Agent for evaluating content novelty"""
 
+    # Window of stored and ingested articles used to score new articles,
+    # shared by all instances and filled from storage on first use
+    _live_index: Optional[NoveltyIndex] = None
+
     def __init__(self, config: dict[str, Any]):
         """Initialize novelty evaluator agent"""
         self.config = config
         self.logger = get_logger(name="novelty_evaluator_agent")
-        self.novelty_threshold = config.get("trend_analysis", {}).get("detection", {}).get("novelty_threshold", 0.6)
+        self.novelty_threshold = config.get("trend_analysis", {}).get("detection", {}).get("novelty_threshold", 0.8)
+        self.novelty_config = config.get("trend_analysis", {}).get("novelty", {})
+        self.lookback_days = self.novelty_config.get("lookback_days", 7)
         self.logger.info("NoveltyEvaluatorAgent initialized")
 
+    def _new_index(self, lookback_days: Optional[float] = None) -> NoveltyIndex:
+        """Create an empty index with the configured MinHash parameters"""
+        return NoveltyIndex.from_config({**NOVELTY_INDEX_DEFAULTS, **self.novelty_config}, lookback_days)
+
     async def evaluate_novelty(
         self,
         article: dict[str, Any],
@@ -45,86 +64,124 @@ class NoveltyEvaluatorAgent:
         Returns:
             Novelty score and analysis
         """
-        article_content = f"{article.get('title', '')} {article.get('description', '')}"
+        index = self._new_index(lookback_days)
+        article_ts = self._timestamp(article)
+
+        # Only earlier articles count (and later ones would move the window on)
+        for hist_article in historical_articles:
+            hist_ts = self._timestamp(hist_article)
+            if article_ts is not None and hist_ts is not None and hist_ts < article_ts:
+                self._add(index, hist_article)
+
+        return self._score(index, article)
+
+    def _add(self, index: NoveltyIndex, article: dict[str, Any], signature: Optional[tuple[int, ...]] = None) -> None:
+        """Add an article with a publish date to an index"""
+        published = self._parse_date(article.get("published_at"))
+        if not published:
+            return
+
+        if signature is None:
+            signature = index.signature(self._content(article))
+
+        index.add(article.get("id"), article.get("category"), published.timestamp(), signature)
+
+    def _score(
+        self,
+        index: NoveltyIndex,
+        article: dict[str, Any],
+        signature: Optional[tuple[int, ...]] = None
+    ) -> dict[str, Any]:
+        """
+        Score an article against the earlier articles of an index
+
+        Args:
+            index: Index holding the earlier articles
+            article: Article to evaluate
+            signature: Precomputed signature of the article
+
+        Returns:
+            Novelty score and analysis
+        """
+        article_content = self._content(article)
 
         if not article_content.strip():
             return {"novelty_score": 0.0, "reason": "Empty content"}
 
-        # Filter historical articles by date and topic
-        cutoff_date = datetime.now() - timedelta(days=lookback_days)
         article_published = self._parse_date(article.get("published_at"))
 
         if not article_published:
             return {"novelty_score": 0.5, "reason": "No publish date"}
 
-        relevant_articles = []
-        for hist_article in historical_articles:
-            hist_published = self._parse_date(hist_article.get("published_at"))
+        if signature is None:
+            signature = index.signature(article_content)
 
-            if not hist_published or hist_published >= article_published:
-                continue
-
-            if hist_published < cutoff_date:
-                continue
+        max_similarity, most_similar = index.most_similar(
+            article.get("category"),
+            article_published.timestamp(),
+            signature,
+            exclude=article.get("id")
+        )
 
-            # Same category increases relevance
-            if article.get("category") == hist_article.get("category"):
-                relevant_articles.append(hist_article)
+        if most_similar is None:
+            if not index.has_coverage(article.get("category")):
+                return {
+                    "novelty_score": 1.0,
+                    "reason": "No similar recent coverage found",
+                    "similar_articles": []
+                }
 
-        if not relevant_articles:
+            # Recent coverage exists, but none of it shares enough words to be
+            # an LSH candidate
             return {
                 "novelty_score": 1.0,
-                "reason": "No similar recent coverage found",
-                "similar_articles": []
+                "max_similarity": 0.0,
+                "similar_articles": [],
+                "classification": self._classify_novelty(1.0),
+                "reason": "No close match in recent coverage"
             }
 
-        # Calculate similarity to previous articles
-        max_similarity = 0.0
-        most_similar = None
-
-        for hist_article in relevant_articles:
-            hist_content = f"{hist_article.get('title', '')} {hist_article.get('description', '')}"
-            similarity = self._calculate_similarity(article_content, hist_content)
-
-            if similarity > max_similarity:
-                max_similarity = similarity
-                most_similar = hist_article
-
         # Novelty = 1 - similarity
         novelty_score = max(0.0, 1.0 - max_similarity)
 
         result = {
             "novelty_score": round(novelty_score, 2),
             "max_similarity": round(max_similarity, 2),
-            "similar_articles": [most_similar.get("id")] if most_similar else [],
+            "similar_articles": [most_similar],
             "classification": self._classify_novelty(novelty_score),
             "reason": self._generate_reason(novelty_score, max_similarity)
         }
 
         return result
 
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two texts"""
-        return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+    def _content(self, article: dict[str, Any]) -> str:
+        """Text an article is compared on"""
+        return f"{article.get('title') or ''} {article.get('description') or ''}"
 
     def _classify_novelty(self, score: float) -> str:
-        """Classify novelty level"""
-        if score >= 0.8:
+        """
+        Classify novelty level
+
+        Cutoffs are on word-set Jaccard similarity: paraphrases of one story
+        share 35-50% of their words, follow-ups 10-20%, unrelated articles
+        of a category under 10%.
+        """
+        if score >= 0.9:
             return "highly_novel"
-        elif score >= 0.6:
+        elif score >= 0.8:
             return "moderately_novel"
-        elif score >= 0.4:
+        elif score >= 0.65:
             return "somewhat_novel"
         else:
             return "recycled"
 
     def _generate_reason(self, novelty: float, similarity: float) -> str:
         """Generate human-readable reason"""
-        if novelty >= 0.8:
+        if novelty >= 0.9:
             return "Genuinely new information not covered in recent articles"
-        elif novelty >= 0.6:
+        elif novelty >= 0.8:
             return "Adds new perspective or details to ongoing story"
-        elif novelty >= 0.4:
+        elif novelty >= 0.65:
             return "Updates existing story with some new information"
         else:
             return f"Largely similar to previous coverage ({similarity*100:.0f}% similar)"
@@ -137,6 +194,8 @@ class NoveltyEvaluatorAgent:
         """
         Evaluate novelty for multiple articles
 
+        Each article is compared with the earlier articles of the list.
+
         Args:
             articles: List of articles (should be sorted by publish date)
             lookback_days: Lookback window
@@ -144,49 +203,139 @@ class NoveltyEvaluatorAgent:
         Returns:
             Articles with novelty scores
         """
-        results = []
-
         # Sort by publish date
         sorted_articles = sorted(
             articles,
-            key=lambda a: self._parse_date(a.get("published_at")) or datetime.min
+            key=lambda a: self._timestamp(a) or float("-inf")
         )
 
-        for i, article in enumerate(sorted_articles):
-            # Use all previous articles as historical context
-            historical = sorted_articles[:i]
+        index = self._new_index(lookback_days)
+        return [scored async for scored in self._evaluate_in_order(index, sorted_articles)]
+
+    async def evaluate_stream(
+        self,
+        batches: AsyncIterable[list[dict[str, Any]]],
+        lookback_days: Optional[int] = None,
+        index: Optional[NoveltyIndex] = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Score articles as they arrive
+
+        Every article is compared with the articles that arrived before it
+        (and with whatever the index already holds), then added to the
+        index, so a stream is scored incrementally with bounded memory.
+
+        Args:
+            batches: Async iterable of article lists, roughly in publish order
+            lookback_days: Lookback window (default from config)
+            index: Index to score against and update (default a new empty one)
+
+        Yields:
+            Articles with novelty scores
+        """
+        if index is None:
+            index = self._new_index(lookback_days)
+
+        async for batch in batches:
+            ordered = sorted(batch, key=lambda a: self._timestamp(a) or float("-inf"))
+            async for scored in self._evaluate_in_order(index, ordered):
+                yield scored
+
+    async def score_articles(
+        self,
+        articles: list[dict[str, Any]],
+        storage: Optional[Any] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Add novelty to newly ingested articles
+
+        Articles are scored against the live window of stored and previously
+        ingested articles (filled from storage on first use), then join it.
+
+        Args:
+            articles: New articles (updated in place)
+            storage: NewsStorage to fill the live window from
+
+        Returns:
+            The articles
+        """
+        index = await self.get_live_index(storage)
+        ordered = sorted(articles, key=lambda a: self._timestamp(a) or float("-inf"))
+
+        async for scored in self._evaluate_in_order(index, ordered, copy=False):
+            pass
+
+        return articles
+
+    async def get_live_index(self, storage: Optional[Any] = None) -> NoveltyIndex:
+        """
+        Get the shared window of recent articles
+
+        Args:
+            storage: NewsStorage to fill the window from on first use
+
+        Returns:
+            NoveltyIndex covering the configured lookback_days
+        """
+        if NoveltyEvaluatorAgent._live_index is None:
+            index = self._new_index()
 
-            novelty = await self.evaluate_novelty(article, historical, lookback_days)
+            if storage is not None:
+                after_date = datetime.now() - timedelta(days=self.lookback_days)
+                async for article in storage.iter_articles(processed=True, after_date=after_date):
+                    self._add(index, article)
 
-            article_with_novelty = article.copy()
-            article_with_novelty["novelty"] = novelty
+            self.logger.info(f"Novelty window loaded with {len(index)} articles")
+            NoveltyEvaluatorAgent._live_index = index
 
-            results.append(article_with_novelty)
+        return NoveltyEvaluatorAgent._live_index
 
-        return results
+    async def _evaluate_in_order(
+        self,
+        index: NoveltyIndex,
+        articles: list[dict[str, Any]],
+        copy: bool = True
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Score articles one after the other, adding each to the index once scored"""
+        for article in articles:
+            signature = index.signature(self._content(article))
+            novelty = self._score(index, article, signature)
+            self._add(index, article, signature)
+
+            scored = article.copy() if copy else article
+            scored["novelty"] = novelty
+            yield scored
 
     async def find_novel_articles(
         self,
         articles: list[dict[str, Any]],
-        min_novelty: float = 0.6,
-        lookback_days: int = 7
+        min_novelty: Optional[float] = None,
+        lookback_days: int = 7,
+        published_after: Optional[datetime] = None
     ) -> list[dict[str, Any]]:
         """
         Find articles with high novelty scores
 
         Args:
             articles: List of articles
-            min_novelty: Minimum novelty threshold
+            min_novelty: Minimum novelty threshold (default novelty_threshold)
             lookback_days: Lookback window
+            published_after: Only return articles published at or after this
+                date; earlier ones only serve as previous coverage
 
         Returns:
             Novel articles
         """
+        if min_novelty is None:
+            min_novelty = self.novelty_threshold
+
         evaluated = await self.batch_evaluate(articles, lookback_days)
+        after_ts = published_after.timestamp() if published_after else None
 
         novel_articles = [
             article for article in evaluated
             if article.get("novelty", {}).get("novelty_score", 0) >= min_novelty
+            and (after_ts is None or (self._timestamp(article) or float("-inf")) >= after_ts)
         ]
 
         self.logger.info(f"Found {len(novel_articles)} novel articles out of {len(articles)}")
@@ -194,11 +343,26 @@ class NoveltyEvaluatorAgent:
         return novel_articles
 
     def _parse_date(self, date_str: str | None) -> datetime | None:
-        """Parse date string to datetime"""
+        """Parse an ISO 8601 or RFC 822 (RSS) date string to datetime"""
         if not date_str:
             return None
 
         try:
             return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        except Exception:
+            pass
+
+        try:
+            published = parsedate_to_datetime(date_str)
         except Exception:
             return None
+
+        # RFC 822 dates without a zone ("-0000") are UTC
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        return published
+
+    def _timestamp(self, article: dict[str, Any]) -> Optional[float]:
+        """Publish timestamp of an article"""
+        published = self._parse_date(article.get("published_at"))
+        return published.timestamp() if published else None
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+"""
+NoveltyIndex - Sliding window of recent articles for novelty scoring
+
+Each category has its own MinHash/LSH index of the articles published in
+the last lookback_days. Scoring an article is one LSH query returning the
+few earlier articles that share a band with it; their similarity is the
+MinHash estimate of the Jaccard similarity of the two texts' shingle sets. Entries are
+evicted once they fall out of the window, so memory stays proportional to
+the window instead of the whole corpus.
+"""
+
+import heapq
+from typing import Any, Optional
+
+from src.agents.news_aggregator.minhash import LSHIndex, MinHasher
+
+
+class NoveltyIndex:
+    """Per-category sliding-window LSH index of article signatures"""
+
+    def __init__(
+        self,
+        lookback_days: float = 7,
+        num_perm: int = 120,
+        bands: int = 40,
+        shingle_size: int = 5,
+        seed: int = 1,
+        shingle_unit: str = "char"
+    ):
+        """
+        Initialize novelty index
+
+        Args:
+            lookback_days: Window length; older entries are evicted
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must be divisible by bands)
+            shingle_size: Shingle length in characters (or words)
+            seed: Seed for the permutation coefficients
+            shingle_unit: "char" or "word"
+        """
+        self.window_seconds = lookback_days * 86400
+        self.num_perm = num_perm
+        self.bands = bands
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size, seed=seed, shingle_unit=shingle_unit)
+
+        self._indexes: dict[str, LSHIndex] = {}
+        # key -> (category, published timestamp)
+        self._entries: dict[str, tuple[str, float]] = {}
+        # (published timestamp, key) min-heap for eviction; may hold stale items
+        self._expiry: list[tuple[float, str]] = []
+        self._latest = float("-inf")
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any], lookback_days: Optional[float] = None) -> "NoveltyIndex":
+        """
+        Build an empty index from a config block
+
+        Args:
+            config: Dictionary with optional lookback_days, num_perm, bands,
+                shingle_size, shingle_unit and seed
+            lookback_days: Override the configured window
+
+        Returns:
+            NoveltyIndex
+        """
+        return cls(
+            lookback_days=lookback_days if lookback_days is not None else config.get("lookback_days", 7),
+            num_perm=config.get("num_perm", 120),
+            bands=config.get("bands", 40),
+            shingle_size=config.get("shingle_size", 5),
+            seed=config.get("seed", 1),
+            shingle_unit=config.get("shingle_unit", "char")
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def has_coverage(self, category: str) -> bool:
+        """
+        Check whether the window holds any article of a category
+
+        Args:
+            category: Article category
+
+        Returns:
+            True if the category's index is not empty
+        """
+        index = self._indexes.get(category)
+        return index is not None and len(index) > 0
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        """
+        Compute the signature of an article text
+
+        Args:
+            text: Title and description
+
+        Returns:
+            MinHash signature (empty for empty text)
+        """
+        return self.hasher.signature(text)
+
+    def add(self, key: str, category: str, published_ts: float, signature: tuple[int, ...]) -> None:
+        """
+        Add an article to the window and evict entries that fell out of it
+
+        Args:
+            key: Article ID
+            category: Article category
+            published_ts: Publish timestamp
+            signature: Signature from signature()
+        """
+        if not signature:
+            return
+
+        if key in self._entries:
+            self.remove(key)
+
+        index = self._indexes.get(category)
+        if index is None:
+            index = self._indexes[category] = LSHIndex(num_perm=self.num_perm, bands=self.bands)
+
+        index.insert(key, signature)
+        self._entries[key] = (category, published_ts)
+        heapq.heappush(self._expiry, (published_ts, key))
+
+        if published_ts > self._latest:
+            self._latest = published_ts
+            self.evict(published_ts - self.window_seconds)
+
+    def remove(self, key: str) -> None:
+        """
+        Remove an article from the window
+
+        Args:
+            key: Article ID
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._indexes[entry[0]].remove(key)
+
+    def evict(self, before_ts: float) -> int:
+        """
+        Remove articles published before a time
+
+        Args:
+            before_ts: Cutoff timestamp
+
+        Returns:
+            Number of articles removed
+        """
+        removed = 0
+
+        while self._expiry and self._expiry[0][0] < before_ts:
+            published_ts, key = heapq.heappop(self._expiry)
+            entry = self._entries.get(key)
+            # Skip heap items left behind by re-added or removed keys
+            if entry is not None and entry[1] == published_ts:
+                self.remove(key)
+                removed += 1
+
+        return removed
+
+    def most_similar(
+        self,
+        category: str,
+        published_ts: float,
+        signature: tuple[int, ...],
+        exclude: Optional[str] = None
+    ) -> tuple[float, Optional[str]]:
+        """
+        Find the most similar earlier article of the same category
+
+        Only articles published before published_ts and within the window
+        before it are considered.
+
+        Args:
+            category: Article category
+            published_ts: Publish timestamp of the scored article
+            signature: Signature of the scored article
+            exclude: Key to ignore (the scored article itself)
+
+        Returns:
+            Tuple of (estimated similarity, article ID), (0.0, None) if no
+            candidate shares a band
+        """
+        matches = self.similar(category, published_ts, signature, exclude=exclude)
+        return matches[0] if matches else (0.0, None)
+
+    def similar(
+        self,
+        category: str,
+        published_ts: float,
+        signature: tuple[int, ...],
+        min_similarity: float = 0.0,
+        exclude: Optional[str] = None
+    ) -> list[tuple[float, str]]:
+        """
+        Find the earlier articles of the same category that share a band
+
+        Args:
+            category: Article category
+            published_ts: Publish timestamp of the scored article
+            signature: Signature of the scored article
+            min_similarity: Drop candidates estimated below this similarity
+            exclude: Key to ignore (the scored article itself)
+
+        Returns:
+            List of (estimated similarity, article ID), most similar first
+        """
+        index = self._indexes.get(category)
+        if index is None or not signature:
+            return []
+
+        matches = []
+        earliest = published_ts - self.window_seconds
+
+        for key in index.query(signature):
+            if key == exclude:
+                continue
+
+            candidate_ts = self._entries[key][1]
+            if candidate_ts >= published_ts or candidate_ts < earliest:
+                continue
+
+            similarity = MinHasher.jaccard(signature, index.get_signature(key))
+            if similarity > 0.0 and similarity >= min_similarity:
+                matches.append((similarity, key))
+
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        return matches
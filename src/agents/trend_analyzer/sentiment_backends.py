@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""
+Sentiment scoring backends for SentimentTrackerAgent
+
+Every backend scores a whole batch of texts at once and returns one
+{"positive", "neutral", "negative", "compound", "model"} dictionary per
+text. Backends with optional dependencies (VADER, TextBlob) are created
+only if the package is installed; the lexicon backend has no dependency
+and matches its whole word list in one regex pass per text.
+"""
+
+from abc import ABC, abstractmethod
+import re
+from typing import Any
+
+# Texts are scored on their first characters only
+MAX_TEXT_LENGTH = 1000
+
+NEUTRAL_SENTIMENT = {"positive": 0.33, "neutral": 0.34, "negative": 0.33, "compound": 0.0}
+
+
+class SentimentBackend(ABC):
+    """Interface of a batch sentiment scorer"""
+
+    name = "base"
+
+    @abstractmethod
+    def score_batch(self, texts: list[str]) -> list[dict[str, Any]]:
+        """
+        Score a batch of texts
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            One sentiment dictionary per text
+        """
+
+
+class VaderBackend(SentimentBackend):
+    """VADER rule-based scorer (vaderSentiment package)"""
+
+    name = "vader"
+
+    def __init__(self):
+        """Initialize backend (raises ImportError without vaderSentiment)"""
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+        self.analyzer = SentimentIntensityAnalyzer()
+
+    def score_batch(self, texts: list[str]) -> list[dict[str, Any]]:
+        results = []
+
+        for text in texts:
+            if not text:
+                results.append({**NEUTRAL_SENTIMENT, "model": self.name})
+                continue
+
+            scores = self.analyzer.polarity_scores(text[:MAX_TEXT_LENGTH])
+            results.append({
+                "positive": scores["pos"],
+                "neutral": scores["neu"],
+                "negative": scores["neg"],
+                "compound": scores["compound"],
+                "model": self.name
+            })
+
+        return results
+
+
+class TextBlobBackend(SentimentBackend):
+    """TextBlob pattern-based polarity"""
+
+    name = "textblob"
+
+    def __init__(self):
+        """Initialize backend (raises ImportError without textblob)"""
+        from textblob import TextBlob
+
+        self.text_blob = TextBlob
+
+    def score_batch(self, texts: list[str]) -> list[dict[str, Any]]:
+        results = []
+
+        for text in texts:
+            if not text:
+                results.append({**NEUTRAL_SENTIMENT, "model": self.name})
+                continue
+
+            polarity = self.text_blob(text[:MAX_TEXT_LENGTH]).sentiment.polarity  # -1 to 1
+
+            # Convert polarity to positive/negative/neutral
+            if polarity > 0.1:
+                scores = {"positive": min(1.0, 0.5 + polarity/2), "neutral": 0.3, "negative": max(0.0, 0.2 - polarity/2)}
+            elif polarity < -0.1:
+                scores = {"positive": max(0.0, 0.2 + polarity/2), "neutral": 0.3, "negative": min(1.0, 0.5 - polarity/2)}
+            else:
+                scores = {"positive": 0.25, "neutral": 0.5, "negative": 0.25}
+
+            results.append({**scores, "compound": polarity, "model": self.name})
+
+        return results
+
+
+class LexiconBackend(SentimentBackend):
+    """Positive/negative word lexicon, matched with one regex pass per text"""
+
+    name = "rule-based"
+
+    POSITIVE_WORDS = ["good", "great", "excellent", "positive", "success", "win", "improve", "growth", "hope", "better"]
+    NEGATIVE_WORDS = ["bad", "poor", "negative", "fail", "loss", "worse", "decline", "crisis", "concern", "threat"]
+
+    def __init__(self):
+        """Initialize backend"""
+        words = self.POSITIVE_WORDS + self.NEGATIVE_WORDS
+
+        # Zero-width lookahead, so every position is tried and overlapping
+        # words are all found (no word is a prefix of another)
+        self.pattern = re.compile(f"(?=({'|'.join(map(re.escape, words))}))")
+        self.positive = set(self.POSITIVE_WORDS)
+
+    def score_batch(self, texts: list[str]) -> list[dict[str, Any]]:
+        results = []
+
+        for text in texts:
+            found = set(self.pattern.findall((text or "")[:MAX_TEXT_LENGTH].lower()))
+            positive_count = len(found & self.positive)
+            total = len(found)
+
+            if total == 0:
+                results.append({**NEUTRAL_SENTIMENT, "model": self.name})
+                continue
+
+            pos_ratio = positive_count / total
+            neg_ratio = (total - positive_count) / total
+
+            results.append({
+                "positive": round(pos_ratio, 2),
+                "neutral": round(1 - pos_ratio - neg_ratio, 2),
+                "negative": round(neg_ratio, 2),
+                "compound": round(pos_ratio - neg_ratio, 2),
+                "model": self.name
+            })
+
+        return results
+
+
+BACKENDS = {
+    "vader": VaderBackend,
+    "textblob": TextBlobBackend,
+    "lexicon": LexiconBackend,
+    "rule-based": LexiconBackend,
+}
+
+
+def create_backend(models: list[str]) -> tuple[SentimentBackend, list[str]]:
+    """
+    Create the first available backend of a preference list
+
+    Args:
+        models: Backend names in order of preference
+
+    Returns:
+        Tuple of (backend, names that were skipped); falls back to the
+        lexicon backend if none is available
+    """
+    skipped = []
+
+    for name in models:
+        backend_class = BACKENDS.get(name)
+        if backend_class is None:
+            skipped.append(name)
+            continue
+
+        try:
+            return backend_class(), skipped
+        except ImportError:
+            skipped.append(name)
+
+    return LexiconBackend(), skipped
@@ -2,25 +2,65 @@
 """
 SentimentTrackerAgent - Tracks sentiment evolution for topics over time
 
-Analyzes emotional tone and sentiment trends in news coverage
+Analyzes emotional tone and sentiment trends in news coverage. Articles are
+scored once, at ingest (score_articles() in the ingestion pipeline), and
+the scores are stored with the article; texts scored later are cached by
+content hash, so topic sentiment is an aggregation of stored scores. A stored
+score is only used if the current backend produced it, so switching models
+(or installing a better one) rescores articles as they are read.
 """
 
 from datetime import datetime, timedelta
-from typing import Any
+import hashlib
+from typing import Any, Optional
 from collections import defaultdict
 from pathlib import Path
 import sys
 
+import numpy as np
+
 _project_root = Path(__file__).parent.parent.parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
+from src.agents.news_aggregator.topic_timelines import SENTIMENT_FIELDS
 from src.core.logging import get_logger
 
+from .sentiment_backends import NEUTRAL_SENTIMENT, SentimentBackend, create_backend
+
+
+def content_hash(text: str) -> str:
+    """
+    Hash a scored text for the sentiment cache
+
+    Args:
+        text: Scored text
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def sentiment_text(article: dict[str, Any]) -> str:
+    """
+    Get the text an article's sentiment is scored on
+
+    Args:
+        article: Article dictionary
+
+    Returns:
+        Title and description
+    """
+    return f"{article.get('title') or ''} {article.get('description') or ''}"
+
 
 class SentimentTrackerAgent:
     """Agent for tracking sentiment in news articles"""
 
+    # Scoring backends by model preference list, shared by all instances
+    _backends: dict[tuple[str, ...], SentimentBackend] = {}
+
     def __init__(self, config: dict[str, Any]):
         """Initialize sentiment tracker agent"""
         self.config = config
@@ -28,9 +68,28 @@ class SentimentTrackerAgent:
         self.logger = get_logger(name="sentiment_tracker_agent")
 
         self.enabled = self.sentiment_config.get("enabled", True)
-        self.models = self.sentiment_config.get("models", ["vader"])
+        self.models = self.sentiment_config.get("models", ["vader", "textblob", "lexicon"])
+        self.backend = self._get_backend()
+
+        self.logger.info(f"SentimentTrackerAgent initialized (models={self.models}, backend={self.backend.name})")
+
+    def _get_backend(self) -> SentimentBackend:
+        """Get the first available backend of the configured models, created once per process"""
+        key = tuple(self.models)
+
+        if key not in SentimentTrackerAgent._backends:
+            backend, skipped = create_backend(self.models)
+            if skipped:
+                self.logger.debug(f"Sentiment models not available: {skipped}")
+            SentimentTrackerAgent._backends[key] = backend
+
+        return SentimentTrackerAgent._backends[key]
 
-        self.logger.info(f"SentimentTrackerAgent initialized (models={self.models})")
+    def _stored_sentiment(self, sentiment: Any) -> Optional[dict[str, Any]]:
+        """Get a stored score if the current backend produced it, else None"""
+        if isinstance(sentiment, dict) and sentiment.get("model") == self.backend.name:
+            return sentiment
+        return None
 
     async def analyze_sentiment(self, text: str) -> dict[str, Any]:
         """
@@ -43,72 +102,66 @@ class SentimentTrackerAgent:
             Sentiment scores (positive, negative, neutral)
         """
         if not self.enabled or not text:
-            return {"positive": 0.33, "neutral": 0.34, "negative": 0.33, "compound": 0.0}
+            return dict(NEUTRAL_SENTIMENT)
 
-        # Try TextBlob first (simple and fast)
-        try:
-            from textblob import TextBlob
-
-            blob = TextBlob(text[:1000])  # Limit to first 1000 chars
-            polarity = blob.sentiment.polarity  # -1 to 1
-
-            # Convert polarity to positive/negative/neutral
-            if polarity > 0.1:
-                return {
-                    "positive": min(1.0, 0.5 + polarity/2),
-                    "neutral": 0.3,
-                    "negative": max(0.0, 0.2 - polarity/2),
-                    "compound": polarity,
-                    "model": "textblob"
-                }
-            elif polarity < -0.1:
-                return {
-                    "positive": max(0.0, 0.2 + polarity/2),
-                    "neutral": 0.3,
-                    "negative": min(1.0, 0.5 - polarity/2),
-                    "compound": polarity,
-                    "model": "textblob"
-                }
-            else:
-                return {
-                    "positive": 0.25,
-                    "neutral": 0.5,
-                    "negative": 0.25,
-                    "compound": polarity,
-                    "model": "textblob"
-                }
-
-        except ImportError:
-            self.logger.debug("TextBlob not available, using rule-based sentiment")
-
-        # Fallback: rule-based sentiment
-        return self._rule_based_sentiment(text)
-
-    def _rule_based_sentiment(self, text: str) -> dict[str, Any]:
-        """Simple rule-based sentiment analysis"""
-        text_lower = text.lower()
-
-        positive_words = ["good", "great", "excellent", "positive", "success", "win", "improve", "growth", "hope", "better"]
-        negative_words = ["bad", "poor", "negative", "fail", "loss", "worse", "decline", "crisis", "concern", "threat"]
-
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-
-        total = positive_count + negative_count
-
-        if total == 0:
-            return {"positive": 0.33, "neutral": 0.34, "negative": 0.33, "compound": 0.0, "model": "rule-based"}
-
-        pos_ratio = positive_count / total
-        neg_ratio = negative_count / total
+        return self.backend.score_batch([text])[0]
 
-        return {
-            "positive": round(pos_ratio, 2),
-            "neutral": round(1 - pos_ratio - neg_ratio, 2),
-            "negative": round(neg_ratio, 2),
-            "compound": round(pos_ratio - neg_ratio, 2),
-            "model": "rule-based"
-        }
+    async def score_texts(self, texts: list[str], storage: Optional[Any] = None) -> list[dict[str, Any]]:
+        """
+        Score a batch of texts, each distinct text once
+
+        Args:
+            texts: Texts to score
+            storage: NewsStorage whose sentiment cache is used (optional)
+
+        Returns:
+            One sentiment dictionary per text
+        """
+        if not self.enabled:
+            return [dict(NEUTRAL_SENTIMENT) for _ in texts]
+
+        hashes = [content_hash(text) for text in texts]
+        scores = await storage.get_cached_sentiment(hashes, self.backend.name) if storage else {}
+
+        missing = {digest: text for digest, text in zip(hashes, texts) if digest not in scores}
+        if missing:
+            fresh = list(zip(missing, self.backend.score_batch(list(missing.values()))))
+            scores.update(fresh)
+            if storage:
+                await storage.cache_sentiment(fresh, self.backend.name)
+
+        return [scores[digest] for digest in hashes]
+
+    async def score_articles(
+        self,
+        articles: list[dict[str, Any]],
+        storage: Optional[Any] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Add sentiment to articles that have none
+
+        Called by the ingestion pipeline, so stored articles carry their
+        scores; only articles without a "sentiment" of the current backend
+        are scored. Nothing is added while sentiment scoring is disabled.
+
+        Args:
+            articles: Articles (updated in place)
+            storage: NewsStorage whose sentiment cache is used (optional)
+
+        Returns:
+            The articles
+        """
+        if not self.enabled:
+            return articles
+
+        unscored = [article for article in articles if self._stored_sentiment(article.get("sentiment")) is None]
+
+        if unscored:
+            scores = await self.score_texts([sentiment_text(article) for article in unscored], storage)
+            for article, sentiment in zip(unscored, scores):
+                article["sentiment"] = sentiment
+
+        return articles
 
     async def track_topic_sentiment(
         self,
@@ -135,6 +188,7 @@ class SentimentTrackerAgent:
         # Collect articles mentioning topic
         daily_sentiments = defaultdict(lambda: {"positive": [], "negative": [], "neutral": []})
         total_articles = 0
+        matching = []
 
         for article in articles:
             published = self._parse_date(article.get("published_at"))
@@ -148,9 +202,17 @@ class SentimentTrackerAgent:
             if topic_lower not in title and topic_lower not in content:
                 continue
 
-            # Analyze sentiment
-            text = f"{article.get('title', '')} {article.get('description', '')}"
-            sentiment = await self.analyze_sentiment(text)
+            matching.append((published, article))
+
+        # Stored scores are reused; the rest are scored in one batch
+        scores = await self.score_texts([
+            sentiment_text(article) for _, article in matching
+            if self._stored_sentiment(article.get("sentiment")) is None
+        ])
+        unscored = iter(scores)
+
+        for published, article in matching:
+            sentiment = self._stored_sentiment(article.get("sentiment")) or next(unscored)
 
             date_key = published.strftime("%Y-%m-%d")
             daily_sentiments[date_key]["positive"].append(sentiment["positive"])
@@ -191,6 +253,61 @@ class SentimentTrackerAgent:
             "sentiment_trend": self._calculate_trend(timeline)
         }
 
+    async def add_timeline_sentiment(self, storage: Any, timelines: Any) -> Any:
+        """
+        Add daily sentiment to topic timelines
+
+        Sums the sentiment stored with each distinct article, however many
+        topics mention it.
+
+        Args:
+            storage: NewsStorage the timelines were read from
+            timelines: TopicTimelines from NewsStorage.topic_timelines()
+
+        Returns:
+            The timelines, with sentiment sums
+        """
+        rowids = timelines.article_rowids.tolist()
+        stored = await storage.get_article_sentiment(rowids)
+
+        # Articles stored without a score of the current backend go through the cache
+        unscored = [
+            rowid for rowid in rowids
+            if self._stored_sentiment(stored.get(rowid, (None, ""))[0]) is None
+        ]
+        fresh = dict(zip(unscored, await self.score_texts([stored.get(rowid, (None, ""))[1] for rowid in unscored], storage)))
+
+        scores = np.zeros((len(rowids), len(SENTIMENT_FIELDS)))
+        for i, rowid in enumerate(rowids):
+            sentiment = fresh.get(rowid) or stored[rowid][0]
+            scores[i] = [sentiment.get(field, 0.0) for field in SENTIMENT_FIELDS]
+
+        return timelines.with_sentiment(scores)
+
+    def summarize_sentiment(self, timelines: Any, index: int) -> dict[str, Any]:
+        """
+        Get the sentiment evolution of one topic from precomputed timelines
+
+        Same result as track_topic_sentiment(), without scanning articles.
+
+        Args:
+            timelines: TopicTimelines with sentiment (see add_timeline_sentiment())
+            index: Topic index
+
+        Returns:
+            Sentiment timeline and statistics
+        """
+        timeline = timelines.sentiment_timeline(index)
+
+        return {
+            "topic": timelines.topics[index],
+            "timeline": timeline,
+            "overall_sentiment": timelines.overall_sentiment(index),
+            "total_articles": int(timelines.totals[index]),
+            "days_analyzed": len(timeline),
+            "sentiment_trend": self._calculate_trend(timeline)
+        }
+
     def _calculate_trend(self, timeline: list[dict[str, Any]]) -> str:
         """Calculate sentiment trend direction"""
         if len(timeline) < 2:
@@ -213,28 +330,33 @@ class SentimentTrackerAgent:
         else:
             return "stable"
 
-    async def batch_analyze(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    async def batch_analyze(
+        self,
+        articles: list[dict[str, Any]],
+        storage: Optional[Any] = None
+    ) -> list[dict[str, Any]]:
         """
         Analyze sentiment for multiple articles
 
+        Stored scores are returned as they are; the rest are scored in one
+        batch (through the sentiment cache of storage, if given). While
+        sentiment scoring is disabled every article gets neutral scores.
+
         Args:
             articles: List of articles
+            storage: NewsStorage whose sentiment cache is used (optional)
 
         Returns:
             Articles with sentiment scores added
         """
-        results = []
-
-        for article in articles:
-            text = f"{article.get('title', '')} {article.get('description', '')}"
-            sentiment = await self.analyze_sentiment(text)
-
-            article_with_sentiment = article.copy()
-            article_with_sentiment["sentiment"] = sentiment
+        results = [article.copy() for article in articles]
 
-            results.append(article_with_sentiment)
+        if not self.enabled:
+            for article in results:
+                article["sentiment"] = dict(NEUTRAL_SENTIMENT)
+            return results
 
-        return results
+        return await self.score_articles(results, storage)
 
     def _parse_date(self, date_str: str | None) -> datetime | None:
         """Parse date string to datetime"""
@@ -2,21 +2,28 @@
 """
 TrendDetectorAgent - Detects emerging topics and trending stories
 
-Uses TF-IDF, time decay, and growth rate analysis to identify trending topics
+Uses TF-IDF, time decay, and growth rate analysis to identify trending topics.
+Stored articles are analyzed from the per-topic mention counters kept by
+NewsStorage (detect_trends_from_counters), without loading any article.
 """
 
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Optional
 from collections import defaultdict
 from pathlib import Path
 import sys
 
+import numpy as np
+
 _project_root = Path(__file__).parent.parent.parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 from src.core.logging import get_logger
 
+# Windows up to this many days are analyzed in hourly buckets, longer ones in daily buckets
+HOURLY_WINDOW_DAYS = 2
+
 
 class TrendDetectorAgent:
     """Agent for detecting trending topics in news"""
@@ -29,7 +36,9 @@ class TrendDetectorAgent:
 
         self.min_mentions = self.trend_config.get("min_mentions", 5)
         self.growth_threshold = self.trend_config.get("growth_threshold", 0.25)
-        self.novelty_threshold = self.trend_config.get("novelty_threshold", 0.6)
+        self.novelty_threshold = self.trend_config.get("novelty_threshold", 0.8)
+        self.ewma_half_life_days = self.trend_config.get("ewma_half_life_days", 3.0)
+        self.baseline_prior_per_day = self.trend_config.get("baseline_prior_per_day", 1.0)
 
         self.logger.info("TrendDetectorAgent initialized")
 
@@ -93,6 +102,123 @@ class TrendDetectorAgent:
         self.logger.info(f"Found {len(trends)} trending topics")
         return trends
 
+    async def detect_trends_from_counters(
+        self,
+        storage: Any,
+        time_window_days: int = 7,
+        category: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Detect trending topics from the stored topic mention counters
+
+        The mention rate over the most recent half of the window is compared
+        with an exponentially weighted baseline of the buckets before it,
+        reaching back one full window before the window starts. A small prior
+        keeps brand-new topics from dividing by zero.
+
+        Args:
+            storage: NewsStorage holding the counters
+            time_window_days: Time window for trend analysis
+            category: Only count mentions in this category
+
+        Returns:
+            List of trending topics with metrics, fastest growing first
+            (see add_trend_details() for categories, sources and articles)
+        """
+        granularity = "h" if time_window_days <= HOURLY_WINDOW_DAYS else "d"
+        now = datetime.now()
+        window_start = now - timedelta(days=time_window_days)
+
+        series = await storage.topic_series(
+            start=now - timedelta(days=2 * time_window_days),
+            end=now,
+            granularity=granularity,
+            category=category,
+            min_mentions=self.min_mentions,
+            mentions_since=window_start
+        )
+
+        if not series.topics:
+            self.logger.info("No topics reach the minimum mentions in the time window")
+            return []
+
+        counts = series.counts.astype(np.float64)
+        n_window = min(counts.shape[1], max(1, round(time_window_days / series.bucket_days)))
+        n_recent = max(1, n_window // 2)
+
+        window = counts[:, -n_window:]
+        recent = counts[:, -n_recent:]
+        history = counts[:, :-n_recent]
+
+        # Exponentially weighted mean of the history, newest buckets weighing most
+        if history.shape[1]:
+            alpha = 1 - 0.5 ** (series.bucket_days / self.ewma_half_life_days)
+            weights = (1 - alpha) ** np.arange(history.shape[1])[::-1]
+            baseline = history @ weights / weights.sum()
+        else:
+            baseline = np.zeros(len(series.topics))
+
+        prior = self.baseline_prior_per_day * series.bucket_days
+        recent_rate = recent.mean(axis=1)
+        growth = (recent_rate + prior) / (baseline + prior) - 1
+        mentions = window.sum(axis=1)
+
+        selected = np.flatnonzero((mentions >= self.min_mentions) & (growth >= self.growth_threshold))
+        selected = selected[np.argsort(-growth[selected], kind="stable")]
+
+        # First and last bucket with a mention inside the window
+        active = window > 0
+        first = active.argmax(axis=1)
+        last = n_window - 1 - active[:, ::-1].argmax(axis=1)
+        offset = counts.shape[1] - n_window
+
+        trends = [
+            {
+                "topic": series.topics[i],
+                "mention_count": int(mentions[i]),
+                "growth_rate": round(float(growth[i]), 2),
+                "recent_per_day": round(float(recent_rate[i] / series.bucket_days), 2),
+                "baseline_per_day": round(float(baseline[i] / series.bucket_days), 2),
+                "first_seen": series.bucket_start(offset + first[i]).isoformat(),
+                "latest_seen": series.bucket_start(offset + last[i]).isoformat(),
+                "status": self._classify_trend_status(float(growth[i]))
+            }
+            for i in selected
+        ]
+
+        self.logger.info(f"Found {len(trends)} trending topics among {len(series.topics)} candidates")
+        return trends
+
+    async def add_trend_details(
+        self,
+        storage: Any,
+        trends: list[dict[str, Any]],
+        time_window_days: int = 7,
+        category: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Attach categories, sources and sample articles to trends
+
+        Args:
+            storage: NewsStorage holding the counters
+            trends: Trends from detect_trends_from_counters()
+            time_window_days: Time window the trends were detected in
+            category: Category filter the trends were detected with
+
+        Returns:
+            The trends, with categories, sources and articles filled in
+        """
+        details = await storage.topic_details(
+            [trend["topic"] for trend in trends],
+            after_date=datetime.now() - timedelta(days=time_window_days),
+            category=category
+        )
+
+        for trend in trends:
+            trend.update(details[trend["topic"]])
+
+        return trends
+
     def _extract_topics(self, articles: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
         """Extract topics from articles using keywords and titles"""
         topics = defaultdict(lambda: {
@@ -254,3 +380,26 @@ class TrendDetectorAgent:
             "days_active": len(daily_counts),
             "matching_articles": matching_articles[:50]  # Sample
         }
+
+    def summarize_timeline(self, timelines: Any, index: int) -> dict[str, Any]:
+        """
+        Get the timeline of one topic from precomputed timelines
+
+        Same result as get_topic_timeline(), without scanning articles.
+
+        Args:
+            timelines: Timelines from NewsStorage.topic_timelines()
+            index: Topic index
+
+        Returns:
+            Timeline data with daily counts
+        """
+        timeline = timelines.timeline(index)
+
+        return {
+            "topic": timelines.topics[index],
+            "timeline": timeline,
+            "total_mentions": int(timelines.totals[index]),
+            "days_active": len(timeline),
+            "matching_articles": timelines.article_sample(index, 50)  # Sample
+        }
@@ -5,6 +5,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from src.agents.news_aggregator.ingestion_scheduler import IngestionScheduler
+from src.agents.news_aggregator.worker_pool import shutdown_executors
 from src.api.routers import (
     co_writer,
     content,
@@ -22,6 +24,7 @@ from src.api.routers import (
     system,
     trends,
 )
+from src.core.core import load_config_with_main
 from src.core.logging import get_logger
 
 logger = get_logger("API")
@@ -35,8 +38,25 @@ async def lifespan(app: FastAPI):
     """
     # Execute on startup
     logger.info("Application startup")
+
+    # Background news ingestion on the configured schedules; a scheduler
+    # failure (e.g. an unwritable job store) must not keep the API down
+    news_scheduler = None
+    try:
+        project_root = Path(__file__).parent.parent.parent
+        scheduler = IngestionScheduler.get_instance(load_config_with_main("news.yaml", project_root))
+        await scheduler.start()
+        news_scheduler = scheduler
+    except Exception as e:
+        logger.error(f"News ingestion scheduler failed to start: {e}")
+
     yield
+
     # Execute on shutdown
+    if news_scheduler is not None:
+        await news_scheduler.stop()
+    # Parsing process pools outlive individual requests
+    shutdown_executors()
     logger.info("Application shutdown")
 
 
@@ -6,6 +6,7 @@ Handles automated content creation including image generation,
 article synthesis, and headline generation
 """
 
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 import traceback
@@ -124,12 +125,7 @@ async def synthesize_article(request: SynthesizeRequest):
 
         # Load articles
         storage = NewsStorage(config)
-        articles = []
-
-        for article_id in request.article_ids:
-            article = await storage.get_article_by_id(article_id)
-            if article:
-                articles.append(article)
+        articles = await storage.get_articles_by_ids(request.article_ids)
 
         if not articles:
             raise HTTPException(status_code=404, detail="No articles found")
@@ -223,9 +219,15 @@ async def generate_daily_digest(
         api_key = llm_config["api_key"]
         base_url = llm_config["base_url"]
 
-        # Load recent articles
+        # Load recent articles from the digest window
         storage = NewsStorage(config)
-        articles = await storage.load_articles(processed=True, limit=500)
+        articles = [
+            article async for article in storage.iter_articles(
+                processed=True,
+                after_date=datetime.now() - timedelta(days=days),
+                limit=500
+            )
+        ]
 
         if not articles:
             return {
@@ -270,12 +272,7 @@ async def batch_generate_images(
 
         # Load articles
         storage = NewsStorage(config)
-        articles = []
-
-        for article_id in article_ids[:max_images]:
-            article = await storage.get_article_by_id(article_id)
-            if article:
-                articles.append(article)
+        articles = await storage.get_articles_by_ids(article_ids[:max_images])
 
         if not articles:
             raise HTTPException(status_code=404, detail="No articles found")
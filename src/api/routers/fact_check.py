@@ -36,6 +36,7 @@ class VerifyRequest(BaseModel):
     preset: str = "quick"  # quick, thorough, or deep
     max_claims: int = 5
     kb_name: Optional[str] = None
+    refresh: bool = False  # Ignore a stored result and check again
 
 
 class VerifyTextRequest(BaseModel):
@@ -45,6 +46,7 @@ class VerifyTextRequest(BaseModel):
     preset: str = "quick"
     max_claims: int = 5
     kb_name: Optional[str] = None
+    refresh: bool = False
 
 
 @router.post("/verify")
@@ -82,7 +84,8 @@ async def verify_article(request: VerifyRequest):
             article=article,
             preset=request.preset,
             max_claims=request.max_claims,
-            kb_name=request.kb_name
+            kb_name=request.kb_name,
+            use_cache=not request.refresh
         )
 
         return {
@@ -133,7 +136,8 @@ async def verify_text(request: VerifyTextRequest):
             article=article,
             preset=request.preset,
             max_claims=request.max_claims,
-            kb_name=request.kb_name
+            kb_name=request.kb_name,
+            use_cache=not request.refresh
         )
 
         return {
@@ -149,26 +153,42 @@ async def verify_text(request: VerifyTextRequest):
 
 @router.get("/history")
 async def get_fact_check_history(
-    limit: int = Query(20, description="Number of results to return"),
-    offset: int = Query(0, description="Number of results to skip")
+    limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    article_id: Optional[str] = Query(None, description="Only checks of this article"),
+    preset: Optional[str] = Query(None, description="Only checks with this preset")
 ):
     """
-    Get history of fact-checked articles
+    Get history of fact-checked articles, newest first
 
     Args:
         limit: Number of results
         offset: Pagination offset
+        article_id: Filter by article
+        preset: Filter by preset
 
     Returns:
         List of fact-check results
     """
     try:
-        # TODO: Implement fact-check history storage
-        # For now, return empty list
+        config = load_config()
+        store = FactCheckPipeline.get_store(config)
+
+        if store is None:
+            return {
+                "success": True,
+                "total": 0,
+                "results": []
+            }
+
+        total, results = store.history(limit=limit, offset=offset, article_id=article_id, preset=preset)
+
         return {
             "success": True,
-            "total": 0,
-            "results": []
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "results": results
         }
 
     except Exception as e:
@@ -229,7 +249,12 @@ async def get_source_credibility(source_name: str = Query(..., description="Sour
 
 
 @router.post("/batch")
-async def verify_batch(article_ids: list[str], preset: str = "quick", kb_name: Optional[str] = None):
+async def verify_batch(
+    article_ids: list[str],
+    preset: str = "quick",
+    kb_name: Optional[str] = None,
+    refresh: bool = False
+):
     """
     Fact-check multiple articles in batch
 
@@ -237,6 +262,7 @@ async def verify_batch(article_ids: list[str], preset: str = "quick", kb_name: O
         article_ids: List of article IDs
         preset: Fact-check preset
         kb_name: Knowledge base name
+        refresh: Ignore stored results and check every article again
 
     Returns:
         List of fact-check results
@@ -252,12 +278,7 @@ async def verify_batch(article_ids: list[str], preset: str = "quick", kb_name: O
 
         # Load articles
         storage = NewsStorage(config)
-        articles = []
-
-        for article_id in article_ids:
-            article = await storage.get_article_by_id(article_id)
-            if article:
-                articles.append(article)
+        articles = await storage.get_articles_by_ids(article_ids)
 
         if not articles:
             raise HTTPException(status_code=404, detail="No articles found")
@@ -270,12 +291,26 @@ async def verify_batch(article_ids: list[str], preset: str = "quick", kb_name: O
             articles=articles,
             preset=preset,
             max_claims_per_article=3,  # Limit for batch processing
-            kb_name=kb_name
+            kb_name=kb_name,
+            use_cache=not refresh
         )
 
+        # Stored results carry the claim cache figures of the run that produced them;
+        # they are counted under "cached", not again as claim reuse of this request
+        checked = [result for result in results if not result.get("cached")]
+
         return {
             "success": True,
             "total": len(results),
+            "partial": sum(1 for result in results if result.get("partial")),
+            "cached": len(results) - len(checked),
+            "claim_cache": {
+                "hits": sum(result.get("claim_cache", {}).get("hits", 0) for result in checked),
+                "misses": sum(result.get("claim_cache", {}).get("misses", 0) for result in checked),
+                "seconds_saved": round(
+                    sum((result.get("claim_cache", {}).get("seconds_saved", 0.0) for result in checked), 0.0), 2
+                )
+            },
             "results": results
         }
 
@@ -30,6 +30,7 @@ from src.knowledge.add_documents import DocumentAdder
 from src.knowledge.initializer import KnowledgeBaseInitializer
 from src.knowledge.manager import KnowledgeBaseManager
 from src.knowledge.progress_tracker import ProgressStage, ProgressTracker
+from src.tools.rag_tool import get_rag_pool
 
 _project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(_project_root))
@@ -269,6 +270,9 @@ async def delete_knowledge_base(kb_name: str):
     """Delete a knowledge base."""
     try:
         manager = get_kb_manager()
+        kb_dir = manager.get_knowledge_base_path(kb_name)
+        # Release pooled RAG instances first, so none writes to the storage while it is removed
+        await get_rag_pool().clear(kb_dir)
         success = manager.delete_knowledge_base(kb_name, confirm=True)
         if not success:
             raise HTTPException(status_code=400, detail="Failed to delete knowledge base")
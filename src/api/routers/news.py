@@ -7,19 +7,18 @@ Handles news aggregation, retrieval, and management endpoints
 
 import asyncio
 from datetime import datetime, timedelta
+import json
 from pathlib import Path
+import re
 from typing import Any, Optional
 import traceback
 
 from fastapi import APIRouter, HTTPException, Query, WebSocket
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from src.agents.news_aggregator import (
-    NewsScraperAgent,
-    ContentParserAgent,
-    DeduplicationAgent,
-    CategoryAgent
-)
+from src.agents.news_aggregator import CategoryAgent
+from src.agents.news_aggregator.ingestion_scheduler import IngestionScheduler
 from src.agents.news_aggregator.news_storage import NewsStorage
 from src.core.core import load_config_with_main
 from src.core.logging import get_logger
@@ -43,6 +42,7 @@ class FetchNewsRequest(BaseModel):
     category: Optional[str] = None
     hours: Optional[int] = 24
     sources: Optional[list[str]] = None
+    incremental: Optional[bool] = None  # None = use configured mode
 
 
 class SearchRequest(BaseModel):
@@ -50,91 +50,155 @@ class SearchRequest(BaseModel):
     query: str
     category: Optional[str] = None
     source: Optional[str] = None
+    language: Optional[str] = None
     limit: int = 20
+    offset: int = 0
 
 
 @router.post("/fetch")
 async def fetch_news(request: FetchNewsRequest):
     """
-    Trigger news aggregation from all configured sources
+    Queue a news aggregation job
+
+    The job runs in the background ingestion scheduler; follow it with
+    GET /jobs/{job_id} or stream its progress from GET /jobs/{job_id}/stream.
 
     Args:
         request: Fetch news request parameters
 
     Returns:
-        Aggregation results with article count
+        Job ID and status
     """
     try:
         config = load_config()
-        logger.info(f"Starting news fetch: category={request.category}, hours={request.hours}")
+        logger.info(f"Queueing news fetch: category={request.category}, hours={request.hours}")
+
+        scheduler = IngestionScheduler.get_instance(config)
+        job = await scheduler.submit({
+            "category": request.category,
+            "hours": None if request.category else request.hours,
+            "incremental": request.incremental,
+            "sources": request.sources
+        })
 
-        # Initialize agents
-        scraper = NewsScraperAgent(config)
-        parser = ContentParserAgent(config)
-        dedup = DeduplicationAgent(config)
-        categorizer = CategoryAgent(config)
-        storage = NewsStorage(config)
+        return {
+            "success": True,
+            "job_id": job["id"],
+            "status": job["status"],
+            "timestamp": datetime.now().isoformat()
+        }
 
-        # Fetch raw articles
-        if request.category:
-            raw_articles = await scraper.fetch_by_category(request.category)
-        elif request.hours:
-            raw_articles = await scraper.fetch_recent(hours=request.hours)
-        else:
-            raw_articles = await scraper.fetch_all_sources()
+    except Exception as e:
+        logger.error(f"Error queueing news fetch: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/jobs")
+async def list_jobs(
+    status: Optional[str] = Query(None, description="Filter by status (queued, running, completed, failed)"),
+    limit: int = Query(50, description="Maximum number of jobs to return")
+):
+    """
+    List ingestion jobs and schedules
+
+    Args:
+        status: Filter by job status
+        limit: Maximum jobs to return
+
+    Returns:
+        Jobs newest first and the configured schedules
+    """
+    try:
+        scheduler = IngestionScheduler.get_instance(load_config())
+
+        return {
+            "success": True,
+            "jobs": scheduler.list_jobs(limit=limit, status=status),
+            "schedules": scheduler.get_schedules()
+        }
 
-        logger.info(f"Fetched {len(raw_articles)} raw articles")
+    except Exception as e:
+        logger.error(f"Error listing jobs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Parse and clean
-        parsed_articles = await parser.parse_batch(raw_articles)
-        logger.info(f"Parsed {len(parsed_articles)} articles")
 
-        # Deduplicate
-        unique_articles = await dedup.deduplicate(parsed_articles)
-        logger.info(f"After deduplication: {len(unique_articles)} unique articles")
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Get an ingestion job with its progress
 
-        # Categorize
-        categorized_articles = await categorizer.categorize_batch(unique_articles)
-        logger.info(f"Categorized {len(categorized_articles)} articles")
+    Args:
+        job_id: Job ID returned by /fetch
 
-        # Save processed articles
-        await storage.save_articles(categorized_articles, processed=True)
+    Returns:
+        Job status, per-stage progress and, once finished, its result
+    """
+    try:
+        scheduler = IngestionScheduler.get_instance(load_config())
+        job = scheduler.get_job(job_id)
 
-        # Get category distribution
-        category_stats = await categorizer.get_category_stats(categorized_articles)
+        if not job:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
         return {
             "success": True,
-            "total_fetched": len(raw_articles),
-            "total_unique": len(unique_articles),
-            "total_saved": len(categorized_articles),
-            "categories": category_stats.get("categories", {}),
-            "timestamp": datetime.now().isoformat()
+            "job": job
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error fetching news: {e}")
-        traceback.print_exc()
+        logger.error(f"Error getting job {job_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/jobs/{job_id}/stream")
+async def stream_job(job_id: str):
+    """
+    Stream an ingestion job's progress as newline-delimited JSON
+
+    Args:
+        job_id: Job ID returned by /fetch
+
+    Returns:
+        NDJSON stream with one job snapshot per progress update, ending
+        once the job has finished
+    """
+    scheduler = IngestionScheduler.get_instance(load_config())
+
+    if scheduler.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    async def generate():
+        async for job in scheduler.watch(job_id):
+            yield json.dumps(job, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/articles")
 async def get_articles(
     category: Optional[str] = Query(None, description="Filter by category"),
     source: Optional[str] = Query(None, description="Filter by source"),
     language: Optional[str] = Query(None, description="Filter by language"),
     limit: int = Query(20, description="Maximum number of articles to return"),
-    offset: int = Query(0, description="Number of articles to skip")
+    offset: int = Query(0, description="Number of articles to skip"),
+    cursor: Optional[str] = Query(None, description="Continuation cursor from a previous page")
 ):
     """
     Get list of articles with optional filtering
 
+    Prefer cursor over offset for deep pagination: a cursor resumes with an
+    index seek, while an offset still walks every skipped row.
+
     Args:
         category: Filter by category
         source: Filter by source
         language: Filter by language
         limit: Maximum articles to return
         offset: Pagination offset
+        cursor: Continuation cursor returned as next_cursor by the previous page
 
     Returns:
         List of articles
@@ -143,35 +207,143 @@ async def get_articles(
         config = load_config()
         storage = NewsStorage(config)
 
-        # Load articles with filters
-        articles = await storage.load_articles(
+        # Filters and pagination are pushed down into the article store
+        if cursor or offset == 0:
+            paginated_articles, next_cursor = await storage.load_page(
+                limit=limit,
+                cursor=cursor,
+                processed=True,
+                category=category,
+                source=source,
+                language=language
+            )
+        else:
+            paginated_articles = await storage.load_articles(
+                processed=True,
+                limit=limit,
+                offset=offset,
+                category=category,
+                source=source,
+                language=language
+            )
+            next_cursor = None
+
+        total = await storage.count_articles(
             processed=True,
-            limit=limit + offset,  # Load extra for offset
             category=category,
-            source=source
+            source=source,
+            language=language
         )
 
-        # Filter by language if specified
-        if language:
-            articles = [a for a in articles if a.get("language") == language]
-
-        # Apply pagination
-        paginated_articles = articles[offset:offset + limit]
-
         return {
             "success": True,
-            "total": len(articles),
+            "total": total,
             "count": len(paginated_articles),
             "offset": offset,
             "limit": limit,
+            "next_cursor": next_cursor,
             "articles": paginated_articles
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting articles: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/articles/stream")
+async def stream_articles(
+    category: Optional[str] = Query(None, description="Filter by category"),
+    source: Optional[str] = Query(None, description="Filter by source"),
+    language: Optional[str] = Query(None, description="Filter by language"),
+    hours: Optional[int] = Query(None, description="Only include articles from the last N hours"),
+    limit: Optional[int] = Query(None, description="Maximum number of articles to stream")
+):
+    """
+    Stream articles newest first as newline-delimited JSON
+
+    Articles are read from storage in small batches while the response is
+    being sent, so the first line goes out before the corpus has been scanned.
+
+    Args:
+        category: Filter by category
+        source: Filter by source
+        language: Filter by language
+        hours: Only include articles from the last N hours
+        limit: Maximum articles to stream
+
+    Returns:
+        NDJSON stream with one article per line
+    """
+    config = load_config()
+    storage = NewsStorage(config)
+    after_date = datetime.now() - timedelta(hours=hours) if hours else None
+
+    async def generate():
+        async for article in storage.iter_articles(
+            processed=True,
+            category=category,
+            source=source,
+            language=language,
+            after_date=after_date,
+            limit=limit
+        ):
+            yield json.dumps(article, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.post("/search")
+async def search_articles(request: SearchRequest):
+    """
+    Search stored articles by text
+
+    Matches title, description, content and keywords through the full-text
+    index, ranked by BM25 relevance, with filters applied in the same query.
+
+    Args:
+        request: Search text, filters and pagination
+
+    Returns:
+        Matching articles, best match first
+    """
+    if not re.search(r"\w", request.query):
+        raise HTTPException(status_code=400, detail="Query must contain at least one word")
+
+    try:
+        config = load_config()
+        storage = NewsStorage(config)
+
+        filters = {
+            "category": request.category,
+            "source": request.source,
+            "language": request.language
+        }
+
+        articles = await storage.search_articles(
+            request.query,
+            limit=request.limit,
+            offset=request.offset,
+            **filters
+        )
+        total = await storage.count_search_results(request.query, **filters)
+
+        return {
+            "success": True,
+            "query": request.query,
+            "total": total,
+            "count": len(articles),
+            "offset": request.offset,
+            "limit": request.limit,
+            "articles": articles
+        }
+
+    except Exception as e:
+        logger.error(f"Error searching articles: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/article/{article_id}")
 async def get_article(article_id: str):
     """
@@ -257,10 +429,15 @@ async def get_sources():
 
 
 @router.get("/stats")
-async def get_stats():
+async def get_stats(
+    repair: bool = Query(False, description="Recompute statistics from scratch")
+):
     """
     Get storage statistics
 
+    Args:
+        repair: Recompute the precomputed statistics from stored articles
+
     Returns:
         Statistics about stored articles
     """
@@ -268,7 +445,10 @@ async def get_stats():
         config = load_config()
         storage = NewsStorage(config)
 
-        stats = await storage.get_stats()
+        if repair:
+            stats = await storage.recompute_stats()
+        else:
+            stats = await storage.get_stats()
 
         return {
             "success": True,
@@ -5,11 +5,16 @@ Trends API Router
 Handles trend detection, sentiment tracking, and novelty evaluation
 """
 
+import asyncio
+from datetime import datetime, timedelta
+import json
 from pathlib import Path
+import time
 from typing import Optional
 import traceback
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from src.agents.trend_analyzer import (
@@ -34,12 +39,24 @@ def load_config():
 logger = get_logger("TrendsAPI")
 
 
+# Maximum topics in one comparison
+MAX_COMPARE_TOPICS = 20
+
+
 class TopicSentimentRequest(BaseModel):
     """Request for topic sentiment analysis"""
     topic: str
     days: int = 30
 
 
+class TopicCompareRequest(BaseModel):
+    """Request for aligned timelines of several topics"""
+    topics: list[str]
+    days: int = 30
+    category: Optional[str] = None
+    include_sentiment: bool = True
+
+
 @router.get("/trending")
 async def get_trending_topics(
     time_window: int = Query(7, description="Time window in days"),
@@ -61,30 +78,25 @@ async def get_trending_topics(
         config = load_config()
         logger.info(f"Getting trending topics (window={time_window} days, category={category})")
 
-        # Load recent articles
+        # Trends come from the topic counters maintained on ingest
         storage = NewsStorage(config)
-        articles = await storage.load_articles(
-            processed=True,
-            limit=1000,
-            category=category
-        )
+        detector = TrendDetectorAgent(config)
+        trends = await detector.detect_trends_from_counters(storage, time_window, category=category)
 
-        if not articles:
+        if not trends:
             return {
                 "success": True,
                 "trends": [],
-                "message": "No articles found"
+                "message": "No trending topics found"
             }
 
-        # Detect trends
-        detector = TrendDetectorAgent(config)
-        trends = await detector.detect_trends(articles, time_window)
+        top_trends = await detector.add_trend_details(storage, trends[:limit], time_window, category=category)
 
         return {
             "success": True,
             "time_window_days": time_window,
             "total_trends": len(trends),
-            "trends": trends[:limit]
+            "trends": top_trends
         }
 
     except Exception as e:
@@ -112,11 +124,11 @@ async def get_topic_timeline(
         config = load_config()
         logger.info(f"Getting timeline for topic: {topic} ({days} days)")
 
-        # Load articles
+        # Daily mentions from the full-text index
         storage = NewsStorage(config)
-        articles = await storage.load_articles(processed=True, limit=5000)
+        timelines = await storage.topic_timelines([topic], datetime.now() - timedelta(days=days))
 
-        if not articles:
+        if not timelines.totals[0]:
             return {
                 "success": True,
                 "topic": topic,
@@ -124,9 +136,8 @@ async def get_topic_timeline(
                 "message": "No articles found"
             }
 
-        # Get timeline
         detector = TrendDetectorAgent(config)
-        timeline_data = await detector.get_topic_timeline(topic, articles, days)
+        timeline_data = detector.summarize_timeline(timelines, 0)
 
         return {
             "success": True,
@@ -139,6 +150,56 @@ async def get_topic_timeline(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/compare")
+async def compare_topics(request: TopicCompareRequest):
+    """
+    Get aligned daily timelines of several topics
+
+    Every topic has one value per day of the window, so the series can be
+    charted together directly.
+
+    Args:
+        request: Topics, time window, optional category and whether to add sentiment
+
+    Returns:
+        Shared list of dates and, per topic, daily counts (and average sentiment)
+    """
+    topics = list(dict.fromkeys(topic.strip() for topic in request.topics if topic.strip()))
+
+    if not topics:
+        raise HTTPException(status_code=400, detail="At least one topic is required")
+    if len(topics) > MAX_COMPARE_TOPICS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_COMPARE_TOPICS} topics can be compared")
+
+    try:
+        config = load_config()
+        logger.info(f"Comparing {len(topics)} topics ({request.days} days)")
+
+        storage = NewsStorage(config)
+        timelines = await storage.topic_timelines(
+            topics,
+            datetime.now() - timedelta(days=request.days),
+            category=request.category
+        )
+
+        if request.include_sentiment:
+            tracker = SentimentTrackerAgent(config)
+            timelines = await tracker.add_timeline_sentiment(storage, timelines)
+
+        return {
+            "success": True,
+            "days": request.days,
+            "category": request.category,
+            "dates": timelines.dates,
+            "topics": [timelines.aligned(i) for i in range(len(topics))]
+        }
+
+    except Exception as e:
+        logger.error(f"Error comparing topics: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/sentiment/topic")
 async def analyze_topic_sentiment(request: TopicSentimentRequest):
     """
@@ -154,11 +215,11 @@ async def analyze_topic_sentiment(request: TopicSentimentRequest):
         config = load_config()
         logger.info(f"Analyzing sentiment for topic: {request.topic} ({request.days} days)")
 
-        # Load articles
+        # Daily mentions from the full-text index
         storage = NewsStorage(config)
-        articles = await storage.load_articles(processed=True, limit=5000)
+        timelines = await storage.topic_timelines([request.topic], datetime.now() - timedelta(days=request.days))
 
-        if not articles:
+        if not timelines.totals[0]:
             return {
                 "success": True,
                 "message": "No articles found"
@@ -166,11 +227,8 @@ async def analyze_topic_sentiment(request: TopicSentimentRequest):
 
         # Track sentiment
         tracker = SentimentTrackerAgent(config)
-        sentiment_data = await tracker.track_topic_sentiment(
-            request.topic,
-            articles,
-            request.days
-        )
+        timelines = await tracker.add_timeline_sentiment(storage, timelines)
+        sentiment_data = tracker.summarize_sentiment(timelines, 0)
 
         return {
             "success": True,
@@ -218,7 +276,7 @@ async def get_articles_with_sentiment(
 
         # Analyze sentiment
         tracker = SentimentTrackerAgent(config)
-        articles_with_sentiment = await tracker.batch_analyze(articles)
+        articles_with_sentiment = await tracker.batch_analyze(articles, storage)
 
         return {
             "success": True,
@@ -257,8 +315,14 @@ async def evaluate_article_novelty(
         if not article:
             raise HTTPException(status_code=404, detail=f"Article {article_id} not found")
 
-        # Load historical articles
-        historical = await storage.load_articles(processed=True, limit=1000)
+        # Load historical articles within the lookback window
+        historical = [
+            hist async for hist in storage.iter_articles(
+                processed=True,
+                after_date=datetime.now() - timedelta(days=lookback_days),
+                limit=1000
+            )
+        ]
 
         # Evaluate novelty
         evaluator = NoveltyEvaluatorAgent(config)
@@ -281,7 +345,7 @@ async def evaluate_article_novelty(
 
 @router.get("/novelty/novel-articles")
 async def get_novel_articles(
-    min_novelty: float = Query(0.6, description="Minimum novelty score"),
+    min_novelty: Optional[float] = Query(None, description="Minimum novelty score (default novelty_threshold)"),
     lookback_days: int = Query(7, description="Lookback window"),
     category: Optional[str] = Query(None, description="Filter by category"),
     limit: int = Query(20, description="Maximum articles")
@@ -301,34 +365,61 @@ async def get_novel_articles(
     try:
         config = load_config()
 
-        # Load articles
-        storage = NewsStorage(config)
-        articles = await storage.load_articles(
-            processed=True,
-            limit=500,
-            category=category
-        )
+        evaluator = NoveltyEvaluatorAgent(config)
+        if min_novelty is None:
+            min_novelty = evaluator.novelty_threshold
 
-        if not articles:
+        # Articles of the window, plus the window before it as earlier coverage,
+        # streamed oldest first through the novelty index
+        storage = NewsStorage(config)
+        since = datetime.now() - timedelta(days=lookback_days)
+        since_ts = since.timestamp()
+
+        async def batches(batch_size: int = 200):
+            batch = []
+            async for article in storage.iter_articles(
+                processed=True,
+                category=category,
+                after_date=since - timedelta(days=lookback_days),
+                batch_size=batch_size,
+                oldest_first=True
+            ):
+                batch.append(article)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        scanned = 0
+        total_novel = 0
+        novel_articles = []
+
+        async for article in evaluator.evaluate_stream(batches(), lookback_days):
+            scanned += 1
+            # Earlier articles only serve as previous coverage
+            published_ts = evaluator._timestamp(article)
+            if published_ts is None or published_ts < since_ts:
+                continue
+            if article["novelty"].get("novelty_score", 0) < min_novelty:
+                continue
+
+            total_novel += 1
+            if len(novel_articles) < limit:
+                novel_articles.append(article)
+
+        if not scanned:
             return {
                 "success": True,
                 "articles": [],
                 "message": "No articles found"
             }
 
-        # Find novel articles
-        evaluator = NoveltyEvaluatorAgent(config)
-        novel_articles = await evaluator.find_novel_articles(
-            articles,
-            min_novelty,
-            lookback_days
-        )
-
         return {
             "success": True,
-            "total_novel": len(novel_articles),
+            "total_novel": total_novel,
             "min_novelty": min_novelty,
-            "articles": novel_articles[:limit]
+            "articles": novel_articles
         }
 
     except Exception as e:
@@ -337,6 +428,62 @@ async def get_novel_articles(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/novelty/stream")
+async def stream_novel_articles(
+    min_novelty: float = Query(0.0, description="Minimum novelty score"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    duration: int = Query(300, description="Seconds to keep the stream open")
+):
+    """
+    Stream newly ingested articles with their novelty as newline-delimited JSON
+
+    Articles are scored against the sliding window of recent coverage when
+    they are ingested; the stream follows the store and sends each new
+    article as soon as it has been saved.
+
+    Args:
+        min_novelty: Only send articles at least this novel
+        category: Optional category filter
+        duration: Seconds to keep the stream open
+
+    Returns:
+        NDJSON stream with one scored article per line
+    """
+    config = load_config()
+    storage = NewsStorage(config)
+    evaluator = NoveltyEvaluatorAgent(config)
+    poll_interval = config.get("trend_analysis", {}).get("novelty", {}).get("stream_poll_seconds", 5)
+
+    async def generate():
+        position = await storage.get_insert_position()
+        deadline = time.monotonic() + duration
+
+        while time.monotonic() < deadline:
+            articles, position = await storage.load_inserted_since(position, category=category)
+
+            # Articles ingested without novelty scoring are scored here
+            unscored = [article for article in articles if not isinstance(article.get("novelty"), dict)]
+            if unscored:
+                await evaluator.score_articles(unscored, storage)
+
+            for article in articles:
+                if article["novelty"].get("novelty_score", 0) < min_novelty:
+                    continue
+                yield json.dumps({
+                    "id": article.get("id"),
+                    "title": article.get("title"),
+                    "category": article.get("category"),
+                    "source_name": article.get("source_name"),
+                    "published_at": article.get("published_at"),
+                    "novelty": article["novelty"]
+                }, ensure_ascii=False) + "\n"
+
+            if not articles:
+                await asyncio.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/stats")
 async def get_trend_stats(days: int = Query(7, description="Time window in days")):
     """
@@ -351,23 +498,32 @@ async def get_trend_stats(days: int = Query(7, description="Time window in days"
     try:
         config = load_config()
 
-        # Load articles
+        # Count articles within the time window
         storage = NewsStorage(config)
-        articles = await storage.load_articles(processed=True, limit=2000)
+        after_date = datetime.now() - timedelta(days=days)
+        total_articles = await storage.count_articles(processed=True, after_date=after_date)
 
-        if not articles:
+        if not total_articles:
             return {
                 "success": True,
                 "message": "No articles found"
             }
 
-        # Get trends
+        # Get trends from the topic counters
         detector = TrendDetectorAgent(config)
-        trends = await detector.detect_trends(articles, days)
-
-        # Get average sentiment
+        trends = await detector.detect_trends_from_counters(storage, days)
+        top_trends = await detector.add_trend_details(storage, trends[:5], days)
+
+        # Get average sentiment over a sample of the newest articles
+        sample = [
+            article async for article in storage.iter_articles(
+                processed=True,
+                after_date=after_date,
+                limit=100
+            )
+        ]
         tracker = SentimentTrackerAgent(config)
-        articles_with_sentiment = await tracker.batch_analyze(articles[:100])  # Sample
+        articles_with_sentiment = await tracker.batch_analyze(sample, storage)
 
         avg_sentiment = {
             "positive": 0.0,
@@ -388,9 +544,9 @@ async def get_trend_stats(days: int = Query(7, description="Time window in days"
         return {
             "success": True,
             "time_window_days": days,
-            "total_articles": len(articles),
+            "total_articles": total_articles,
             "trending_topics": len(trends),
-            "top_trends": trends[:5],
+            "top_trends": top_trends,
             "average_sentiment": avg_sentiment
         }
 
@@ -1,11 +1,20 @@
 #!/usr/bin/env python
 """
 RAG Query Tool - Wrapper for RAG query functionality
+
+Initialized RAG instances are kept in a process-wide pool keyed by knowledge
+base, storage directory and model configuration, so repeated queries against
+the same knowledge base skip loading its graph, vector and KV storage.
 """
 
 import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import inspect
+import os
 from pathlib import Path
 import sys
+import threading
 
 # Add parent directory to path (insert at front to prioritize project modules)
 project_root = Path(__file__).parent.parent.parent
@@ -20,13 +29,213 @@ from lightrag.utils import EmbeddingFunc
 from raganything import RAGAnything, RAGAnythingConfig
 
 from src.core.core import get_embedding_config, get_llm_config
-from src.core.logging import LightRAGLogContext
+from src.core.logging import LightRAGLogContext, get_logger
 from src.knowledge.manager import KnowledgeBaseManager
 
 # Load environment variables
 load_dotenv(project_root / "DeepTutor.env", override=False)
 load_dotenv(project_root / ".env", override=False)
 
+logger = get_logger("RAGTool")
+
+# Initialized RAG instances kept when tools.rag_tool.pool_size is not configured
+DEFAULT_POOL_SIZE = 4
+
+
+def _storage_stamp(working_dir: str) -> tuple:
+    """
+    Fingerprint the storage files of a knowledge base
+
+    Args:
+        working_dir: RAG storage directory
+
+    Returns:
+        Sorted (name, mtime, size) of the storage files; changes when the KB is updated
+    """
+    try:
+        with os.scandir(working_dir) as entries:
+            return tuple(
+                sorted(
+                    (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                    for entry in entries
+                    # Queries themselves write the LLM response cache
+                    if entry.is_file() and "llm_response_cache" not in entry.name
+                )
+            )
+    except OSError:
+        return ()
+
+
+class _PooledRAG:
+    """A pooled RAG instance with its usage bookkeeping"""
+
+    def __init__(self, stamp: tuple, loop: asyncio.AbstractEventLoop, task: asyncio.Task):
+        self.stamp = stamp
+        self.loop = loop
+        self.task = task  # Builds and initializes the instance
+        self.active = 0  # Queries currently using the instance
+        self.retired = False  # Removed from the pool; closed once no query uses it
+
+
+class RAGInstancePool:
+    """
+    Process-wide LRU pool of initialized RAGAnything instances
+
+    The first query for a key creates and initializes the instance; queries
+    arriving meanwhile wait for the same initialization. Instances are
+    replaced when their storage files change (documents added, KB rebuilt)
+    or when used from another event loop, and the least recently used one is
+    dropped beyond max_size. Dropped instances are finalized once the last
+    query using them finishes.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE):
+        """
+        Initialize pool
+
+        Args:
+            max_size: Maximum instances kept
+        """
+        self.max_size = max(1, max_size)
+        self._entries: OrderedDict[tuple, _PooledRAG] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @asynccontextmanager
+    async def acquire(self, key: tuple, working_dir: str, build):
+        """
+        Use the pooled instance of a key, creating it if needed
+
+        Args:
+            key: Pool key (knowledge base, storage directory, model configuration)
+            working_dir: RAG storage directory of the knowledge base
+            build: Coroutine function returning a new initialized instance
+
+        Yields:
+            Initialized RAGAnything instance
+        """
+        loop = asyncio.get_running_loop()
+        stamp = _storage_stamp(working_dir)
+        dropped = []
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and (entry.loop is not loop or entry.stamp != stamp):
+                dropped.append(self._entries.pop(key))
+                entry = None
+
+            if entry is None:
+                entry = _PooledRAG(stamp, loop, loop.create_task(build()))
+                self._entries[key] = entry
+                while len(self._entries) > self.max_size:
+                    dropped.append(self._entries.popitem(last=False)[1])
+            else:
+                self._entries.move_to_end(key)
+
+            entry.active += 1
+
+        for old in dropped:
+            await self._retire(old)
+
+        try:
+            try:
+                rag = await asyncio.shield(entry.task)
+            except Exception:
+                # Failed initialization is not kept; the next query retries
+                with self._lock:
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+                raise
+
+            yield rag
+        finally:
+            with self._lock:
+                entry.active -= 1
+                close = entry.retired and entry.active == 0
+
+            if close:
+                await self._close(entry)
+
+    async def _retire(self, entry: _PooledRAG) -> None:
+        """Close a dropped instance now if unused, else when its last query ends"""
+        with self._lock:
+            entry.retired = True
+            close = entry.active == 0
+
+        if close:
+            await self._close(entry)
+
+    async def _close(self, entry: _PooledRAG) -> None:
+        """Finalize the storages of an instance (on the loop it was created in)"""
+        if entry.loop is not asyncio.get_running_loop():
+            return
+
+        try:
+            rag = await entry.task
+            finalize = getattr(rag, "finalize_storages", None)
+            if finalize is not None:
+                result = finalize()
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as e:
+            logger.debug(f"Failed to finalize pooled RAG instance: {e}")
+
+    async def clear(self, kb_dir: str | Path | None = None) -> int:
+        """
+        Drop pooled instances
+
+        Args:
+            kb_dir: Only instances whose storage is inside this knowledge
+                base directory (default: all)
+
+        Returns:
+            Number of instances dropped
+        """
+        kb_dir = Path(kb_dir).resolve() if kb_dir is not None else None
+
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if kb_dir is None or Path(key[1]).resolve().is_relative_to(kb_dir)
+            ]
+            dropped = [self._entries.pop(key) for key in keys]
+
+        for entry in dropped:
+            await self._retire(entry)
+
+        return len(dropped)
+
+
+_rag_pool: RAGInstancePool | None = None
+
+
+def get_rag_pool() -> RAGInstancePool:
+    """
+    Get the process-wide RAG instance pool
+
+    Returns:
+        RAGInstancePool sized by tools.rag_tool.pool_size in main.yaml
+    """
+    global _rag_pool
+
+    if _rag_pool is None:
+        pool_size = DEFAULT_POOL_SIZE
+        try:
+            from src.core.core import load_config_with_main
+
+            config = load_config_with_main("main.yaml", project_root)
+            pool_size = config.get("tools", {}).get("rag_tool", {}).get("pool_size", pool_size)
+        except Exception:
+            pass
+
+        _rag_pool = RAGInstancePool(pool_size)
+
+    return _rag_pool
+
 
 async def rag_search(
     query: str,
@@ -123,103 +332,116 @@ async def rag_search(
     except Exception as e:
         raise Exception(f"Error: Unable to access knowledge base - {e!s}")
 
-    # Define LLM function
-    def llm_model_func(prompt, system_prompt=None, history_messages=[], **kwargs):
-        return openai_complete_if_cache(
-            llm_model,
-            prompt,
-            system_prompt=system_prompt,
-            history_messages=history_messages,
-            api_key=llm_api_key,
-            base_url=llm_base_url,
-            **kwargs,
-        )
+    # Instances are shared by every query with the same storage and model configuration
+    pool_key = (
+        kb_name,
+        working_dir,
+        embedding_model,
+        embedding_base_url,
+        embedding_api_key,
+        embedding_dim,
+        embedding_max_tokens,
+        llm_model,
+        llm_base_url,
+        llm_api_key,
+    )
 
-    def vision_model_func(
-        prompt,
-        system_prompt=None,
-        history_messages=[],
-        image_data=None,
-        messages=None,
-        **kwargs,
-    ):
-        # If messages format is provided (for multimodal VLM enhanced query), use it directly
-        if messages:
-            # Remove 'messages' and other message-related params from kwargs to avoid duplicate parameter
-            clean_kwargs = {
-                k: v
-                for k, v in kwargs.items()
-                if k not in ["messages", "prompt", "system_prompt", "history_messages"]
-            }
-            return openai_complete_if_cache(
-                llm_model,
-                prompt="",  # Empty prompt when using messages
-                system_prompt=None,
-                history_messages=[],
-                messages=messages,
-                api_key=llm_api_key,
-                base_url=llm_base_url,
-                **clean_kwargs,
-            )
-        # Traditional single image format
-        if image_data:
-            # Remove message-related params from kwargs to avoid duplicate parameter
-            clean_kwargs = {
-                k: v
-                for k, v in kwargs.items()
-                if k not in ["messages", "prompt", "system_prompt", "history_messages"]
-            }
+    async def build():
+        # Define LLM function
+        def llm_model_func(prompt, system_prompt=None, history_messages=[], **kwargs):
             return openai_complete_if_cache(
                 llm_model,
-                prompt="",  # Empty prompt when using messages
-                system_prompt=None,
-                history_messages=[],
-                messages=[
-                    {"role": "system", "content": system_prompt} if system_prompt else None,
-                    (
-                        {
-                            "role": "user",
-                            "content": [
-                                {"type": "text", "text": prompt},
-                                {
-                                    "type": "image_url",
-                                    "image_url": {"url": f"data:image/jpeg;base64,{image_data}"},
-                                },
-                            ],
-                        }
-                        if image_data
-                        else {"role": "user", "content": prompt}
-                    ),
-                ],
+                prompt,
+                system_prompt=system_prompt,
+                history_messages=history_messages,
                 api_key=llm_api_key,
                 base_url=llm_base_url,
-                **clean_kwargs,
+                **kwargs,
             )
-        # Pure text format
-        return llm_model_func(prompt, system_prompt, history_messages, **kwargs)
-
-    # Define embedding function
-    embedding_func = EmbeddingFunc(
-        embedding_dim=embedding_dim,
-        max_token_size=embedding_max_tokens,
-        func=lambda texts: openai_embed(
-            texts,
-            model=embedding_model,
-            api_key=embedding_api_key,
-            base_url=embedding_base_url,
-        ),
-    )
 
-    # Create RAG instance
-    config = RAGAnythingConfig(
-        working_dir=working_dir,
-        enable_image_processing=True,
-        enable_table_processing=True,
-        enable_equation_processing=True,
-    )
+        def vision_model_func(
+            prompt,
+            system_prompt=None,
+            history_messages=[],
+            image_data=None,
+            messages=None,
+            **kwargs,
+        ):
+            # If messages format is provided (for multimodal VLM enhanced query), use it directly
+            if messages:
+                # Remove 'messages' and other message-related params from kwargs to avoid duplicate parameter
+                clean_kwargs = {
+                    k: v
+                    for k, v in kwargs.items()
+                    if k not in ["messages", "prompt", "system_prompt", "history_messages"]
+                }
+                return openai_complete_if_cache(
+                    llm_model,
+                    prompt="",  # Empty prompt when using messages
+                    system_prompt=None,
+                    history_messages=[],
+                    messages=messages,
+                    api_key=llm_api_key,
+                    base_url=llm_base_url,
+                    **clean_kwargs,
+                )
+            # Traditional single image format
+            if image_data:
+                # Remove message-related params from kwargs to avoid duplicate parameter
+                clean_kwargs = {
+                    k: v
+                    for k, v in kwargs.items()
+                    if k not in ["messages", "prompt", "system_prompt", "history_messages"]
+                }
+                return openai_complete_if_cache(
+                    llm_model,
+                    prompt="",  # Empty prompt when using messages
+                    system_prompt=None,
+                    history_messages=[],
+                    messages=[
+                        {"role": "system", "content": system_prompt} if system_prompt else None,
+                        (
+                            {
+                                "role": "user",
+                                "content": [
+                                    {"type": "text", "text": prompt},
+                                    {
+                                        "type": "image_url",
+                                        "image_url": {"url": f"data:image/jpeg;base64,{image_data}"},
+                                    },
+                                ],
+                            }
+                            if image_data
+                            else {"role": "user", "content": prompt}
+                        ),
+                    ],
+                    api_key=llm_api_key,
+                    base_url=llm_base_url,
+                    **clean_kwargs,
+                )
+            # Pure text format
+            return llm_model_func(prompt, system_prompt, history_messages, **kwargs)
+
+        # Define embedding function
+        embedding_func = EmbeddingFunc(
+            embedding_dim=embedding_dim,
+            max_token_size=embedding_max_tokens,
+            func=lambda texts: openai_embed(
+                texts,
+                model=embedding_model,
+                api_key=embedding_api_key,
+                base_url=embedding_base_url,
+            ),
+        )
+
+        # Create RAG instance
+        config = RAGAnythingConfig(
+            working_dir=working_dir,
+            enable_image_processing=True,
+            enable_table_processing=True,
+            enable_equation_processing=True,
+        )
 
-    # Use log forwarding context manager
-    with LightRAGLogContext(scene="rag_tool"):
         rag = RAGAnything(
             config=config,
             llm_model_func=llm_model_func,
@@ -229,15 +451,20 @@ async def rag_search(
 
         # Ensure initialization
         await rag._ensure_lightrag_initialized()
+        logger.debug(f"Initialized RAG instance for {working_dir}")
+        return rag
 
-        # Execute query
-        try:
-            answer = await rag.aquery(query, mode=mode, **kwargs)
-            answer_str = answer if isinstance(answer, str) else str(answer)
+    # Use log forwarding context manager
+    with LightRAGLogContext(scene="rag_tool"):
+        async with get_rag_pool().acquire(pool_key, working_dir, build) as rag:
+            # Execute query
+            try:
+                answer = await rag.aquery(query, mode=mode, **kwargs)
+                answer_str = answer if isinstance(answer, str) else str(answer)
 
-            return {"query": query, "answer": answer_str, "mode": mode}
-        except Exception as e:
-            raise Exception(f"Query failed: {e!s}")
+                return {"query": query, "answer": answer_str, "mode": mode}
+            except Exception as e:
+                raise Exception(f"Query failed: {e!s}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+"""
+Claim normalization and the reuse rules of the claim cache
+"""
+
+import pytest
+
+from src.agents.fact_checker.claim_cache import ClaimCache, claim_anchors, content_words, normalize_claim
+from src.agents.fact_checker.fact_check_store import FactCheckStore
+
+VERIFICATION = {"verdict": "true", "confidence": 0.9}
+
+# (verified claim, new claim, reused)
+REUSE_CASES = [
+    ("42% of voters back the measure", "24% of voters back the measure", False),
+    ("Prices rose by 3% last year", "Prices fell by 3% last year", False),
+    ("The vaccine is effective against the variant", "The vaccine is not effective against the variant", False),
+    ("The budget has a $5 billion surplus", "The budget has a -$5 billion surplus", False),
+    ("The company hired 1,000 workers", "The company hired 1000 workers", True),
+]
+
+
+def make_cache(tmp_path) -> ClaimCache:
+    return ClaimCache(FactCheckStore(tmp_path / "fact_checks.db"))
+
+
+@pytest.mark.parametrize("verified,claim,reused", REUSE_CASES)
+def test_anchors_and_content_words_decide_reuse(verified, claim, reused):
+    verified, claim = normalize_claim(verified), normalize_claim(claim)
+
+    same = claim_anchors(verified) == claim_anchors(claim) and content_words(verified) == content_words(claim)
+    assert same is reused
+
+
+@pytest.mark.parametrize("verified,claim,reused", REUSE_CASES)
+def test_cache_reuses_only_matching_claims(tmp_path, verified, claim, reused):
+    cache = make_cache(tmp_path)
+    cache.add(verified, "standard", None, VERIFICATION, [], 0.8, 1.5)
+
+    match = cache.lookup(claim, "standard", None)
+
+    assert (match is not None) is reused
+    if reused:
+        assert match["verification"] == VERIFICATION
+
+
+@pytest.mark.parametrize("text,normalized,anchors", [
+    ("42% of voters", "42% of voters", "42%"),
+    ("42 percent of voters", "42% of voters", "42%"),
+    ("1,000", "1000", "1000"),
+    ("-$5 billion", "$-5 billion", "$-5 billion"),
+    ("$-5 billion", "$-5 billion", "$-5 billion"),
+    ("$ 5 billion", "$5 billion", "$5 billion"),
+    ("not effective", "not effective", "not"),
+    ("not ineffective", "not ineffective", "not"),
+    ("it isn't never true", "it isn't never true", ""),
+    ("COVID-19 cases", "covid 19 cases", "19"),
+])
+def test_normalize_claim_and_anchors(text, normalized, anchors):
+    assert normalize_claim(text) == normalized
+    assert claim_anchors(normalize_claim(text)) == anchors
+
+
+def test_claims_of_other_presets_are_not_reused(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.add("The company hired 1,000 workers", "standard", None, VERIFICATION, [], 0.8, 1.5)
+
+    assert cache.lookup("The company hired 1000 workers", "quick", None) is None
+    assert cache.lookup("The company hired 1000 workers", "standard", "science") is None
@@ -0,0 +1,132 @@
+"""
+SQLite article store: paging, rolling counts, search and topic counters
+"""
+
+from datetime import datetime, timezone
+
+from src.agents.news_aggregator.article_store import ArticleStore, match_expression
+
+# 2026-10-16 12:00 UTC
+NOON_TS = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+def article(article_id: str, hour: int, **fields) -> dict:
+    return {
+        "id": article_id,
+        "title": f"Story {article_id}",
+        "description": f"Description of story {article_id}",
+        "category": "technology",
+        "source_name": "Example",
+        "language": "en",
+        "published_at": f"2026-10-16T{hour:02d}:00:00+00:00",
+        "keywords": ["chips"],
+        **fields
+    }
+
+
+def scan_all(store: ArticleStore, page_size: int, **filters) -> list[list[str]]:
+    """IDs of every keyset page"""
+    pages, after_key = [], None
+    while True:
+        page = store.scan(after_key=after_key, limit=page_size, **filters)
+        if not page:
+            return pages
+        pages.append([stored["id"] for _, stored in page])
+        after_key = page[-1][0]
+
+
+def test_count_filters(tmp_path):
+    store = ArticleStore(tmp_path / "articles.db")
+    store.upsert([
+        article("a", 8),
+        article("b", 9, category="business"),
+        article("c", 10, language="de"),
+    ], processed=True)
+    store.upsert([article("raw", 11)], processed=False)
+
+    assert store.count() == 3
+    assert store.count(processed=False) == 1
+    assert store.count(category="business") == 1
+    assert store.count(language="de") == 1
+    assert store.count(after_date=datetime(2026, 10, 16, 8, 30, tzinfo=timezone.utc)) == 2
+
+
+def test_keyset_pages_do_not_overlap(tmp_path):
+    store = ArticleStore(tmp_path / "articles.db")
+    # Two articles share a publish time, one has none
+    store.upsert([
+        article("a", 8), article("b", 9), article("c", 9), article("d", 10),
+        article("undated", 0, published_at=None),
+    ], processed=True)
+
+    assert scan_all(store, 2) == [["d", "c"], ["b", "a"], ["undated"]]
+    assert scan_all(store, 2, oldest_first=True) == [["a", "b"], ["c", "d"], ["undated"]]
+    assert scan_all(store, 3, category="technology") == [["d", "c", "b"], ["a", "undated"]]
+
+
+def test_saving_again_does_not_double_count(tmp_path):
+    store = ArticleStore(tmp_path / "articles.db")
+    store.upsert([article("a", 8), article("b", 9)], processed=True)
+    store.upsert([article("a", 8), article("b", 9, category="business")], processed=True)
+
+    counts = store.get_counts()
+    assert counts["category"] == {"technology": 1, "business": 1}
+    assert counts["source"] == {"Example": 2}
+    assert counts["language"] == {"en": 2}
+
+    store.recompute_stats()
+    assert store.get_counts() == counts
+
+
+def test_search_and_topics_follow_updates(tmp_path):
+    store = ArticleStore(tmp_path / "articles.db")
+    store.upsert([article("a", 12, title="Chip makers expand", keywords=["Chips", "factories"])], processed=True)
+
+    results = store.search(match_expression("chip makers"))
+    assert [found["id"] for found, _ in results] == ["a"]
+    assert store.search_count(match_expression("factories")) == 1
+
+    hour = int(NOON_TS // 3600)
+    topic_ids = store.topic_ids(["chips", "factories"])
+    assert sorted(store.topic_counts("h", hour, hour)) == sorted((topic_id, hour, 1) for topic_id in topic_ids.values())
+
+    # Replacing the article moves both the search row and the topic counters
+    store.upsert([article("a", 12, title="Harbor reopens", keywords=["ports"])], processed=True)
+
+    assert store.search_count(match_expression("chip makers")) == 0
+    assert store.search_count(match_expression("harbor")) == 1
+    assert store.topic_counts("h", hour, hour) == [(store.topic_ids(["ports"])["ports"], hour, 1)]
+
+
+def test_rfc822_dates_are_backfilled_on_open(tmp_path):
+    store = ArticleStore(tmp_path / "articles.db")
+    store.upsert([article("rss", 12, published_at="Fri, 16 Oct 2026 12:00:00 GMT")], processed=True)
+
+    # A store written before RFC 822 dates were parsed
+    with store.conn:
+        store.conn.execute("UPDATE articles SET published_ts = NULL")
+        store.conn.execute("DELETE FROM topic_counts")
+        store.conn.execute("DELETE FROM store_meta WHERE key = 'rfc822_dates_backfilled'")
+    store.close()
+
+    store = ArticleStore(tmp_path / "articles.db")
+    after = datetime(2026, 10, 16, 11, 0, tzinfo=timezone.utc)
+
+    assert store.count(after_date=after) == 1
+    assert store.scan(limit=1)[0][0] == (NOON_TS, "rss")
+    hour = int(NOON_TS // 3600)
+    assert store.topic_counts("h", hour, hour) == [(store.topic_ids(["chips"])["chips"], hour, 1)]
+
+
+def test_reopened_store_keeps_articles(tmp_path):
+    store = ArticleStore(tmp_path / "articles.db")
+    store.upsert([article("a", 8), article("b", 9, keywords=["harbor"])], processed=True)
+    store.close()
+
+    store = ArticleStore(tmp_path / "articles.db")
+
+    assert store.count() == 2
+    assert store.get("b")["title"] == "Story b"
+    assert store.get_counts()["category"] == {"technology": 2}
+    assert store.search_count(match_expression("harbor")) == 1
+    assert store.get_date_range() == ("2026-10-16T08:00:00+00:00", "2026-10-16T09:00:00+00:00")
@@ -0,0 +1,131 @@
+"""
+Embedding deduplication with the local hashing embedder
+"""
+
+import numpy as np
+import pytest
+
+from src.agents.news_aggregator.deduplication_agent import DeduplicationAgent, DedupState
+from src.agents.news_aggregator.embeddings import EmbeddingCache, HashingEmbedder, greedy_unique
+
+
+def make_agent(tmp_path) -> DeduplicationAgent:
+    return DeduplicationAgent({
+        "news": {
+            "deduplication": {
+                "enabled": True,
+                "method": "embedding",
+                "embedding": {
+                    "provider": "local",
+                    "similarity_threshold": 0.9,
+                    "cache": str(tmp_path / "embeddings.db")
+                }
+            }
+        }
+    })
+
+
+def article(article_id: str, title: str, description: str) -> dict:
+    return {"id": article_id, "title": title, "description": description}
+
+
+RATE_HIKE = article(
+    "a1",
+    "Central bank raises interest rates by a quarter point",
+    "The central bank raised its benchmark rate by a quarter point on Wednesday, citing inflation."
+)
+RATE_HIKE_COPY = article(
+    "a2",
+    "Central bank raises interest rates by a quarter point",
+    "The central bank raised its benchmark rate by a quarter point on Wednesday, citing inflation!"
+)
+PHONE_LAUNCH = article(
+    "a3",
+    "New smartphone launches with a dedicated camera button",
+    "The phone maker unveiled its latest handset on Monday with a faster chip."
+)
+STORM = article(
+    "a4",
+    "Hurricane makes landfall on the gulf coast",
+    "The storm came ashore late Thursday as a category four hurricane."
+)
+
+
+@pytest.fixture
+def embed_calls(monkeypatch) -> list[int]:
+    """Record how many texts every HashingEmbedder.embed call receives"""
+    calls = []
+    original_embed = HashingEmbedder.embed
+
+    async def counting_embed(self, texts):
+        calls.append(len(texts))
+        return await original_embed(self, texts)
+
+    monkeypatch.setattr(HashingEmbedder, "embed", counting_embed)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_hashing_embedder_is_deterministic():
+    embedder = HashingEmbedder(dim=64)
+    first = await embedder.embed(["Same text", "Other text"])
+    second = await embedder.embed(["Same text", "Other text"])
+
+    assert first.shape == (2, 64)
+    np.testing.assert_array_equal(first, second)
+    np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0, rtol=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_greedy_unique_drops_later_near_duplicates():
+    vectors = await HashingEmbedder().embed([
+        "Central bank raises rates",
+        "Hurricane makes landfall",
+        "Central bank raises rates",
+    ])
+
+    assert greedy_unique(vectors, 0.9) == [0, 1]
+    assert greedy_unique(vectors, 0.9, block_size=1) == [0, 1]
+    assert greedy_unique(vectors[2:], 0.9, previous=vectors[:1]) == []
+
+
+@pytest.mark.asyncio
+async def test_duplicates_within_a_batch_are_removed(tmp_path, embed_calls):
+    agent = make_agent(tmp_path)
+
+    unique = await agent.deduplicate([RATE_HIKE, PHONE_LAUNCH, RATE_HIKE_COPY])
+
+    assert [a["id"] for a in unique] == ["a1", "a3"]
+    assert embed_calls == [3]
+
+
+@pytest.mark.asyncio
+async def test_duplicates_of_earlier_chunks_are_removed(tmp_path, embed_calls):
+    agent = make_agent(tmp_path)
+    state = DedupState()
+
+    first = await agent.deduplicate([RATE_HIKE, PHONE_LAUNCH], state=state)
+    assert [a["id"] for a in first] == ["a1", "a3"]
+    assert state.vectors.shape[0] == 2
+
+    second = await agent.deduplicate([RATE_HIKE_COPY, STORM], state=state)
+    assert [a["id"] for a in second] == ["a4"]
+    assert state.vectors.shape[0] == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_vectors_are_not_embedded_again(tmp_path, embed_calls):
+    agent = make_agent(tmp_path)
+    vectors = await agent.embed_articles([RATE_HIKE, PHONE_LAUNCH])
+    assert embed_calls == [2]
+
+    # A new agent sharing the cache file only embeds the article it has not seen
+    agent = make_agent(tmp_path)
+    again = await agent.embed_articles([PHONE_LAUNCH, STORM, RATE_HIKE])
+    assert embed_calls == [2, 1]
+    np.testing.assert_array_equal(again[0], vectors[1])
+    np.testing.assert_array_equal(again[2], vectors[0])
+
+    model = HashingEmbedder().model_name
+    cached = EmbeddingCache(tmp_path / "embeddings.db").get_many(["a1", "a3", "a4"], model)
+    assert set(cached) == {"a1", "a3", "a4"}
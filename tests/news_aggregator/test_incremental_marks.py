@@ -0,0 +1,164 @@
+"""
+Per-stream high-water marks of incremental fetching
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+
+from src.agents.news_aggregator import news_scraper_agent
+from src.agents.news_aggregator.ingestion_pipeline import IngestionPipeline
+from src.agents.news_aggregator.news_scraper_agent import NewsScraperAgent
+
+STREAM = "newsapi:technology:us"
+NOW = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+
+
+def make_config(tmp_path) -> dict:
+    return {
+        "news": {
+            "storage": {
+                "base_dir": str(tmp_path),
+                "raw_articles_dir": str(tmp_path / "raw"),
+                "processed_articles_dir": str(tmp_path / "processed"),
+                "images_dir": str(tmp_path / "images"),
+                "fetch_state": str(tmp_path / "fetch_state.db")
+            },
+            "incremental": {"enabled": True, "grace_hours": 24},
+            "sources": {"newsapi": {"page_size": 2, "max_pages": 5}},
+            "processing": {"parse_executor": "thread", "parse_workers": 1}
+        },
+        "trend_analysis": {"novelty": {"score_on_ingest": False}}
+    }
+
+
+def item(slug: str, hours_ago: float) -> dict:
+    """NewsAPI article published some hours before NOW"""
+    return {
+        "title": f"Story {slug}",
+        "description": f"Description of story {slug}",
+        "url": f"https://example.com/{slug}",
+        "publishedAt": (NOW - timedelta(hours=hours_ago)).isoformat().replace("+00:00", "Z"),
+        "source": {"name": "Example"}
+    }
+
+
+class FakeNewsAPI:
+    """Stand-in for RateLimitedClient serving fixed NewsAPI pages"""
+
+    def __init__(self, pages: list[list[dict]]):
+        self.pages = pages
+        self.requested: list[int] = []
+
+    async def get_json(self, source, url, params=None, headers=None) -> dict:
+        page = params["page"]
+        self.requested.append(page)
+        articles = self.pages[page - 1] if page <= len(self.pages) else []
+        return {"status": "ok", "articles": articles}
+
+
+async def fetch(scraper: NewsScraperAgent, pages: list[list[dict]], commit: bool = True) -> tuple[list[str], list[int]]:
+    """Fetch one NewsAPI stream, returning the fetched titles and requested pages"""
+    client = FakeNewsAPI(pages)
+    scraper._pending_marks = {}
+    articles = await scraper._fetch_newsapi_stream(client, "key", "technology", "us")
+    if commit:
+        scraper.commit_marks()
+    return [article["title"] for article in articles], client.requested
+
+
+@pytest.mark.asyncio
+async def test_items_of_a_previous_run_are_skipped(tmp_path):
+    scraper = NewsScraperAgent(make_config(tmp_path))
+
+    first, _ = await fetch(scraper, [[item("a", 1), item("b", 2)], [item("c", 3)]])
+    assert first == ["Story a", "Story b", "Story c"]
+
+    second, _ = await fetch(scraper, [[item("new", 0), item("a", 1)], [item("b", 2), item("c", 3)]])
+    assert second == ["Story new"]
+
+
+@pytest.mark.asyncio
+async def test_late_items_within_the_grace_window_are_fetched(tmp_path):
+    scraper = NewsScraperAgent(make_config(tmp_path))
+    await fetch(scraper, [[item("a", 1)]])
+
+    # Published before the mark, but unseen and within grace_hours of it
+    late, _ = await fetch(scraper, [[item("a", 1), item("late", 5)], [item("stale", 30)]])
+    assert late == ["Story late"]
+
+
+@pytest.mark.asyncio
+async def test_pagination_stops_only_at_a_page_entirely_behind_the_mark(tmp_path):
+    scraper = NewsScraperAgent(make_config(tmp_path))
+    await fetch(scraper, [[item("a", 1), item("b", 2)], [item("c", 3), item("d", 4)]])
+
+    titles, requested = await fetch(scraper, [
+        [item("new", 0), item("a", 1)],    # Mixed page: keep going
+        [item("b", 2), item("late", 2.5)],  # Ranked list put an unseen item here
+        [item("c", 3), item("d", 4)],      # Everything seen: stop
+        [item("e", 5), item("f", 6)],
+    ])
+
+    assert titles == ["Story new", "Story late"]
+    assert requested == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_marks_do_not_advance(tmp_path):
+    scraper = NewsScraperAgent(make_config(tmp_path))
+
+    await fetch(scraper, [[item("a", 1)]], commit=False)
+    assert scraper.fetch_state.get_mark(STREAM) == {"published_ts": None, "seen_ids": set()}
+
+    again, _ = await fetch(scraper, [[item("a", 1)]])
+    assert again == ["Story a"]
+
+
+async def run_pipeline(tmp_path, monkeypatch, saved: Optional[int] = None) -> IngestionPipeline:
+    """Run the pipeline over one NewsAPI page, storing only `saved` articles when given"""
+    page = FakeNewsAPI([[
+        {**item("a", 1), "title": "Central bank raises interest rates",
+         "description": "The central bank raised its benchmark rate by a quarter point."},
+        {**item("b", 2), "title": "Hurricane makes landfall on the gulf coast",
+         "description": "The storm came ashore late Thursday as a category four hurricane."}
+    ]])
+
+    @asynccontextmanager
+    async def fake_client(*args, **kwargs):
+        yield page
+
+    monkeypatch.setattr(news_scraper_agent, "RateLimitedClient", fake_client)
+    monkeypatch.setenv("NEWSAPI_KEY", "key")
+
+    config = make_config(tmp_path)
+    config["news"]["categories"] = ["technology"]
+    config["news"]["sources"]["newsapi"]["enabled"] = True
+    pipeline = IngestionPipeline(config)
+
+    if saved is not None:
+        async def partial_save(articles, processed=False):
+            return saved
+
+        monkeypatch.setattr(pipeline.storage, "save_articles", partial_save)
+
+    await pipeline.run(sources=["newsapi"])
+    return pipeline
+
+
+@pytest.mark.asyncio
+async def test_marks_do_not_advance_when_a_pipeline_save_fails(tmp_path, monkeypatch):
+    pipeline = await run_pipeline(tmp_path, monkeypatch, saved=0)
+
+    assert pipeline.stats["failed_saves"] == 2
+    assert pipeline.scraper.fetch_state.get_mark(STREAM)["seen_ids"] == set()
+
+
+@pytest.mark.asyncio
+async def test_marks_advance_once_the_pipeline_saved_everything(tmp_path, monkeypatch):
+    pipeline = await run_pipeline(tmp_path, monkeypatch)
+
+    assert pipeline.stats["failed_saves"] == 0
+    assert len(pipeline.scraper.fetch_state.get_mark(STREAM)["seen_ids"]) == 2
@@ -0,0 +1,107 @@
+"""
+Conditional RSS fetching against a local feed server
+"""
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+import pytest_asyncio
+
+from src.agents.news_aggregator import news_scraper_agent
+from src.agents.news_aggregator.news_scraper_agent import NewsScraperAgent
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Fixture Feed</title>
+    <link>http://example.com/</link>
+    <description>Fixture</description>
+    <item>
+      <title>First story</title>
+      <link>http://example.com/first</link>
+      <description>The first story.</description>
+      <pubDate>Tue, 10 Jun 2025 14:30:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Second story</title>
+      <link>http://example.com/second</link>
+      <description>The second story.</description>
+      <pubDate>Tue, 10 Jun 2025 15:30:00 GMT</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+ETAG = '"fixture-v1"'
+
+
+@pytest_asyncio.fixture
+async def feed_server():
+    """Serve FEED with an ETag, answering 304 when the client already has it"""
+    requests = []
+
+    async def handle(request: web.Request) -> web.Response:
+        requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304, headers={"ETag": ETAG})
+        return web.Response(body=FEED, content_type="application/rss+xml", headers={"ETag": ETAG})
+
+    app = web.Application()
+    app.router.add_get("/feed.xml", handle)
+
+    server = TestServer(app)
+    await server.start_server()
+    server.requests = requests
+    yield server
+    await server.close()
+
+
+def make_config(tmp_path, feed_url: str) -> dict:
+    return {
+        "news": {
+            "storage": {
+                "base_dir": str(tmp_path),
+                "fetch_state": str(tmp_path / "fetch_state.db")
+            },
+            "incremental": {"enabled": True},
+            "sources": {
+                "newsapi": {"enabled": False},
+                "guardian": {"enabled": False},
+                "rss": {"conditional_get": True, "parse_workers": 0},
+                "rss_feeds": [{"url": feed_url, "name": "Fixture Feed"}]
+            }
+        }
+    }
+
+
+async def fetch(scraper: NewsScraperAgent) -> list[dict]:
+    articles = []
+    async for batch in scraper.stream_sources(sources=["rss"]):
+        articles.extend(batch)
+    scraper.commit_marks()
+    return articles
+
+
+@pytest.mark.asyncio
+async def test_unchanged_feed_is_not_parsed_again(tmp_path, feed_server, monkeypatch):
+    parsed = []
+    original_parse_feed = news_scraper_agent.parse_feed
+
+    def counting_parse_feed(*args, **kwargs):
+        parsed.append(args[1]["url"])
+        return original_parse_feed(*args, **kwargs)
+
+    monkeypatch.setattr(news_scraper_agent, "parse_feed", counting_parse_feed)
+
+    scraper = NewsScraperAgent(make_config(tmp_path, str(feed_server.make_url("/feed.xml"))))
+
+    first = await fetch(scraper)
+    assert sorted(article["title"] for article in first) == ["First story", "Second story"]
+    assert len(parsed) == 1
+
+    second = await fetch(scraper)
+    assert second == []
+    assert len(parsed) == 1
+
+    assert "If-None-Match" not in feed_server.requests[0]
+    assert feed_server.requests[1]["If-None-Match"] == ETAG
@@ -0,0 +1,45 @@
+"""
+Novelty scoring of articles with RSS (RFC 822) publish dates
+"""
+
+import pytest
+
+from src.agents.trend_analyzer.novelty_evaluator_agent import NoveltyEvaluatorAgent
+
+EARLIER = {
+    "id": "earlier",
+    "category": "business",
+    "published_at": "2026-10-16T08:00:00+00:00",
+    "title": "Fed raises interest rates by a quarter point",
+    "description": "The Federal Reserve raised its benchmark interest rate by a quarter percentage point on Wednesday."
+}
+
+RSS_FOLLOW_UP = {
+    "id": "rss",
+    "category": "business",
+    "published_at": "Fri, 16 Oct 2026 10:00:00 +0000",
+    "title": "Fed raises interest rates by a quarter point",
+    "description": "The Federal Reserve raised its benchmark interest rate by a quarter point on Wednesday."
+}
+
+
+@pytest.mark.asyncio
+async def test_rfc822_dated_article_is_scored():
+    evaluator = NoveltyEvaluatorAgent({})
+
+    novelty = await evaluator.evaluate_novelty(RSS_FOLLOW_UP, [EARLIER])
+
+    assert novelty["reason"] != "No publish date"
+    assert novelty["similar_articles"] == ["earlier"]
+    assert novelty["classification"] == "recycled"
+
+
+@pytest.mark.asyncio
+async def test_rfc822_dated_article_joins_the_window():
+    evaluator = NoveltyEvaluatorAgent({})
+    later = {**EARLIER, "id": "later", "published_at": "2026-10-16T12:00:00+00:00"}
+
+    scored = await evaluator.batch_evaluate([later, RSS_FOLLOW_UP])
+
+    assert [article["id"] for article in scored] == ["rss", "later"]
+    assert scored[1]["novelty"]["similar_articles"] == ["rss"]